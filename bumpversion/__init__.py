@@ -1,13 +1,53 @@
-"""Bumpversion app."""
-from .bumper import RegexBumper, SemVerBumper
-from .parser import PEP440Parser, SemVerParser
-from .replacer import SearchReplaceReplacer
-from .serializer import FormatSerializer, PEP440Serializer, SemVerSerializer
+"""Bumpversion app.
+
+Components are imported lazily on the first access, so only dependencies of the components
+actually used are imported.
+"""
+from importlib import import_module
+from typing import TYPE_CHECKING, Any, List
+
+if TYPE_CHECKING:  # pragma: no cover
+    from .bumper import BaseBumper, RegexBumper, SemVerBumper
+    from .parser import PEP440Parser, SemVerParser
+    from .replacer import (
+        BytesSearchReplaceReplacer,
+        IndexedSearchReplaceReplacer,
+        MmapSearchReplaceReplacer,
+        MultiSearchReplaceReplacer,
+        SearchReplaceReplacer,
+        StreamingSearchReplaceReplacer,
+    )
+    from .serializer import FormatSerializer, PEP440Serializer, SemVerSerializer
+    from .vcs import NativeGit
 
 __version__ = "0.1.0a1"
 
+_COMPONENTS = {
+    "BaseBumper": "bumper",
+    "BytesSearchReplaceReplacer": "replacer",
+    "FormatSerializer": "serializer",
+    "IndexedSearchReplaceReplacer": "replacer",
+    "MmapSearchReplaceReplacer": "replacer",
+    "MultiSearchReplaceReplacer": "replacer",
+    "NativeGit": "vcs",
+    "PEP440Parser": "parser",
+    "PEP440Serializer": "serializer",
+    "RegexBumper": "bumper",
+    "SearchReplaceReplacer": "replacer",
+    "SemVerBumper": "bumper",
+    "SemVerParser": "parser",
+    "SemVerSerializer": "serializer",
+    "StreamingSearchReplaceReplacer": "replacer",
+}
+
 __all__ = [
+    "BaseBumper",
+    "BytesSearchReplaceReplacer",
     "FormatSerializer",
+    "IndexedSearchReplaceReplacer",
+    "MmapSearchReplaceReplacer",
+    "MultiSearchReplaceReplacer",
+    "NativeGit",
     "PEP440Parser",
     "PEP440Serializer",
     "RegexBumper",
@@ -15,4 +55,20 @@ __all__ = [
     "SemVerBumper",
     "SemVerParser",
     "SemVerSerializer",
+    "StreamingSearchReplaceReplacer",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    """Import component on the first access."""
+    try:
+        module = _COMPONENTS[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    value = getattr(import_module(f".{module}", __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    return sorted([*globals(), *_COMPONENTS])
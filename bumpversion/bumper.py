@@ -1,11 +1,48 @@
 """Bumpversion bumper."""
 import re
-from typing import Any, Dict, List, Optional, TypedDict
+from abc import ABC, abstractmethod
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    TypedDict,
+)
+
+if TYPE_CHECKING:  # pragma: no cover
+    import semver
+
+
+class BaseBumper(ABC):
+    """Base class for bumpers."""
+
+    @abstractmethod
+    def __call__(self, version: Dict[str, Any], bumped_parts: List[str]) -> Dict[str, Any]:
+        """Bump version specified in bumped_parts."""
+
+    def sequence(
+        self, version: Dict[str, Any], steps: Iterable[Sequence[str]]
+    ) -> Iterator[Dict[str, Any]]:
+        """Generate successive versions bumped by parts in each of the steps.
+
+        Versions are generated lazily, so `steps` may be an infinite iterator.
+        Serialize the versions using a serializer, e.g. the next versions of a release cycle:
 
-import semver
+        .. code-block:: python
 
+           steps = itertools.cycle([["micro", "rc"], ["rc"], ["rc"], ["minor"]])
+           versions = map(serializer, itertools.islice(bumper.sequence(version, steps), 100))
+        """
+        for bumped_parts in steps:
+            version = self(version, list(bumped_parts))
+            yield version
 
-class SemVerBumper:
+
+class SemVerBumper(BaseBumper):
     """Bump version according to SemVer."""
 
     def __init__(
@@ -14,17 +51,34 @@ class SemVerBumper:
         self.build_token = build_token
         self.prerelease_token = prerelease_token
 
-    def __call__(self, version: Dict[str, Any], bumped_parts: List[str]) -> Dict[str, Any]:
-        """Bump version specified by options."""
-        parsed_version = semver.Version(**version)
+    def _bump(self, version: "semver.Version", bumped_parts: Iterable[str]) -> "semver.Version":
         for part in bumped_parts:
             if part in ("prerelease", "build"):
-                parsed_version = getattr(parsed_version, "bump_" + part)(
-                    token=getattr(self, part + "_token")
-                )
+                version = getattr(version, "bump_" + part)(token=getattr(self, part + "_token"))
             else:
-                parsed_version = parsed_version.next_version(part)
-        return parsed_version.to_dict()
+                version = version.next_version(part)
+        return version
+
+    def __call__(self, version: Dict[str, Any], bumped_parts: List[str]) -> Dict[str, Any]:
+        """Bump version specified by options."""
+        import semver
+
+        return self._bump(semver.Version(**version), bumped_parts).to_dict()
+
+    def sequence(
+        self, version: Dict[str, Any], steps: Iterable[Sequence[str]]
+    ) -> Iterator[Dict[str, Any]]:
+        """Generate successive versions bumped by parts in each of the steps.
+
+        Works the same as :meth:`BaseBumper.sequence`.
+        """
+        import semver
+
+        # Keep the parsed version between steps to avoid conversions from a dictionary.
+        parsed_version = semver.Version(**version)
+        for bumped_parts in steps:
+            parsed_version = self._bump(parsed_version, bumped_parts)
+            yield parsed_version.to_dict()
 
 
 class PartsDefinition(TypedDict, total=False):
@@ -42,7 +96,7 @@ class PartsDefinition(TypedDict, total=False):
     """
 
 
-class RegexBumper:
+class RegexBumper(BaseBumper):
     """Bump version string defined by a regex group.
 
     Can be configured using `parts` which is a dictionary with `part` definition as keys
@@ -78,38 +132,67 @@ class RegexBumper:
         1.0 -> 1.0.1rc1 -> 1.0.1rc2 -> 1.1
     """
 
+    _number_regex = re.compile(r"(?P<string>[-._]?\D+)(?P<num>\d+)")
+
     def __init__(self, *, parts: Optional[Dict[str, PartsDefinition]] = None):
         self.parts = parts or {}
+        # Bump plan - part definitions resolved ahead of time.
+        self._starts = {part: str(d.get("start", 1)) for part, d in self.parts.items()}
+        self._non_final = frozenset(p for p, d in self.parts.items() if not d.get("final", True))
 
-    @staticmethod
-    def _increase_number(version: str) -> str:
-        regex = re.compile(r"(?P<string>[-._]?\D+)(?P<num>\d+)")
+    @classmethod
+    def _increase_number(cls, version: str) -> str:
         if version.isnumeric():
             return str(int(version) + 1)
         else:
             # alphanumeric part, find just the ending number and increase that
-            match = re.fullmatch(regex, version)
+            match = cls._number_regex.fullmatch(version)
             if match is not None:
                 return match["string"] + str(int(match["num"]) + 1)
         raise ValueError(f"Version part {version} cannot be increased.")
 
+    def _bump_part(self, version: Dict[str, str], part: str) -> Dict[str, str]:
+        """Return new version with bumped part in a single pass over the version parts."""
+        new_version = {}
+        bumped = False
+        for key, value in version.items():
+            if bumped:
+                # Set the rest of the parts to nulls, missing, non-numeric or not final parts
+                # are omitted
+                if value and value.isnumeric() and key not in self._non_final:
+                    new_version[key] = "0"
+            elif key == part:
+                # Optional part missing in the version, e.g. unmatched group, starts anew
+                if not value:
+                    new_version[key] = self._starts.get(part, "1")
+                else:
+                    new_version[key] = self._increase_number(value)
+                bumped = True
+            else:
+                new_version[key] = value
+        if not bumped:
+            new_version[part] = self._starts.get(part, "1")
+        return new_version
+
     def __call__(self, version: Dict[str, str], bumped_parts: List[str]) -> Dict[str, str]:
         """Bump version specified in bumped_parts."""
         new_version = version.copy()
         for part in bumped_parts:
-            parsed_version = new_version.get(part)
-            if parsed_version is None:
-                new_version[part] = str(self.parts.get(part, {}).get("start", 1))
-            else:
-                new_version[part] = self._increase_number(parsed_version)
-            # Set the rest of the parts to nulls
-            bumped_index = list(new_version).index(part)
-            keys_to_null = list(new_version)[bumped_index + 1 :]
-            for key in keys_to_null:
-                if new_version[key].isnumeric() and self.parts.get(key, {}).get("final", True):
-                    new_version[key] = "0"
-                else:
-                    # Either numeric or not final, delete it
-                    del new_version[key]
-
+            new_version = self._bump_part(new_version, part)
         return new_version
+
+    def sequence(
+        self, version: Dict[str, Any], steps: Iterable[Sequence[str]]
+    ) -> Iterator[Dict[str, Any]]:
+        """Generate successive versions bumped by parts in each of the steps.
+
+        Works the same as :meth:`BaseBumper.sequence`.
+        """
+        for bumped_parts in steps:
+            if bumped_parts:
+                # Bump of a part builds a new version, so the previous one doesn't need a copy.
+                for part in bumped_parts:
+                    version = self._bump_part(version, part)
+            else:
+                version = version.copy()
+            yield version
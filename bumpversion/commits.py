@@ -0,0 +1,53 @@
+"""Analysis of conventional commits.
+
+See https://www.conventionalcommits.org/ for the specification.
+"""
+import re
+from typing import Iterable, Optional
+
+from .constants import ChangeType
+
+_SUBJECT_REGEX = re.compile(r"(?P<type>[\w-]+)(?:\([^()]*\))?(?P<breaking>!)?: ")
+_BREAKING_REGEX = re.compile(r"^BREAKING[ -]CHANGE: ", re.MULTILINE)
+_TYPES = {"feat": ChangeType.feature, "fix": ChangeType.fix}
+# Types of changes from the lowest to the highest impact.
+_ORDER = (ChangeType.fix, ChangeType.feature, ChangeType.breaking)
+
+
+def classify_commit(message: str) -> Optional[ChangeType]:
+    """Return type of change introduced by the commit or None if it doesn't require a bump.
+
+    Arguments:
+        message: Commit message. The subject is classified by its type, breaking changes are
+            marked by `!` in the subject or by a `BREAKING CHANGE` footer.
+    """
+    subject, _, body = message.partition("\n")
+    match = _SUBJECT_REGEX.match(subject)
+    if match is None:
+        return None
+    if match["breaking"] or _BREAKING_REGEX.search(body):
+        return ChangeType.breaking
+    return _TYPES.get(match["type"].lower())
+
+
+def get_change_type(messages: Iterable[str]) -> Optional[ChangeType]:
+    """Return type of change with the highest impact among the commits.
+
+    Messages are classified one by one and the iteration stops as soon as a breaking change is
+    found. Generators of messages are closed once the result is known.
+    """
+    change_type: Optional[ChangeType] = None
+    try:
+        for message in messages:
+            commit_type = classify_commit(message)
+            if commit_type is None:
+                continue
+            if change_type is None or _ORDER.index(commit_type) > _ORDER.index(change_type):
+                change_type = commit_type
+            if change_type == ChangeType.breaking:
+                break
+    finally:
+        close = getattr(messages, "close", None)
+        if close is not None:
+            close()
+    return change_type
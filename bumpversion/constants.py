@@ -1,5 +1,5 @@
 """Constants."""
-from enum import IntEnum, unique
+from enum import Enum, IntEnum, unique
 
 
 @unique
@@ -10,3 +10,28 @@ class Verbosity(IntEnum):
     INFO = 1
     DETAIL = 2
     DEBUG = 3
+
+
+@unique
+class DirtyScope(str, Enum):
+    """Scope of the check whether the VCS directory is clean."""
+
+    files = "files"
+    repo = "repo"
+
+
+@unique
+class VersionSource(str, Enum):
+    """Source of the current version."""
+
+    config = "config"
+    tags = "tags"
+
+
+@unique
+class ChangeType(str, Enum):
+    """Type of change introduced by a conventional commit."""
+
+    fix = "fix"
+    feature = "feature"
+    breaking = "breaking"
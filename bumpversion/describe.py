@@ -0,0 +1,136 @@
+"""Distances of commits from the latest release tags."""
+import hashlib
+import json
+from pathlib import Path
+from typing import Callable, Dict, Iterator, List, Mapping, Optional, Sequence, Tuple, cast
+
+from . import __version__
+from .utils import get_cache_dir, write_cache
+
+Distance = Optional[Tuple[str, int]]
+"""Version of the latest release tag and the number of commits since the tag.
+
+None if there is no release tag in the history of the commit.
+"""
+
+
+def _walk(
+    commits: Sequence[str],
+    tagged: Mapping[str, str],
+    distances: Dict[str, Distance],
+    walk: Callable[[List[str]], Iterator[Tuple[str, Optional[str]]]],
+) -> Dict[str, Optional[str]]:
+    """Return first parents of commits walked until all the commits reach a resolved commit."""
+
+    def is_resolved(commit: Optional[str]) -> bool:
+        return commit is None or commit in distances or commit in tagged
+
+    first_parents: Dict[str, Optional[str]] = {}
+    pending = {commit for commit in commits if not is_resolved(commit)}
+    if not pending:
+        return first_parents
+    walker = walk(sorted(pending))
+    try:
+        for commit, parent in walker:
+            first_parents[commit] = parent
+            if commit in pending:
+                pending.discard(commit)
+                # Skip the commits already walked, the walk doesn't follow commits in order.
+                while not is_resolved(parent) and parent in first_parents:
+                    parent = first_parents[parent]
+                if not is_resolved(parent):
+                    pending.add(cast(str, parent))
+            if not pending:
+                break
+    finally:
+        close = getattr(walker, "close", None)
+        if close is not None:
+            close()
+    return first_parents
+
+
+def get_distances(
+    commits: Sequence[str],
+    tagged: Mapping[str, str],
+    distances: Dict[str, Distance],
+    walk: Callable[[List[str]], Iterator[Tuple[str, Optional[str]]]],
+) -> Dict[str, Distance]:
+    """Return distances of commits from the latest release tags on their first-parent lines.
+
+    Distances known from previous calls are reused, so only the new commits are walked
+    and the total work is linear in the number of commits.
+
+    Arguments:
+        commits: Commits to compute distances for.
+        tagged: Mapping of tagged commits to the version of their release tag.
+        distances: Known distances of commits, updated by the newly computed distances.
+        walk: Function which generates pairs of commit and its first parent reachable
+            from the commits by first parents. The generator is closed once all the commits
+            are resolved.
+    """
+    first_parents = _walk(commits, tagged, distances, walk)
+    for commit in commits:
+        path = []
+        current: Optional[str] = commit
+        while current is not None and current not in distances and current not in tagged:
+            path.append(current)
+            current = first_parents.get(current)
+        if current is None:
+            base: Distance = None
+        elif current in distances:
+            base = distances[current]
+        else:
+            base = distances[current] = (tagged[current], 0)
+        for offset, walked in enumerate(reversed(path), 1):
+            distances[walked] = None if base is None else (base[0], base[1] + offset)
+    return {commit: distances[commit] for commit in commits}
+
+
+def _get_cache_path() -> Optional[Path]:
+    cache_dir = get_cache_dir()
+    if cache_dir is None:
+        return None
+    # Single entry, which is replaced once the key changes.
+    return cache_dir / "describe" / "distances.json"
+
+
+def get_cache_key(tagged: Mapping[str, str]) -> str:
+    """Return key of distances in a persistent cache.
+
+    Distances are determined by the history and the release tags, so the cache is reused
+    until a release tag is added or moved.
+
+    Arguments:
+        tagged: Mapping of tagged commits to the version of their release tag.
+    """
+    tagged_hash = hashlib.sha256(json.dumps(sorted(tagged.items())).encode()).hexdigest()
+    return json.dumps({"version": __version__, "tagged": tagged_hash}, sort_keys=True)
+
+
+def load_distances(key: str) -> Dict[str, Distance]:
+    """Return distances stored in a persistent cache or an empty dictionary.
+
+    Cache is stored in the directory returned by :func:`bumpversion.utils.get_cache_dir`.
+    """
+    path = _get_cache_path()
+    if path is None:
+        return {}
+    try:
+        with open(path) as fh:
+            entry = json.load(fh)
+    except (OSError, ValueError):
+        return {}
+    if entry["key"] != key:
+        return {}
+    return {
+        commit: None if distance is None else (distance[0], distance[1])
+        for commit, distance in entry["distances"].items()
+    }
+
+
+def store_distances(key: str, distances: Dict[str, Distance]) -> None:
+    """Store distances in a persistent cache."""
+    path = _get_cache_path()
+    if path is None:
+        return
+    write_cache(path, json.dumps({"key": key, "distances": distances}))
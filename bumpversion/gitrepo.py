@@ -0,0 +1,961 @@
+"""Direct access to git repository data without running git.
+
+Supports only the commonly used repository features. Anything else is reported by
+:class:`UnsupportedRepositoryError`, so callers can fall back to the git command.
+"""
+import hashlib
+import mmap
+import os
+import re
+import stat
+import struct
+import time
+import zlib
+from bisect import bisect_left
+from contextlib import ExitStack, contextmanager
+from itertools import groupby
+from pathlib import Path, PurePosixPath
+from tempfile import NamedTemporaryFile
+from typing import IO, Dict, Iterable, Iterator, List, NamedTuple, Optional, Sequence, Tuple
+
+from .utils import get_git_dir
+
+_INDEX_ENTRY = struct.Struct(">10I20sH")
+_CONFIG_SECTION = re.compile(
+    r'\[\s*(?P<name>[-.\w]+)(?:\s+"(?P<subsection>(?:[^"\\]|\\.)*)")?\s*\]'
+)
+_INVALID_REF = re.compile(r"(^|/)\.|\.\.|[\x00-\x20\x7f~^:?*\[\\]|@\{|\.lock(/|$)|//|^/|[/.]$|^@$")
+# Environment variables which change location or content of the repository.
+_UNSUPPORTED_ENVIRON = (
+    "GIT_ALTERNATE_OBJECT_DIRECTORIES",
+    "GIT_COMMON_DIR",
+    "GIT_CONFIG_COUNT",
+    "GIT_CONFIG_PARAMETERS",
+    "GIT_DIR",
+    "GIT_INDEX_FILE",
+    "GIT_OBJECT_DIRECTORY",
+    "GIT_WORK_TREE",
+)
+_OBJECT_TYPES = {1: "commit", 2: "tree", 3: "blob", 4: "tag"}
+_OFS_DELTA = 6
+_REF_DELTA = 7
+
+
+class UnsupportedRepositoryError(Exception):
+    """Repository uses a feature which is not supported."""
+
+
+class IndexEntry(NamedTuple):
+    """Entry of a git index."""
+
+    ctime: Tuple[int, int]
+    mtime: Tuple[int, int]
+    dev: int
+    ino: int
+    mode: int
+    uid: int
+    gid: int
+    size: int
+    sha: str
+    flags: int
+    extended_flags: int
+    path: str
+
+    @property
+    def stage(self) -> int:
+        """Return merge stage of the entry."""
+        return (self.flags >> 12) & 0x3
+
+
+class Index(NamedTuple):
+    """Content of a git index."""
+
+    entries: Dict[str, IndexEntry]
+    tree: Optional[str]
+    """Object name of the root tree from the cache tree extension, if valid."""
+    mtime_ns: int
+    """Modification time of the index file."""
+    version: int = 2
+
+
+def _encode_varint(value: int) -> bytes:
+    """Return offset encoded variable length integer."""
+    result = [value & 0x7F]
+    value >>= 7
+    while value:
+        value -= 1
+        result.append(0x80 | (value & 0x7F))
+        value >>= 7
+    return bytes(reversed(result))
+
+
+def _read_varint(data: bytes, pos: int) -> Tuple[int, int]:
+    """Read offset encoded variable length integer and return it with new position."""
+    byte = data[pos]
+    pos += 1
+    value = byte & 0x7F
+    while byte & 0x80:
+        byte = data[pos]
+        pos += 1
+        value = ((value + 1) << 7) | (byte & 0x7F)
+    return value, pos
+
+
+def _parse_config_value(value: str, lines: Iterator[str]) -> str:
+    """Return unquoted and unescaped config value, read continuation lines if necessary."""
+    result = []
+    quoted = False
+    space = ""
+    pos = 0
+    value = value.lstrip()
+    while pos < len(value):
+        char = value[pos]
+        pos += 1
+        if char == "\\":
+            if pos == len(value):
+                # Value continues on the next line
+                value = next(lines, "")
+                pos = 0
+                continue
+            char = {"n": "\n", "t": "\t", "b": "\b"}.get(value[pos], value[pos])
+            pos += 1
+        elif char == '"':
+            quoted = not quoted
+            continue
+        elif not quoted and char in "#;":
+            break
+        elif not quoted and char.isspace():
+            # Whitespace is kept only inside of the value
+            space += char
+            continue
+        result.append(space + char)
+        space = ""
+    return "".join(result)
+
+
+def _parse_config(text: str) -> List[Tuple[str, str]]:
+    """Parse git config file and return list of keys and values.
+
+    Keys have form `section.subsection.name`, section and name are lowercased.
+    Keys without a value have value `true`.
+    """
+    items = []
+    section = ""
+    lines = iter(text.splitlines())
+    for line in lines:
+        line = line.strip()
+        if line.startswith("["):
+            match = _CONFIG_SECTION.match(line)
+            if match is None:
+                raise UnsupportedRepositoryError(f"Invalid config section {line}")
+            section = match["name"].lower()
+            if match["subsection"] is not None:
+                section += "." + re.sub(r"\\(.)", r"\1", match["subsection"])
+            line = line[match.end() :].strip()
+        if not line or line[0] in "#;":
+            continue
+        name, equals, value = line.partition("=")
+        key = f"{section}.{name.strip().lower()}"
+        items.append((key, _parse_config_value(value, lines) if equals else "true"))
+    return items
+
+
+def _cleanup_message(message: str) -> str:
+    """Clean up whitespace of a message the same way git does."""
+    lines: List[str] = []
+    for line in message.splitlines():
+        line = line.rstrip()
+        # Skip leading and duplicate empty lines
+        if line or (lines and lines[-1]):
+            lines.append(line)
+    while lines and not lines[-1]:
+        lines.pop()
+    return "".join(line + "\n" for line in lines)
+
+
+@contextmanager
+def _lock_file(path: Path) -> Iterator[IO[bytes]]:
+    """Lock the file and return file object for its new content.
+
+    The content replaces the file once the context is exited without an exception.
+    """
+    lock_path = path.with_name(path.name + ".lock")
+    try:
+        fh = open(lock_path, "xb")
+    except OSError as error:
+        raise UnsupportedRepositoryError(f"Unable to lock {path}: {error}") from error
+    try:
+        with fh:
+            yield fh
+    except BaseException:
+        os.remove(lock_path)
+        raise
+    os.replace(lock_path, path)
+
+
+def _read_size(data: bytes, pos: int) -> Tuple[int, int]:
+    """Read little endian variable length integer and return it with new position."""
+    value = shift = 0
+    while True:
+        byte = data[pos]
+        pos += 1
+        value |= (byte & 0x7F) << shift
+        shift += 7
+        if not byte & 0x80:
+            return value, pos
+
+
+def _apply_delta(base: bytes, delta: bytes) -> bytes:
+    """Return object reconstructed from a base object and a delta."""
+    base_size, pos = _read_size(delta, 0)
+    result_size, pos = _read_size(delta, pos)
+    if base_size != len(base):
+        raise UnsupportedRepositoryError("Delta base size mismatch")
+    result = bytearray()
+    while pos < len(delta):
+        opcode = delta[pos]
+        pos += 1
+        if opcode & 0x80:
+            # Copy from base
+            offset = size = 0
+            for i in range(4):
+                if opcode & (1 << i):
+                    offset |= delta[pos] << (8 * i)
+                    pos += 1
+            for i in range(3):
+                if opcode & (1 << (4 + i)):
+                    size |= delta[pos] << (8 * i)
+                    pos += 1
+            result += base[offset : offset + (size or 0x10000)]
+        elif opcode:
+            # Insert new data
+            result += delta[pos : pos + opcode]
+            pos += opcode
+        else:
+            raise UnsupportedRepositoryError("Invalid delta opcode")
+    if len(result) != result_size:
+        raise UnsupportedRepositoryError("Delta result size mismatch")
+    return bytes(result)
+
+
+class _Pack:
+    """Git pack file with a version 2 index."""
+
+    def __init__(self, idx_path: Path) -> None:
+        self.idx_path = idx_path
+        self.pack_path = idx_path.with_suffix(".pack")
+
+    def find(self, sha: str) -> Optional[int]:
+        """Return offset of object in pack or None if not found."""
+        binary_sha = bytes.fromhex(sha)
+        with open(self.idx_path, "rb") as fh, mmap.mmap(
+            fh.fileno(), 0, access=mmap.ACCESS_READ
+        ) as idx:
+            if idx[:8] != b"\377tOc\0\0\0\2":
+                raise UnsupportedRepositoryError(f"Unsupported pack index {self.idx_path}")
+            fanout = struct.unpack_from(">256I", idx, 8)
+            count = fanout[255]
+            low = fanout[binary_sha[0] - 1] if binary_sha[0] else 0
+            high = fanout[binary_sha[0]]
+            shas_start = 8 + 256 * 4
+
+            class _Shas:
+                def __getitem__(self, i: int) -> bytes:
+                    return idx[shas_start + i * 20 : shas_start + (i + 1) * 20]
+
+            position = bisect_left(_Shas(), binary_sha, low, high)
+            if position == high or _Shas()[position] != binary_sha:
+                return None
+            offsets_start = shas_start + count * 24
+            (offset,) = struct.unpack_from(">I", idx, offsets_start + position * 4)
+            if offset & 0x80000000:
+                large_offsets_start = offsets_start + count * 4
+                (offset,) = struct.unpack_from(
+                    ">Q", idx, large_offsets_start + (offset & 0x7FFFFFFF) * 8
+                )
+            return int(offset)
+
+    def read(self, offset: int, repository: "Repository") -> Tuple[str, bytes]:
+        """Return type and content of object at offset."""
+        with open(self.pack_path, "rb") as fh, mmap.mmap(
+            fh.fileno(), 0, access=mmap.ACCESS_READ
+        ) as pack:
+            return self._read(pack, offset, repository)
+
+    def _read(self, pack: mmap.mmap, offset: int, repository: "Repository") -> Tuple[str, bytes]:
+        byte = pack[offset]
+        pos = offset + 1
+        type_number = (byte >> 4) & 0x7
+        while byte & 0x80:
+            byte = pack[pos]
+            pos += 1
+
+        base: Optional[Tuple[str, bytes]] = None
+        if type_number == _OFS_DELTA:
+            distance, pos = _read_varint(pack, pos)  # type: ignore[arg-type]
+            base = self._read(pack, offset - distance, repository)
+        elif type_number == _REF_DELTA:
+            base = repository.read_object(pack[pos : pos + 20].hex())
+            pos += 20
+        elif type_number not in _OBJECT_TYPES:
+            raise UnsupportedRepositoryError(f"Unknown object type {type_number}")
+
+        decompressor = zlib.decompressobj()
+        content = b""
+        while not decompressor.eof:
+            chunk = pack[pos : pos + 65536]
+            if not chunk:
+                raise UnsupportedRepositoryError(f"Truncated pack {self.pack_path}")
+            content += decompressor.decompress(chunk)
+            pos += len(chunk)
+
+        if base is not None:
+            return base[0], _apply_delta(base[1], content)
+        return _OBJECT_TYPES[type_number], content
+
+
+class Repository:
+    """Git repository accessed directly through its files.
+
+    Arguments:
+        work_tree: Root of the working tree.
+        git_dir: Git directory of the working tree.
+    """
+
+    def __init__(self, work_tree: Path, git_dir: Path) -> None:
+        self.work_tree = work_tree
+        self.git_dir = git_dir
+        commondir = git_dir / "commondir"
+        if commondir.is_file():
+            self.common_dir = (git_dir / commondir.read_text().strip()).resolve()
+        else:
+            self.common_dir = git_dir
+        self._config: Optional[List[Tuple[str, str]]] = None
+
+    @classmethod
+    def discover(cls, path: Optional[Path] = None) -> Optional["Repository"]:
+        """Return repository containing `path` or working directory or None if not found."""
+        path = Path(path or os.getcwd()).absolute()
+        for directory in (path, *path.parents):
+            if (directory / ".git").exists():
+                git_dir = get_git_dir(directory)
+                if git_dir is None:
+                    return None
+                return cls(directory, git_dir)
+        return None
+
+    def _get_config_files(self) -> List[Path]:
+        """Return system, global and local config files."""
+        files = []
+        if not os.environ.get("GIT_CONFIG_NOSYSTEM"):
+            files.append(Path(os.environ.get("GIT_CONFIG_SYSTEM") or "/etc/gitconfig"))
+        if os.environ.get("GIT_CONFIG_GLOBAL"):
+            files.append(Path(os.environ["GIT_CONFIG_GLOBAL"]))
+        else:
+            home = Path.home()
+            files.append(
+                Path(os.environ.get("XDG_CONFIG_HOME") or home / ".config", "git", "config")
+            )
+            files.append(home / ".gitconfig")
+        files.append(self.common_dir / "config")
+        return files
+
+    def _read_config(self) -> List[Tuple[str, str]]:
+        if self._config is None:
+            config = []
+            for path in self._get_config_files():
+                try:
+                    config.extend(_parse_config(path.read_text()))
+                except FileNotFoundError:
+                    pass
+                except (OSError, UnicodeDecodeError) as error:
+                    raise UnsupportedRepositoryError(str(error)) from error
+            self._config = config
+        return self._config
+
+    def get_config(self, key: str) -> Optional[str]:
+        """Return the last value of the config key or None if not defined.
+
+        Raises:
+            UnsupportedRepositoryError: If config can't be read or uses includes.
+        """
+        value = None
+        for item_key, item_value in self._read_config():
+            if item_key.startswith(("include.", "includeif.")):
+                raise UnsupportedRepositoryError("Config includes are not supported")
+            if item_key == key:
+                value = item_value
+        return value
+
+    def get_config_bool(self, key: str) -> bool:
+        """Return whether the config key is set to a true value."""
+        value = self.get_config(key)
+        return value is not None and value.lower() in ("true", "yes", "on", "1")
+
+    def check_supported(self) -> None:
+        """Check the repository uses only supported features.
+
+        Raises:
+            UnsupportedRepositoryError: If unsupported feature is used.
+        """
+        for variable in _UNSUPPORTED_ENVIRON:
+            if variable in os.environ:
+                raise UnsupportedRepositoryError(f"Unsupported environment variable {variable}")
+        for key in ("core.sparsecheckout", "core.splitindex", "index.sparse"):
+            if self.get_config_bool(key):
+                raise UnsupportedRepositoryError(f"Unsupported repository feature {key}")
+        for key, _ in self._read_config():
+            if key.startswith("extensions."):
+                raise UnsupportedRepositoryError(f"Unsupported repository feature {key}")
+
+    def read_index(self) -> Index:
+        """Read the git index.
+
+        Raises:
+            UnsupportedRepositoryError: If index uses unsupported features.
+        """
+        index_path = self.git_dir / "index"
+        try:
+            with open(index_path, "rb") as fh:
+                index_mtime_ns = os.fstat(fh.fileno()).st_mtime_ns
+                data = fh.read()
+        except OSError as error:
+            raise UnsupportedRepositoryError(str(error)) from error
+
+        if hashlib.sha1(data[:-20]).digest() != data[-20:]:  # nosec
+            raise UnsupportedRepositoryError("Invalid index checksum")
+        signature, version, count = struct.unpack_from(">4sII", data)
+        if signature != b"DIRC" or version not in (2, 3, 4):
+            raise UnsupportedRepositoryError(f"Unsupported index version {version}")
+
+        entries: Dict[str, IndexEntry] = {}
+        pos = 12
+        path = b""
+        for _ in range(count):
+            start = pos
+            (
+                ctime,
+                ctime_ns,
+                mtime,
+                mtime_ns,
+                dev,
+                ino,
+                mode,
+                uid,
+                gid,
+                size,
+                sha,
+                flags,
+            ) = _INDEX_ENTRY.unpack_from(data, pos)
+            pos += _INDEX_ENTRY.size
+            extended_flags = 0
+            if flags & 0x4000:
+                (extended_flags,) = struct.unpack_from(">H", data, pos)
+                pos += 2
+            end = data.index(b"\0", pos)
+            if version == 4:
+                strip, pos = _read_varint(data, pos)
+                end = data.index(b"\0", pos)
+                path = path[: len(path) - strip] + data[pos:end]
+                pos = end + 1
+            else:
+                path = data[pos:end]
+                # Entries are padded by 1-8 NUL bytes to multiple of 8 bytes.
+                pos = start + ((end - start) // 8 + 1) * 8
+            entry = IndexEntry(
+                (ctime, ctime_ns),
+                (mtime, mtime_ns),
+                dev,
+                ino,
+                mode,
+                uid,
+                gid,
+                size,
+                sha.hex(),
+                flags,
+                extended_flags,
+                os.fsdecode(path),
+            )
+            entries[entry.path] = entry
+
+        tree = None
+        while pos < len(data) - 20:
+            signature, size = struct.unpack_from(">4sI", data, pos)
+            pos += 8
+            if signature == b"TREE":
+                tree = self._read_cache_tree_root(data[pos : pos + size])
+            elif not b"A" <= signature[:1] <= b"Z":
+                raise UnsupportedRepositoryError(f"Unsupported index extension {signature!r}")
+            pos += size
+        return Index(entries, tree, index_mtime_ns, version)
+
+    @staticmethod
+    def _read_cache_tree_root(data: bytes) -> Optional[str]:
+        """Return object name of root tree from cache tree extension or None if invalid."""
+        path, _, rest = data.partition(b"\0")
+        header, _, rest = rest.partition(b"\n")
+        entry_count = int(header.split(b" ")[0])
+        if path or entry_count < 0:
+            return None
+        return rest[:20].hex()
+
+    def resolve_ref(self, ref: str = "HEAD") -> Optional[str]:
+        """Return object name the reference points to or None if it doesn't exist."""
+        for _ in range(10):
+            base_dir = self.git_dir if ref == "HEAD" else self.common_dir
+            try:
+                value = (base_dir / ref).read_text().strip()
+            except FileNotFoundError:
+                return self._read_packed_refs().get(ref)
+            except OSError as error:
+                raise UnsupportedRepositoryError(str(error)) from error
+            if not value.startswith("ref:"):
+                return value
+            ref = value[len("ref:") :].strip()
+        raise UnsupportedRepositoryError(f"Reference {ref} is too deep")
+
+    def _read_packed_refs(self) -> Dict[str, str]:
+        refs = {}
+        try:
+            with open(self.common_dir / "packed-refs") as fh:
+                for line in fh:
+                    if line[:1] not in ("#", "^"):
+                        sha, _, name = line.rstrip("\n").partition(" ")
+                        refs[name] = sha
+        except FileNotFoundError:
+            pass
+        return refs
+
+    def get_refs_state(self, prefix: str = "refs/tags") -> List[Tuple[str, int, int]]:
+        """Return paths, sizes and modification times of files storing refs with the prefix.
+
+        State consists of the `packed-refs` file and all directories with loose refs.
+        Any ref update changes the state, because refs are written by renaming a lock file.
+
+        Raises:
+            UnsupportedRepositoryError: If the state could change without changing modification
+                times, i.e. some of the files were modified in the last second.
+        """
+        self.check_supported()
+        state = []
+        paths = [self.common_dir / "packed-refs"]
+        for directory, dirnames, _ in os.walk(self.common_dir / prefix):
+            dirnames.sort()
+            paths.append(Path(directory))
+        for path in paths:
+            try:
+                stat = path.stat()
+            except FileNotFoundError:
+                continue
+            state.append(
+                (os.fspath(path.relative_to(self.common_dir)), stat.st_size, stat.st_mtime_ns)
+            )
+        if any(mtime_ns >= time.time_ns() - 1_000_000_000 for _, _, mtime_ns in state):
+            raise UnsupportedRepositoryError("Refs were modified too recently.")
+        return state
+
+    def _get_packs(self) -> List[_Pack]:
+        return [_Pack(p) for p in sorted((self.common_dir / "objects" / "pack").glob("*.idx"))]
+
+    def read_object(self, sha: str) -> Tuple[str, bytes]:
+        """Return type and content of an object.
+
+        Raises:
+            UnsupportedRepositoryError: If object is not found.
+        """
+        loose = self.common_dir / "objects" / sha[:2] / sha[2:]
+        if loose.is_file():
+            header, _, content = zlib.decompress(loose.read_bytes()).partition(b"\0")
+            return header.split(b" ")[0].decode(), content
+        for pack in self._get_packs():
+            offset = pack.find(sha)
+            if offset is not None:
+                return pack.read(offset, self)
+        raise UnsupportedRepositoryError(f"Object {sha} not found")
+
+    def get_head_tree(self) -> Optional[str]:
+        """Return object name of the tree of HEAD commit or None if there is no commit."""
+        head = self.resolve_ref("HEAD")
+        if head is None:
+            return None
+        object_type, content = self.read_object(head)
+        if object_type != "commit" or not content.startswith(b"tree "):
+            raise UnsupportedRepositoryError(f"Invalid HEAD commit {head}")
+        return content[5:45].decode()
+
+    @staticmethod
+    def hash_object(object_type: str, content: bytes) -> str:
+        """Return object name of the content."""
+        header = f"{object_type} {len(content)}\0".encode()
+        return hashlib.sha1(header + content).hexdigest()  # nosec
+
+    def write_object(self, object_type: str, content: bytes) -> str:
+        """Write loose object to the object store and return its name."""
+        sha = self.hash_object(object_type, content)
+        path = self.common_dir / "objects" / sha[:2] / sha[2:]
+        if not path.exists():
+            path.parent.mkdir(exist_ok=True)
+            with NamedTemporaryFile(dir=path.parent, prefix="tmp_obj_", delete=False) as fh:
+                fh.write(zlib.compress(f"{object_type} {len(content)}\0".encode() + content))
+            os.chmod(fh.name, 0o444)
+            os.replace(fh.name, path)
+        return sha
+
+    def get_dirty_files(self, paths: Iterable[Path]) -> Iterator[str]:
+        """Generate list of modified files among the paths, ignoring untracked files.
+
+        A file is considered clean if its size, modification time and inode match the index
+        or its content matches the object in the index. Files are checked only if nothing is
+        staged in the index.
+
+        Raises:
+            UnsupportedRepositoryError: If the state can't be decided, e.g. some of the files
+                differ in content from the index (which may be caused by git filters).
+        """
+        self.check_supported()
+        index = self.read_index()
+        if index.tree is None or index.tree != self.get_head_tree():
+            raise UnsupportedRepositoryError("Index may contain staged changes")
+
+        for path in paths:
+            relative = os.path.relpath(os.path.abspath(path), self.work_tree)
+            name = Path(relative).as_posix()
+            entry = index.entries.get(name)
+            if entry is None:
+                # Untracked file
+                continue
+            if entry.stage or entry.extended_flags or not stat.S_ISREG(entry.mode):
+                raise UnsupportedRepositoryError(f"Unsupported index entry {name}")
+            try:
+                file_stat = os.lstat(path)
+            except FileNotFoundError:
+                yield name
+                continue
+            if not stat.S_ISREG(file_stat.st_mode) or (file_stat.st_mode ^ entry.mode) & 0o100:
+                raise UnsupportedRepositoryError(f"File mode of {name} changed")
+            if self._stat_matches(entry, file_stat, index.mtime_ns):
+                continue
+            if self.hash_object("blob", Path(path).read_bytes()) != entry.sha:
+                raise UnsupportedRepositoryError(f"Content of {name} differs")
+
+    @staticmethod
+    def _stat_matches(entry: IndexEntry, file_stat: os.stat_result, index_mtime_ns: int) -> bool:
+        """Return whether file stat matches the index entry and the entry isn't racily clean."""
+        mtime_ns = file_stat.st_mtime_ns
+        mtime = (mtime_ns // 1_000_000_000, mtime_ns % 1_000_000_000)
+        return (
+            entry.size == file_stat.st_size & 0xFFFFFFFF
+            and entry.mtime == mtime
+            and entry.ino == file_stat.st_ino & 0xFFFFFFFF
+            # File modified in the same time as the index was written may have changed since.
+            and mtime_ns < index_mtime_ns
+        )
+
+    def _get_name(self, path: Path) -> str:
+        """Return name of the path in the index."""
+        relative = Path(os.path.relpath(os.path.abspath(path), self.work_tree))
+        if relative.parts[:1] == ("..",):
+            raise UnsupportedRepositoryError(f"Path {path} is outside of the repository")
+        return relative.as_posix()
+
+    def _check_no_filters(self, names: Iterable[str]) -> None:
+        """Check git doesn't apply any filters or conversions to the files.
+
+        Raises:
+            UnsupportedRepositoryError: If any attributes or line ending conversion is defined.
+        """
+        if self.get_config("core.attributesfile") is not None:
+            raise UnsupportedRepositoryError("Attributes file is defined")
+        if self.get_config("core.autocrlf") not in (None, "false"):
+            raise UnsupportedRepositoryError("Line ending conversion is enabled")
+        config_home = Path(os.environ.get("XDG_CONFIG_HOME") or Path.home() / ".config")
+        attributes = {self.common_dir / "info" / "attributes", config_home / "git" / "attributes"}
+        for name in names:
+            attributes.update(
+                self.work_tree / p / ".gitattributes" for p in PurePosixPath(name).parents
+            )
+        for path in attributes:
+            if path.exists():
+                raise UnsupportedRepositoryError(f"Attributes are defined in {path}")
+
+    def _serialize_index(self, index: Index, cache_tree: Optional[bytes] = None) -> bytes:
+        """Return content of the index file.
+
+        Index extensions are dropped, only cache tree is written if provided.
+        """
+        version = index.version
+        if version == 2 and any(e.extended_flags for e in index.entries.values()):
+            version = 3
+        chunks = [struct.pack(">4sII", b"DIRC", version, len(index.entries))]
+        previous = b""
+        for entry in index.entries.values():
+            path = os.fsencode(entry.path)
+            # Keep assume valid and stage flags
+            flags = entry.flags & 0xB000 | min(len(path), 0xFFF)
+            if entry.extended_flags:
+                flags |= 0x4000
+            data = _INDEX_ENTRY.pack(
+                *entry.ctime,
+                *entry.mtime,
+                entry.dev,
+                entry.ino,
+                entry.mode,
+                entry.uid,
+                entry.gid,
+                entry.size,
+                bytes.fromhex(entry.sha),
+                flags,
+            )
+            if entry.extended_flags:
+                data += struct.pack(">H", entry.extended_flags)
+            if version == 4:
+                common = len(os.path.commonprefix([previous, path]))
+                data += _encode_varint(len(previous) - common) + path[common:] + b"\0"
+                previous = path
+            else:
+                data += path
+                data += b"\0" * (8 - len(data) % 8)
+            chunks.append(data)
+        if cache_tree is not None:
+            chunks.append(struct.pack(">4sI", b"TREE", len(cache_tree)) + cache_tree)
+        content = b"".join(chunks)
+        return content + hashlib.sha1(content).digest()  # nosec
+
+    def add_files(self, paths: Iterable[Path]) -> None:
+        """Add tracked files to the index.
+
+        Raises:
+            UnsupportedRepositoryError: If any of the files isn't tracked regular file or git
+                may apply filters to it.
+        """
+        self.check_supported()
+        with _lock_file(self.git_dir / "index") as fh:
+            index = self.read_index()
+            entries = dict(index.entries)
+            names = {self._get_name(p): p for p in paths}
+            self._check_no_filters(names)
+            keep_mode = self.get_config("core.filemode") == "false"
+            for name, path in names.items():
+                entry = entries.get(name)
+                if entry is None or entry.stage or entry.extended_flags:
+                    raise UnsupportedRepositoryError(f"Unsupported index entry {name}")
+                try:
+                    file_stat = os.lstat(path)
+                    content = Path(path).read_bytes()
+                except OSError as error:
+                    raise UnsupportedRepositoryError(str(error)) from error
+                if not stat.S_ISREG(file_stat.st_mode):
+                    raise UnsupportedRepositoryError(f"File {name} isn't a regular file")
+                mode = 0o100755 if file_stat.st_mode & 0o100 else 0o100644
+                entries[name] = entry._replace(
+                    ctime=(
+                        file_stat.st_ctime_ns // 10**9 & 0xFFFFFFFF,
+                        file_stat.st_ctime_ns % 10**9,
+                    ),
+                    mtime=(
+                        file_stat.st_mtime_ns // 10**9 & 0xFFFFFFFF,
+                        file_stat.st_mtime_ns % 10**9,
+                    ),
+                    dev=file_stat.st_dev & 0xFFFFFFFF,
+                    ino=file_stat.st_ino & 0xFFFFFFFF,
+                    mode=entry.mode if keep_mode else mode,
+                    uid=file_stat.st_uid & 0xFFFFFFFF,
+                    gid=file_stat.st_gid & 0xFFFFFFFF,
+                    size=file_stat.st_size & 0xFFFFFFFF,
+                    sha=self.write_object("blob", content),
+                )
+            fh.write(self._serialize_index(index._replace(entries=entries)))
+
+    def _write_tree(
+        self, name: bytes, entries: List[Tuple[bytes, IndexEntry]]
+    ) -> Tuple[str, bytes]:
+        """Write tree objects for index entries with paths relative to the tree.
+
+        Returns:
+            Object name of the tree and its cache tree extension data.
+        """
+        records = []
+        subtrees = b""
+        subtree_count = 0
+        for (child, is_tree), group in groupby(
+            entries, key=lambda item: (item[0].split(b"/", 1)[0], b"/" in item[0])
+        ):
+            if is_tree:
+                sha, data = self._write_tree(
+                    child, [(path.split(b"/", 1)[1], entry) for path, entry in group]
+                )
+                subtrees += data
+                subtree_count += 1
+                records.append((child + b"/", b"40000 " + child + b"\0" + bytes.fromhex(sha)))
+            else:
+                entry = next(group)[1]
+                mode = f"{entry.mode:o} ".encode()
+                records.append((child, mode + child + b"\0" + bytes.fromhex(entry.sha)))
+        # Trees are sorted by names with trailing slash appended to names of subtrees.
+        sha = self.write_object("tree", b"".join(record for _, record in sorted(records)))
+        header = f"{len(entries)} {subtree_count}\n".encode()
+        return sha, name + b"\0" + header + bytes.fromhex(sha) + subtrees
+
+    def _get_head_ref(self) -> str:
+        """Return reference HEAD points to or `HEAD` if detached."""
+        try:
+            head = (self.git_dir / "HEAD").read_text().strip()
+        except OSError as error:
+            raise UnsupportedRepositoryError(str(error)) from error
+        return head[len("ref:") :].strip() if head.startswith("ref:") else "HEAD"
+
+    def get_ident(self, role: str) -> str:
+        """Return identity of `author` or `committer` with the current time.
+
+        Raises:
+            UnsupportedRepositoryError: If identity is not configured.
+        """
+        prefix = f"GIT_{role.upper()}_"
+        name = (
+            os.environ.get(prefix + "NAME")
+            or self.get_config(f"{role}.name")
+            or self.get_config("user.name")
+        )
+        email = (
+            os.environ.get(prefix + "EMAIL")
+            or self.get_config(f"{role}.email")
+            or self.get_config("user.email")
+            or os.environ.get("EMAIL")
+        )
+        if not name or not email or prefix + "DATE" in os.environ:
+            raise UnsupportedRepositoryError(f"Unsupported {role} identity")
+        if any(char in name + email for char in "<>\n"):
+            raise UnsupportedRepositoryError(f"Unsupported {role} identity")
+        now = time.time()
+        offset = time.localtime(now).tm_gmtoff
+        sign = "-" if offset < 0 else "+"
+        hours, minutes = divmod(abs(offset) // 60, 60)
+        return f"{name} <{email}> {int(now)} {sign}{hours:02d}{minutes:02d}"
+
+    def has_hooks(self) -> bool:
+        """Return whether any hooks may be run."""
+        if self.get_config("core.hookspath") is not None:
+            return True
+        try:
+            return any(
+                not p.name.endswith(".sample") for p in (self.common_dir / "hooks").iterdir()
+            )
+        except FileNotFoundError:
+            return False
+
+    def update_refs(
+        self,
+        updates: Sequence[Tuple[str, Optional[str], str]],
+        *,
+        reflog: Optional[Tuple[str, str]] = None,
+    ) -> None:
+        """Update references in a single transaction.
+
+        Either all or none of the references are updated.
+
+        Arguments:
+            updates: Triples of reference, its expected current value (None if the reference must
+                not exist) and its new value.
+            reflog: Identity and message to log the updates with.
+
+        Raises:
+            UnsupportedRepositoryError: If any of the references can't be locked, or doesn't have
+                the expected value.
+        """
+        with ExitStack() as stack:
+            for ref, old, new in updates:
+                if _INVALID_REF.search(ref):
+                    raise UnsupportedRepositoryError(f"Invalid reference {ref}")
+                path = (self.git_dir if ref == "HEAD" else self.common_dir) / ref
+                try:
+                    path.parent.mkdir(parents=True, exist_ok=True)
+                except OSError as error:
+                    raise UnsupportedRepositoryError(str(error)) from error
+                if path.is_dir():
+                    raise UnsupportedRepositoryError(f"Reference {ref} is a directory")
+                fh = stack.enter_context(_lock_file(path))
+                if self.resolve_ref(ref) != old:
+                    raise UnsupportedRepositoryError(f"Reference {ref} has changed")
+                fh.write(f"{new}\n".encode())
+
+        if reflog is not None and self.get_config("core.logallrefupdates") != "false":
+            ident, message = reflog
+            head_ref = self._get_head_ref()
+            for ref, old, new in updates:
+                for log_ref in {ref, "HEAD"} if ref == head_ref else {ref}:
+                    log_path = (self.git_dir if log_ref == "HEAD" else self.common_dir) / "logs"
+                    log_path /= log_ref
+                    log_path.parent.mkdir(parents=True, exist_ok=True)
+                    with open(log_path, "a") as log:
+                        log.write(f"{old or '0' * 40} {new} {ident}\t{message}\n")
+
+    def commit(self, message: str) -> str:
+        """Commit the index and return name of the commit.
+
+        Raises:
+            UnsupportedRepositoryError: If hooks or signing are configured, the index contains
+                unsupported entries or there is nothing to commit.
+        """
+        self.check_supported()
+        if self.has_hooks():
+            raise UnsupportedRepositoryError("Hooks are configured")
+        for key in ("commit.cleanup", "commit.gpgsign", "i18n.commitencoding"):
+            if self.get_config(key) not in (None, "false"):
+                raise UnsupportedRepositoryError(f"Unsupported commit option {key}")
+        message = _cleanup_message(message)
+        if not message:
+            raise UnsupportedRepositoryError("Empty commit message")
+        head_ref = self._get_head_ref()
+
+        with _lock_file(self.git_dir / "index") as fh:
+            index = self.read_index()
+            if any(e.stage or e.extended_flags for e in index.entries.values()):
+                raise UnsupportedRepositoryError("Unsupported index entries")
+            tree, cache_tree = self._write_tree(
+                b"", [(os.fsencode(name), entry) for name, entry in index.entries.items()]
+            )
+            parent = self.resolve_ref(head_ref)
+            if parent is not None and tree == self.get_head_tree():
+                raise UnsupportedRepositoryError("Nothing to commit")
+            author = self.get_ident("author")
+            committer = self.get_ident("committer")
+            content = f"tree {tree}\n"
+            if parent is not None:
+                content += f"parent {parent}\n"
+            content += f"author {author}\ncommitter {committer}\n\n{message}"
+            commit = self.write_object("commit", content.encode())
+            action = "commit" if parent is not None else "commit (initial)"
+            self.update_refs(
+                [(head_ref, parent, commit)],
+                reflog=(committer, f"{action}: {message.splitlines()[0]}"),
+            )
+            fh.write(self._serialize_index(index, cache_tree))
+        return commit
+
+    def tags(self, tags: Sequence[Tuple[str, str]]) -> None:
+        """Create annotated tags of HEAD in a single transaction.
+
+        Arguments:
+            tags: Pairs of tag name and tag message.
+
+        Raises:
+            UnsupportedRepositoryError: If hooks or signing are configured or any of the tags
+                can't be created.
+        """
+        self.check_supported()
+        if self.has_hooks():
+            raise UnsupportedRepositoryError("Hooks are configured")
+        if self.get_config_bool("tag.gpgsign"):
+            raise UnsupportedRepositoryError("Unsupported tag option tag.gpgsign")
+        head = self.resolve_ref("HEAD")
+        if head is None:
+            raise UnsupportedRepositoryError("No commit to tag")
+        tagger = self.get_ident("committer")
+        updates: List[Tuple[str, Optional[str], str]] = []
+        for tag, message in tags:
+            message = _cleanup_message(message)
+            if not message:
+                raise UnsupportedRepositoryError("Empty tag message")
+            content = f"object {head}\ntype commit\ntag {tag}\ntagger {tagger}\n\n{message}"
+            updates.append((f"refs/tags/{tag}", None, self.write_object("tag", content.encode())))
+        self.update_refs(updates)
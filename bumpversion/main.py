@@ -1,15 +1,29 @@
 """Command line interface."""
+import os
 import shlex
-from typing import Optional, Tuple
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import nullcontext
+from typing import TYPE_CHECKING, Any, Dict, Iterator, List, NamedTuple, Optional, Tuple, cast
 
 import click
 from click import echo as _echo
+from click.core import ParameterSource
 
 from bumpversion import __version__
-from bumpversion.constants import Verbosity
-from bumpversion.settings import Settings
-from bumpversion.utils import load_instance
-from bumpversion.vcs import AbstractVcs, get_vcs
+from bumpversion.commits import get_change_type
+from bumpversion.constants import ChangeType, DirtyScope, Verbosity, VersionSource
+from bumpversion.describe import get_cache_key, get_distances, load_distances, store_distances
+from bumpversion.schemas import Schema
+from bumpversion.settings import File, Settings, find_config_files, load_settings
+from bumpversion.tags import TagVersions, get_tag_affixes
+from bumpversion.template import compile_template
+from bumpversion.utils import InstancePool, PathTrie
+from bumpversion.vcs import AbstractVcs, Git, get_vcs
+
+if TYPE_CHECKING:  # pragma: no cover
+    from bumpversion.bumper import BaseBumper
+    from bumpversion.parser import BaseParser
 
 
 def echo(
@@ -30,13 +44,46 @@ def echo(
         _echo(message, nl=nl, err=err)
 
 
+_SETTINGS_KEY = "bumpversion.settings"
+# Commit message used in monorepo mode unless a custom commit message is defined.
+_MONOREPO_COMMIT_MESSAGE = "Bump versions\n\n{projects}"
+
+
+class _SerializedVersions:
+    """Current and new versions serialized once per serializer instance.
+
+    Serializers are shared by the instance pool, so each serializer configuration is used only
+    once. Thread-safe.
+    """
+
+    def __init__(self, current_version: Dict[str, Any], new_version: Dict[str, Any]):
+        self._current_version = current_version
+        self._new_version = new_version
+        # Serializer is kept in the value, so its id isn't reused.
+        self._cache: Dict[int, Tuple[Any, Tuple[str, str]]] = {}
+        self._lock = threading.Lock()
+
+    def get(self, serializer: Any) -> Tuple[str, str]:
+        """Return current and new version serialized by the serializer."""
+        with self._lock:
+            try:
+                return self._cache[id(serializer)][1]
+            except KeyError:
+                pass
+            versions = (serializer(self._current_version), serializer(self._new_version))
+            self._cache[id(serializer)] = (serializer, versions)
+            return versions
+
+
 def _load_settings(ctx: click.Context, param: click.Option, value: str) -> str:
     """Load option defaults from config file."""
-    # Use `construct` to skip pydantic validation.
-    settings = Settings(config_file=value)
+    settings = load_settings(value)
+    # Keep the settings, so they are loaded only once.
+    ctx.meta[_SETTINGS_KEY] = settings
     ctx.default_map = {
         "dry_run": settings.dry_run,
         "allow_dirty": settings.allow_dirty,
+        "dirty_scope": settings.dirty_scope.value,
         "commit": settings.commit,
         "commit_message": settings.commit_message,
         "commit_args": shlex.join(settings.commit_args),
@@ -45,6 +92,7 @@ def _load_settings(ctx: click.Context, param: click.Option, value: str) -> str:
         "sign_tags": settings.sign_tags,
         "tag_message": settings.tag_message,
         "current_version": settings.current_version,
+        "jobs": settings.jobs,
     }
     # Return the value back, so the config_file is used properly.
     return value
@@ -81,6 +129,11 @@ def _load_settings(ctx: click.Context, param: click.Option, value: str) -> str:
     is_flag=True,
     help="Don't abort if working directory is dirty",
 )
+@click.option(
+    "--dirty-scope",
+    type=click.Choice([s.value for s in DirtyScope]),
+    help="Check only maintained files or whole repository whether working directory is dirty",
+)
 @click.option(
     "--commit/--no-commit",
     help="Commit to version control",
@@ -103,13 +156,43 @@ def _load_settings(ctx: click.Context, param: click.Option, value: str) -> str:
     "--current-version",
     help="Version that needs to be updated",
 )
+@click.option(
+    "-j",
+    "--jobs",
+    type=click.IntRange(min=1),
+    help="Number of files bumped concurrently",
+)
+@click.option(
+    "--monorepo",
+    is_flag=True,
+    help="Bump all projects with config files in subdirectories",
+)
+@click.option(
+    "--project",
+    "projects",
+    multiple=True,
+    help="Directory of a project bumped in monorepo mode (can be repeated)",
+)
+@click.option(
+    "--changed-only",
+    is_flag=True,
+    help="Bump only projects changed since their last tag in monorepo mode",
+)
+@click.option(
+    "--auto",
+    is_flag=True,
+    help="Pick bumped parts from conventional commits since the last tag",
+)
+@click.pass_context
 def main(
+    ctx: click.Context,
     parts: Tuple[str, ...],
     new_version: str,
     verbosity: Verbosity,
     config_file: Optional[str],
     dry_run: bool,
     allow_dirty: bool,
+    dirty_scope: str,
     commit: bool,
     commit_message: str,
     commit_args: str,
@@ -118,16 +201,31 @@ def main(
     sign_tags: bool,
     tag_message: str,
     current_version: str,
+    jobs: int,
+    monorepo: bool,
+    projects: Tuple[str, ...],
+    changed_only: bool,
+    auto: bool,
 ) -> None:
     """Bump the project version."""
-    if not parts and not new_version:
-        raise click.BadParameter("Either parts or --new-version must be defined.")
-    if parts and new_version:
-        raise click.BadParameter("Only one of parts or --new-version must be defined.")
-    settings = Settings(
-        config_file=config_file,
+    if not parts and not new_version and not auto:
+        raise click.BadParameter("Either parts, --new-version or --auto must be defined.")
+    if len([v for v in (parts, new_version, auto) if v]) > 1:
+        raise click.BadParameter("Only one of parts, --new-version or --auto must be defined.")
+    if projects and not monorepo:
+        raise click.BadParameter("--project can only be used with --monorepo.")
+    if changed_only and not monorepo:
+        raise click.BadParameter("--changed-only can only be used with --monorepo.")
+    current_version_given = (
+        ctx.get_parameter_source("current_version") == ParameterSource.COMMANDLINE
+    )
+    if monorepo and current_version_given:
+        raise click.BadParameter("--current-version can't be used with --monorepo.")
+    loaded_settings = cast(Settings, ctx.meta[_SETTINGS_KEY])
+    settings = loaded_settings.copy_validated(
         dry_run=dry_run,
         allow_dirty=allow_dirty,
+        dirty_scope=dirty_scope,
         commit=commit,
         commit_message=commit_message,
         commit_args=shlex.split(commit_args),
@@ -136,6 +234,11 @@ def main(
         sign_tags=sign_tags,
         tag_message=tag_message,
         current_version=current_version,
+        # Current version defined on command line takes precedence over tags.
+        version_source=(
+            VersionSource.config if current_version_given else loaded_settings.version_source
+        ),
+        jobs=jobs,
     )
     settings._verbosity = verbosity
 
@@ -145,87 +248,605 @@ def main(
     echo(f"Config file: {config_file}", Verbosity.DEBUG, settings=settings)
     echo(f"Settings: {settings}", Verbosity.DEBUG, settings=settings)
 
-    parser = load_instance(
-        settings.parser.cls,
-        **settings.parser.dict(exclude={"cls"}),
+    if settings.vcs is None:
+        vcs = get_vcs()
+    else:
+        vcs = get_vcs(settings.vcs.cls, **settings.vcs.dict(exclude={"cls"}))
+    with vcs or nullcontext():
+        pool = InstancePool()
+        tag_versions = TagVersions(vcs) if vcs else None
+        if monorepo:
+            bumped_projects = _get_monorepo_projects(
+                projects, changed_only, parts, new_version, auto, vcs, tag_versions, settings, pool
+            )
+        else:
+            project = _get_project(
+                None, settings, parts, new_version, auto, vcs, tag_versions, settings, pool
+            )
+            if project is None:
+                exit("No commits requiring a version bump found.")
+            bumped_projects = [project]
+
+        files = [(file, project.versions) for project in bumped_projects for file in project.files]
+        # Check dirty
+        if vcs and not settings.allow_dirty:
+            _check_dirty(files, vcs, settings)
+
+        # Bump files
+        if settings.jobs > 1:
+            _bump_files_concurrently(files, settings, pool)
+        else:
+            _bump_files(files, settings, pool)
+        # Bump config file, if present
+        if settings._config_file and not monorepo:
+            echo(f"Bumping file {settings._config_file}", Verbosity.INFO, settings=settings)
+            if not settings.dry_run:
+                serializer = pool.get(
+                    settings.serializer.cls, **settings.serializer.dict(exclude={"cls"})
+                )
+                replacer = pool.get(
+                    settings.replacer.cls, **settings.replacer.dict(exclude={"cls"})
+                )
+                versions = bumped_projects[0].versions
+                serialized_current_version, serialized_new_version = versions.get(serializer)
+                replacer(
+                    current_version=serialized_current_version,
+                    new_version=serialized_new_version,
+                    path=settings._config_file,
+                )
+        echo(
+            f"Instance pool: {pool.hits} hits, {pool.misses} misses",
+            Verbosity.DEBUG,
+            settings=settings,
+        )
+
+        if vcs:
+            if monorepo:
+                _handle_monorepo_vcs(bumped_projects, vcs, settings)
+            else:
+                project = bumped_projects[0]
+                _handle_vcs(project.current_version, project.new_version, vcs, settings)
+
+
+class _Project(NamedTuple):
+    """Project bumped in a run."""
+
+    directory: Optional[str]
+    """Directory of a project in monorepo or None."""
+    current_version: str
+    new_version: str
+    files: List[File]
+    tag_name: str
+    tag_message: str
+    versions: _SerializedVersions
+
+
+def _load_projects(selected: Tuple[str, ...], settings: Settings) -> List[Tuple[str, Settings]]:
+    """Return directories and settings of projects in monorepo.
+
+    Settings are loaded using a pool of `settings.jobs` threads, which only overlaps reading of
+    the files. Parsing and validation hold the GIL, unchanged configs are restored from
+    the settings cache instead.
+    """
+    config_files = list(find_config_files())
+    if selected:
+        directories = {os.path.normpath(d) for d in selected}
+        missing = directories.difference(directory for directory, _ in config_files)
+        if missing:
+            raise click.BadParameter(f"Projects not found: {', '.join(sorted(missing))}")
+        config_files = [item for item in config_files if item[0] in directories]
+    echo(f"Projects: {len(config_files)}", Verbosity.DEBUG, settings=settings)
+
+    with ThreadPoolExecutor(max_workers=settings.jobs) as executor:
+        futures = [
+            executor.submit(load_settings, config_file, project_dir=directory)
+            for directory, config_file in config_files
+        ]
+    errors = [
+        f"{config_file}: {future.exception()}"
+        for (_, config_file), future in zip(config_files, futures)
+        if future.exception() is not None
+    ]
+    if errors:
+        exit("Loading projects failed:\n" + "\n".join(errors))
+    return [(directory, future.result()) for (directory, _), future in zip(config_files, futures)]
+
+
+def _get_monorepo_projects(
+    selected: Tuple[str, ...],
+    changed_only: bool,
+    parts: Tuple[str, ...],
+    new_version: Optional[str],
+    auto: bool,
+    vcs: Optional[AbstractVcs],
+    tag_versions: Optional[TagVersions],
+    settings: Settings,
+    pool: InstancePool,
+) -> List[_Project]:
+    """Return projects in monorepo to be bumped.
+
+    Projects without commits requiring a version bump are skipped with `--auto`.
+    """
+    # Check the commit message before projects are loaded.
+    _get_monorepo_commit_message(settings)
+    bumped_projects = []
+    for directory, project_settings in _load_projects(selected, settings):
+        project = _get_project(
+            directory,
+            project_settings,
+            parts,
+            new_version,
+            auto,
+            vcs,
+            tag_versions,
+            settings,
+            pool,
+        )
+        if project is None:
+            echo(f"Skipping project {directory}: no changes", Verbosity.INFO, settings=settings)
+            continue
+        bumped_projects.append(project)
+    if changed_only:
+        bumped_projects = _select_changed_projects(bumped_projects, vcs, settings)
+    for project in bumped_projects:
+        echo(
+            f"Bumping project {project.directory}: "
+            f"{project.current_version} → {project.new_version}",
+            Verbosity.INFO,
+            settings=settings,
+        )
+    return bumped_projects
+
+
+def _select_changed_projects(
+    projects: List[_Project], vcs: Optional[AbstractVcs], settings: Settings
+) -> List[_Project]:
+    """Return projects with files changed since their last tag.
+
+    Last tag of a project is the tag for its current version. Projects sharing the same tag
+    are checked using a single query to VCS. Projects without the tag are considered changed.
+    """
+    if vcs is None:
+        exit("--changed-only requires a version control system.")
+    trie = PathTrie()
+    tags: Dict[str, List[str]] = {}
+    for project in projects:
+        directory = cast(str, project.directory)
+        trie.add(directory, directory)
+        tag_name = _get_last_tag(directory, project.tag_name, project.current_version)
+        tags.setdefault(tag_name, []).append(directory)
+
+    changed = set()
+    for tag_name, directories in tags.items():
+        changed_files = vcs.get_changed_files(f"refs/tags/{tag_name}")
+        if changed_files is None:
+            echo(f"Tag {tag_name} not found", Verbosity.DEBUG, settings=settings)
+            changed.update(directories)
+            continue
+        changed_projects = {trie.find(path) for path in changed_files}
+        changed.update(d for d in directories if d in changed_projects)
+    echo(f"Changed projects: {len(changed)}", Verbosity.DEBUG, settings=settings)
+    return [project for project in projects if project.directory in changed]
+
+
+def _get_last_tag(directory: Optional[str], tag_name: str, current_version: str) -> str:
+    """Return name of the tag of the current version."""
+    message_context = {
+        "project": directory,
+        "current_version": current_version,
+        "new_version": current_version,
+    }
+    return compile_template(tag_name).format(**message_context)
+
+
+def _get_project(
+    directory: Optional[str],
+    project_settings: Settings,
+    parts: Tuple[str, ...],
+    new_version: Optional[str],
+    auto: bool,
+    vcs: Optional[AbstractVcs],
+    tag_versions: Optional[TagVersions],
+    settings: Settings,
+    pool: InstancePool,
+) -> Optional[_Project]:
+    """Return project with its versions parsed and bumped.
+
+    None is returned if parts are picked automatically and no commit requires a version bump.
+    """
+    parser = pool.get(
+        project_settings.parser.cls,
+        **project_settings.parser.dict(exclude={"cls"}),
     )
+    current_version = project_settings.current_version
+    if project_settings.version_source == VersionSource.tags:
+        current_version = _get_tag_version(directory, project_settings, parser, tag_versions)
+        echo(f"Current version from tags: {current_version}", Verbosity.DEBUG, settings=settings)
     parsed_current_version = parser(current_version)
 
+    if auto:
+        auto_parts = _get_auto_parts(directory, project_settings, current_version, vcs, settings)
+        if auto_parts is None:
+            return None
+        parts = auto_parts
+
     if new_version:
         parsed_new_version = parser(new_version)
     else:
-        bumper = load_instance(
-            settings.bumper.cls,
-            **settings.bumper.dict(exclude={"cls"}),
+        bumper = pool.get(
+            project_settings.bumper.cls,
+            **project_settings.bumper.dict(exclude={"cls"}),
         )
-        serializer = load_instance(
-            settings.serializer.cls,
-            **settings.serializer.dict(exclude={"cls"}),
+        serializer = pool.get(
+            project_settings.serializer.cls,
+            **project_settings.serializer.dict(exclude={"cls"}),
         )
         parsed_new_version = bumper(parsed_current_version.copy(), parts)
-        new_version = serializer(parsed_new_version)
+    versions = _SerializedVersions(parsed_current_version, parsed_new_version)
+    if not new_version:
+        # Files usually share the serializer, so the new version is serialized only once.
+        new_version = versions.get(serializer)[1]
 
     echo(f"Parsed new version: {parsed_new_version}", Verbosity.DEBUG, settings=settings)
+    return _Project(
+        directory=directory,
+        current_version=current_version,
+        new_version=new_version,
+        files=project_settings.file,
+        tag_name=project_settings.tag_name,
+        tag_message=project_settings.tag_message,
+        versions=versions,
+    )
+
+
+def _get_auto_parts(
+    directory: Optional[str],
+    project_settings: Settings,
+    current_version: str,
+    vcs: Optional[AbstractVcs],
+    settings: Settings,
+) -> Optional[Tuple[str, ...]]:
+    """Return parts bumped by the commits since the last tag or None if there are no such commits.
+
+    Commit messages are streamed from VCS and classified until a breaking change is found.
+    In monorepo, only commits changing the project directory are considered.
+    """
+    if vcs is None:
+        exit("--auto requires a version control system.")
+    tag_name = _get_last_tag(directory, project_settings.tag_name, current_version)
+    paths = None if directory is None else [directory]
+    try:
+        messages = vcs.iter_commit_messages(f"refs/tags/{tag_name}", paths)
+        if messages is None:
+            echo(f"Tag {tag_name} not found", Verbosity.DEBUG, settings=settings)
+            messages = cast(Iterator[str], vcs.iter_commit_messages(None, paths))
+    except NotImplementedError as error:
+        exit(str(error))
+    change_type = get_change_type(messages)
+    if change_type is None:
+        echo(f"No changes since {tag_name}", Verbosity.DEBUG, settings=settings)
+        return None
+    echo(f"Change since {tag_name}: {change_type.value}", Verbosity.DEBUG, settings=settings)
+    return tuple(project_settings.auto_parts[change_type])
+
+
+def _get_tag_version(
+    directory: Optional[str],
+    project_settings: Settings,
+    parser: "BaseParser",
+    tag_versions: Optional[TagVersions],
+) -> str:
+    """Return the latest version from tags matching the tag name of the project."""
+    if tag_versions is None:
+        exit("Version source tags requires a version control system.")
+    try:
+        prefix, suffix = get_tag_affixes(project_settings.tag_name, directory)
+        index = tag_versions.get_index(parser, project_settings.parser.dict(), prefix, suffix)
+    except (ValueError, NotImplementedError) as error:
+        exit(str(error))
+    version = index.latest()
+    if version is None:
+        exit(f"No tag matching {prefix}{{new_version}}{suffix} found.")
+    return version
+
 
-    vcs = get_vcs()
-    # Check dirty
-    if vcs and not settings.allow_dirty:
+def _check_dirty(
+    files: List[Tuple[File, _SerializedVersions]], vcs: AbstractVcs, settings: Settings
+) -> None:
+    """Exit if VCS directory is not clean."""
+    if settings.dirty_scope == DirtyScope.repo:
         dirty_files = tuple(vcs.get_dirty_files())
-        if dirty_files:
-            exit(f"VCS directory not clean: {dirty_files}")
+    else:
+        dirty_files = tuple(vcs.get_dirty_files(file.path for file, _ in files))
+    if dirty_files:
+        exit(f"VCS directory not clean: {dirty_files}")
+
+
+def _bump_file(
+    file: File,
+    versions: _SerializedVersions,
+    settings: Settings,
+    pool: InstancePool,
+) -> Any:
+    """Bump version in a single file and return the result of the replacer."""
+    serializer = pool.get(file.serializer.cls, **file.serializer.dict(exclude={"cls"}))
+    replacer = pool.get(file.replacer.cls, **file.replacer.dict(exclude={"cls"}))
+    if not settings.dry_run:
+        current_version, new_version = versions.get(serializer)
+        return replacer(
+            current_version=current_version,
+            new_version=new_version,
+            **file.dict(exclude={"serializer", "replacer"}),
+        )
+    return None
 
-    # Bump files
-    for file in settings.file:
+
+def _bump_files(
+    files: List[Tuple[File, _SerializedVersions]],
+    settings: Settings,
+    pool: InstancePool,
+) -> None:
+    """Bump version in all files one by one."""
+    for file, versions in files:
         echo(f"Bumping file {file.path}", Verbosity.INFO, settings=settings)
-        serializer = load_instance(file.serializer.cls, **file.serializer.dict(exclude={"cls"}))
-        replacer = load_instance(file.replacer.cls, **file.replacer.dict(exclude={"cls"}))
-        if not settings.dry_run:
-            replacer(
-                current_version=serializer(parsed_current_version.copy()),
-                new_version=serializer(parsed_new_version.copy()),
-                **file.dict(exclude={"serializer", "replacer"}),
-            )
-    # Bump config file, if present
-    if settings._config_file:
-        echo(f"Bumping file {settings._config_file}", Verbosity.INFO, settings=settings)
-        if not settings.dry_run:
-            serializer = load_instance(
-                settings.serializer.cls, **settings.serializer.dict(exclude={"cls"})
-            )
-            replacer = load_instance(
-                settings.replacer.cls, **settings.replacer.dict(exclude={"cls"})
-            )
-            replacer(
-                current_version=serializer(parsed_current_version.copy()),
-                new_version=serializer(parsed_new_version.copy()),
-                path=settings._config_file,
-            )
+        mode = _bump_file(file, versions, settings, pool)
+        if mode is not None:
+            echo(f"Replace mode: {mode}", Verbosity.DEBUG, settings=settings)
+
+
+def _bump_files_serially(
+    files: List[Tuple[File, _SerializedVersions]],
+    settings: Settings,
+    pool: InstancePool,
+) -> List[Tuple[Any, Optional[BaseException]]]:
+    """Bump version in files one by one and return results of replacers or errors."""
+    results: List[Tuple[Any, Optional[BaseException]]] = []
+    for file, versions in files:
+        try:
+            results.append((_bump_file(file, versions, settings, pool), None))
+        except Exception as error:
+            results.append((None, error))
+    return results
+
+
+def _bump_files_concurrently(
+    files: List[Tuple[File, _SerializedVersions]],
+    settings: Settings,
+    pool: InstancePool,
+) -> None:
+    """Bump version in all files using a pool of `settings.jobs` workers.
 
-    if vcs:
-        _handle_vcs(new_version, vcs, settings)
+    Entries of the same file are bumped one by one in a single task, so none of their changes
+    is lost. All files are processed even if some of them fail.
+    Messages and errors are reported in the order of files.
+    """
+    groups: Dict[str, List[int]] = {}
+    for index, (file, _) in enumerate(files):
+        groups.setdefault(os.path.realpath(file.path), []).append(index)
+    with ThreadPoolExecutor(max_workers=settings.jobs) as executor:
+        futures = [
+            executor.submit(_bump_files_serially, [files[i] for i in indexes], settings, pool)
+            for indexes in groups.values()
+        ]
+    results: Dict[int, Tuple[Any, Optional[BaseException]]] = {}
+    for indexes, future in zip(groups.values(), futures):
+        results.update(zip(indexes, future.result()))
+    errors: List[str] = []
+    for index, (file, _) in enumerate(files):
+        echo(f"Bumping file {file.path}", Verbosity.INFO, settings=settings)
+        result, error = results[index]
+        if error is not None:
+            errors.append(f"{file.path}: {error}")
+        elif result is not None:
+            echo(f"Replace mode: {result}", Verbosity.DEBUG, settings=settings)
+    if errors:
+        exit("Bumping files failed:\n" + "\n".join(errors))
 
 
-def _handle_vcs(new_version: str, vcs: AbstractVcs, settings: Settings) -> None:
+def _handle_vcs(
+    current_version: str, new_version: str, vcs: AbstractVcs, settings: Settings
+) -> None:
     """Handle operations on VCS."""
-    message_context = {"current_version": settings.current_version, "new_version": new_version}
+    message_context = {"current_version": current_version, "new_version": new_version}
     if settings.commit:
         # Add files to commit.
         for file in settings.file:
             echo(f"Adding {file.path}", Verbosity.INFO, settings=settings)
-            if not settings.dry_run:
-                vcs.add_file(file.path)
+        if not settings.dry_run:
+            vcs.add_files(file.path for file in settings.file)
         # Do commit.
-        message = settings.commit_message.format(**message_context)
+        message = compile_template(settings.commit_message).format(**message_context)
         echo(f"Commiting: {message}", Verbosity.INFO, settings=settings)
         if not settings.dry_run:
             vcs.commit(message, extra_args=settings.commit_args)
     if settings.tag:
-        tag_name = settings.tag_name.format(**message_context)
-        tag_message = settings.tag_message.format(**message_context)
+        tag_name = compile_template(settings.tag_name).format(**message_context)
+        tag_message = compile_template(settings.tag_message).format(**message_context)
         echo(f"Tagging {tag_name}", Verbosity.INFO, settings=settings)
         if not settings.dry_run:
             vcs.tag(tag_name, message=tag_message, sign_tags=settings.sign_tags)
 
 
+def _get_monorepo_commit_message(settings: Settings) -> str:
+    """Return format of a commit message in monorepo mode.
+
+    The default commit message of a single project is replaced by a list of bumped projects.
+
+    Raises:
+        click.BadParameter: If the commit message uses other placeholders than `projects`.
+    """
+    if settings.commit_message == Settings.__fields__["commit_message"].default:
+        return _MONOREPO_COMMIT_MESSAGE
+    if not compile_template(settings.commit_message).fields <= {"projects"}:
+        raise click.BadParameter("commit_message can only use projects placeholder in monorepo.")
+    return settings.commit_message
+
+
+def _handle_monorepo_vcs(projects: List[_Project], vcs: AbstractVcs, settings: Settings) -> None:
+    """Handle operations on VCS for projects in monorepo.
+
+    All projects are commited in a single commit with a message listing the bumped projects,
+    tag names and messages are taken from settings of each project.
+    """
+    if not projects:
+        return
+    if settings.commit:
+        files = [file.path for project in projects for file in project.files]
+        for path in files:
+            echo(f"Adding {path}", Verbosity.INFO, settings=settings)
+        if not settings.dry_run:
+            vcs.add_files(files)
+        summary = "\n".join(
+            f"{p.directory}: {p.current_version} → {p.new_version}" for p in projects
+        )
+        message = compile_template(_get_monorepo_commit_message(settings)).format(projects=summary)
+        echo(f"Commiting: {message}", Verbosity.INFO, settings=settings)
+        if not settings.dry_run:
+            vcs.commit(message, extra_args=settings.commit_args)
+    if settings.tag:
+        tags = []
+        for project in projects:
+            message_context = {
+                "project": project.directory,
+                "current_version": project.current_version,
+                "new_version": project.new_version,
+            }
+            tag_name = compile_template(project.tag_name).format(**message_context)
+            echo(f"Tagging {tag_name}", Verbosity.INFO, settings=settings)
+            tags.append(
+                (tag_name, compile_template(project.tag_message).format(**message_context))
+            )
+        if not settings.dry_run:
+            vcs.tags(tags, sign_tags=settings.sign_tags)
+
+
+@click.command()
+@click.argument("revisions", nargs=-1)
+@click.version_option(version=__version__, message="bumpversion %(version)s")
+@click.option(
+    "--config-file",
+    type=click.Path(exists=True, dir_okay=False),
+    help="Set custom config file.",
+    callback=_load_settings,
+    is_eager=True,
+)
+@click.option(
+    "-p",
+    "--part",
+    "parts",
+    multiple=True,
+    help="Part bumped in the development versions (can be repeated), part of fixes by default",
+)
+@click.pass_context
+def describe(
+    ctx: click.Context, revisions: Tuple[str, ...], config_file: Optional[str], parts: List[str]
+) -> None:
+    """Print development versions of the revisions, HEAD by default.
+
+    Version of a revision is the version from the latest release tag on its first-parent line,
+    bumped by the parts and with the `dev` part set to the number of commits since the tag.
+    SemVer versions get a `dev.<count>` pre-release instead.
+    Tagged revisions print the version from the tag.
+    """
+    settings = cast(Settings, ctx.meta[_SETTINGS_KEY])
+    # Development versions precede the next fix release by default.
+    parts = list(parts) or settings.auto_parts[ChangeType.fix]
+    if settings.vcs is None:
+        vcs = get_vcs()
+    else:
+        vcs = get_vcs(settings.vcs.cls, **settings.vcs.dict(exclude={"cls"}))
+    if not isinstance(vcs, Git):
+        exit("Describe requires git.")
+
+    with vcs:
+        pool = InstancePool()
+        parser = pool.get(settings.parser.cls, **settings.parser.dict(exclude={"cls"}))
+        try:
+            tagged = _get_tagged_versions(settings.tag_name, parser, vcs)
+        except (ValueError, NotImplementedError) as error:
+            exit(str(error))
+
+        commits = []
+        for revision in revisions or ["HEAD"]:
+            commit = vcs.resolve(f"{revision}^{{commit}}")
+            if commit is None:
+                exit(f"Revision {revision} not found.")
+            commits.append(commit)
+
+        cache_key = get_cache_key(tagged)
+        distances = load_distances(cache_key)
+        known = len(distances)
+        result = get_distances(commits, tagged, distances, vcs.iter_first_parents)
+        if len(distances) != known:
+            store_distances(cache_key, distances)
+
+        bumper = pool.get(settings.bumper.cls, **settings.bumper.dict(exclude={"cls"}))
+        serializer = pool.get(settings.serializer.cls, **settings.serializer.dict(exclude={"cls"}))
+        for revision, commit in zip(revisions or ["HEAD"], commits):
+            distance = result[commit]
+            if distance is None:
+                exit(f"No release tag found in history of {revision}.")
+            version, count = distance
+            if not count:
+                _echo(version)
+                continue
+            try:
+                dev_version = _bump_dev_version(
+                    parser(version), count, parts, bumper, settings.version_schema
+                )
+            except ValueError as error:
+                exit(f"Development version of {revision} can't be bumped: {error}")
+            try:
+                _echo(serializer(dev_version))
+            except ValueError as error:
+                exit(f"Development version of {revision} can't be serialized: {error}")
+
+
+def _bump_dev_version(
+    version: Dict[str, Any],
+    count: int,
+    parts: List[str],
+    bumper: "BaseBumper",
+    schema: Optional[Schema],
+) -> Dict[str, Any]:
+    """Return version bumped by the parts with the development part set to the count.
+
+    Raises:
+        ValueError: If the version can't be bumped by the parts.
+    """
+    dev_version = bumper(version, parts)
+    if schema == Schema.semver:
+        # SemVer has no development part, the count is a pre-release identifier.
+        dev_version["prerelease"] = f"dev.{count}"
+    else:
+        dev_version["dev"] = str(count)
+    return dev_version
+
+
+def _get_tagged_versions(tag_name: str, parser: "BaseParser", vcs: Git) -> Dict[str, str]:
+    """Return mapping of tagged commits to the latest version from their release tags.
+
+    Raises:
+        ValueError: If the tag name template is invalid.
+        NotImplementedError: If the parser doesn't define ordering of versions.
+    """
+    prefix, suffix = get_tag_affixes(tag_name)
+    end = -len(suffix) or None
+    tagged: Dict[str, Tuple[Any, str]] = {}
+    for tag, commit in vcs.get_tagged_commits():
+        if len(tag) <= len(prefix) + len(suffix):
+            continue
+        if not tag.startswith(prefix) or not tag.endswith(suffix):
+            continue
+        version = tag[len(prefix) : end]
+        try:
+            key = parser.key(parser(version))
+        except ValueError:
+            continue
+        if commit not in tagged or tagged[commit][0] < key:
+            tagged[commit] = (key, version)
+    return {commit: version for commit, (_, version) in tagged.items()}
+
+
 if __name__ == "__main__":
     main()
@@ -1,12 +1,71 @@
 """Version parsers."""
 import re
+from abc import ABC, abstractmethod
+from functools import lru_cache
 from re import Pattern
-from typing import Union, cast
+from typing import Any, Hashable, Iterable, Iterator, Optional, Tuple, Union, cast
 
-import semver
+PARSE_CACHE_SIZE = 4096
+"""Maximal number of parsed versions kept in cache."""
 
 
-class RegexParser:
+class BaseParser(ABC):
+    """Base class for version parsers.
+
+    Parsed versions are memoized in a LRU cache shared by all parsers with the same configuration.
+    """
+
+    def _get_config(self) -> Hashable:
+        """Return hashable configuration of the parser."""
+        return ()
+
+    def __eq__(self, other: Any) -> bool:
+        return type(self) is type(other) and self._get_config() == other._get_config()
+
+    def __hash__(self) -> int:
+        return hash((type(self), self._get_config()))
+
+    @abstractmethod
+    def _parse(self, version: str) -> dict:
+        """Perform the actual parsing."""
+
+    def __call__(self, version: str) -> dict:
+        """Parse version using the cache."""
+        # Return a copy, so the cached value can't be modified.
+        return dict(_parse_cached(self, version))
+
+    def parse_many(self, versions: Iterable[str], *, skip_invalid: bool = False) -> Iterator[dict]:
+        """Generate parsed versions from iterable of versions.
+
+        Arguments:
+            versions: Iterable of versions to be parsed.
+            skip_invalid: Whether versions which can't be parsed should be skipped.
+        """
+        for version in versions:
+            try:
+                yield self(version)
+            except ValueError:
+                if not skip_invalid:
+                    raise
+
+    def key(self, version: dict) -> Tuple[Any, ...]:
+        """Return key for sorting of parsed versions.
+
+        Key is a tuple of numbers, strings and nested tuples, which is preserved by a conversion
+        to JSON and back, except tuples become lists.
+
+        Raises:
+            NotImplementedError: If the parser doesn't define ordering of versions.
+        """
+        raise NotImplementedError(f"{type(self).__name__} doesn't define ordering of versions.")
+
+
+@lru_cache(maxsize=PARSE_CACHE_SIZE)
+def _parse_cached(parser: BaseParser, version: str) -> dict:
+    return parser._parse(version)
+
+
+class RegexParser(BaseParser):
     """Parse version by regular expression.
 
     Returns:
@@ -15,10 +74,14 @@ class RegexParser:
 
     def __init__(self, regex: Union[str, Pattern]) -> None:
         self.regex = regex
+        self._pattern = re.compile(regex)
 
-    def __call__(self, version: str) -> dict:
+    def _get_config(self) -> Hashable:
+        return (self._pattern.pattern, self._pattern.flags)
+
+    def _parse(self, version: str) -> dict:
         """Perform the actual parsing."""
-        if matches := re.fullmatch(self.regex, version):
+        if matches := self._pattern.fullmatch(version):
             return matches.groupdict()
         else:
             raise ValueError(f"Version {version} does not match regex {self.regex}")
@@ -27,6 +90,8 @@ class RegexParser:
 class PEP440Parser(RegexParser):
     """Regex based PEP440 parser."""
 
+    _PRE_RELEASES = ("alpha", "beta", "rc")
+
     def __init__(self) -> None:
         regex = re.compile(
             r"(?:(?P<epoch>\d+)!)?"  # Epoch segment: N!
@@ -39,9 +104,9 @@ class PEP440Parser(RegexParser):
 
         super().__init__(regex=regex)
 
-    def __call__(self, version: str) -> dict:
+    def _parse(self, version: str) -> dict:
         """Parese version and perform some PEP440 defined normalizations."""
-        parsed = super().__call__(version)
+        parsed = super()._parse(version)
         if parsed["dev"] == "":
             parsed["dev"] = "0"
         result = {}
@@ -54,10 +119,62 @@ class PEP440Parser(RegexParser):
                     result[part] = value
         return result
 
+    def key(self, version: dict) -> Tuple[Any, ...]:
+        """Return key for sorting of parsed versions as defined by PEP440."""
+        release = [int(version.get(part, 0)) for part in ("major", "minor", "micro")]
+        while len(release) > 1 and release[-1] == 0:
+            release.pop()
+        pre_release: Tuple[int, ...] = (1,)
+        for index, part in enumerate(self._PRE_RELEASES):
+            if part in version:
+                pre_release = (0, index, int(version[part]))
+        if pre_release == (1,) and "post" not in version and "dev" in version:
+            # Development release of a final release is sorted before its pre-releases.
+            pre_release = (-1,)
+        local: Tuple[Any, ...] = (0,)
+        if "local" in version:
+            local = (1, tuple(_local_key(p) for p in re.split(r"[-_.]", version["local"])))
+        return (
+            int(version.get("epoch", 0)),
+            tuple(release),
+            pre_release,
+            (1, int(version["post"])) if "post" in version else (0,),
+            (0, int(version["dev"])) if "dev" in version else (1,),
+            local,
+        )
+
 
-class SemVerParser:
+def _local_key(part: str) -> Tuple[int, int, str]:
+    """Return key of a segment of a local version label, numbers are sorted after strings."""
+    if part.isdigit():
+        return (1, int(part), "")
+    return (0, 0, part.lower())
+
+
+class SemVerParser(BaseParser):
     """Semantic versioning parser."""
 
-    def __call__(self, version: str) -> dict:
+    def _parse(self, version: str) -> dict:
         """Parse SemVer version."""
+        import semver
+
         return cast(dict, semver.Version.parse(version).to_dict())
+
+    def key(self, version: dict) -> Tuple[Any, ...]:
+        """Return key for sorting of parsed versions by SemVer precedence."""
+        prerelease: Optional[str] = version.get("prerelease")
+        if prerelease is None:
+            prerelease_key: Tuple[Any, ...] = (1,)
+        else:
+            prerelease_key = (
+                0,
+                tuple(
+                    (0, int(i), "") if i.isdigit() else (1, 0, i) for i in prerelease.split(".")
+                ),
+            )
+        return (
+            int(version["major"]),
+            int(version["minor"]),
+            int(version["patch"]),
+            prerelease_key,
+        )
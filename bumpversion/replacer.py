@@ -1,6 +1,27 @@
 """Bumpversion replacers."""
+import hashlib
+import json
+import mmap
+import os
+import re
+import shutil
+from enum import Enum
 from pathlib import Path
-from typing import Any
+from tempfile import NamedTemporaryFile
+from typing import IO, Any, Dict, List, Optional, Set, Tuple, TypedDict, cast
+
+from .template import compile_template
+from .utils import get_cache_dir, write_cache
+
+
+class ReplaceMode(str, Enum):
+    """How the replacer modified the file."""
+
+    in_place = "in-place"
+    rewrite = "rewrite"
+
+    def __str__(self) -> str:
+        return self.value
 
 
 class SearchReplaceReplacer:
@@ -13,20 +34,377 @@ class SearchReplaceReplacer:
     ) -> None:
         self.search = search
         self.replace = replace
+        self._search_template = compile_template(search)
+        self._replace_template = compile_template(replace)
 
-    def __call__(self, *, path: Path, **kwargs: Any) -> None:
+    def __call__(self, *, path: Path, **kwargs: Any) -> ReplaceMode:
         """Replace version occurences in file."""
         with open(path, "r") as fh:
             file_content = fh.read()
 
-        if not self.search.format(**kwargs) in file_content:
+        search = self._search_template.format(**kwargs)
+        if search not in file_content:
+            raise RuntimeError("Pattern {} was not found in file {}".format(search, path))
+
+        replaced = file_content.replace(search, self._replace_template.format(**kwargs))
+
+        with open(path, "w") as fh:
+            fh.write(replaced)
+        return ReplaceMode.rewrite
+
+
+class StreamingSearchReplaceReplacer(SearchReplaceReplacer):
+    """Search and replace versions in file, processing it in chunks.
+
+    Only `chunk_size` characters (plus the length of the search pattern) are held in memory
+    at once, regardless of the file size. The result is written into a temporary file
+    which then replaces the original file.
+
+    .. code-block:: toml
+
+       [[bumpversion.file]]
+       path = "sbom.json"
+
+       [bumpversion.file.replacer]
+       cls = "bumpversion.StreamingSearchReplaceReplacer"
+       chunk_size = 65536
+    """
+
+    def __init__(
+        self,
+        search: str = "{current_version}",
+        replace: str = "{new_version}",
+        chunk_size: int = 1024 * 1024,
+    ) -> None:
+        super().__init__(search=search, replace=replace)
+        if chunk_size < 1:
+            raise ValueError(f"Chunk size must be positive, got {chunk_size}")
+        self.chunk_size = chunk_size
+
+    def _replace_stream(self, src: IO[str], dst: IO[str], search: str, replace: str) -> bool:
+        """Copy `src` to `dst` with replaced `search` and return whether it was found."""
+        found = False
+        buffer = ""
+        while True:
+            chunk = src.read(self.chunk_size)
+            buffer += chunk
+            pos = 0
+            while (index := buffer.find(search, pos)) != -1:
+                dst.write(buffer[pos:index])
+                dst.write(replace)
+                pos = index + len(search)
+                found = True
+            if not chunk:
+                dst.write(buffer[pos:])
+                return found
+            # Keep the end of buffer which may be a beginning of a match straddling the chunks.
+            keep = max(pos, len(buffer) - len(search) + 1)
+            dst.write(buffer[pos:keep])
+            buffer = buffer[keep:]
+
+    def __call__(self, *, path: Path, **kwargs: Any) -> ReplaceMode:
+        """Replace version occurences in file."""
+        search = self._search_template.format(**kwargs)
+        replace = self._replace_template.format(**kwargs)
+        if not search:
+            raise ValueError("Search pattern must not be empty")
+
+        with open(path, "r") as src, NamedTemporaryFile(
+            "w", dir=os.path.dirname(os.path.abspath(path)), delete=False
+        ) as dst:
+            try:
+                found = self._replace_stream(src, dst, search, replace)
+            except BaseException:
+                dst.close()
+                os.unlink(dst.name)
+                raise
+
+        if not found:
+            os.unlink(dst.name)
+            raise RuntimeError("Pattern {} was not found in file {}".format(search, path))
+
+        shutil.copymode(path, dst.name)
+        os.replace(dst.name, path)
+        return ReplaceMode.rewrite
+
+
+class BytesSearchReplaceReplacer(SearchReplaceReplacer):
+    """Search and replace versions in file on the level of bytes.
+
+    The file is neither decoded nor encoded, only the search and replace patterns are encoded
+    using `encoding`. The rest of the file, including its line endings, is left untouched.
+    """
+
+    def __init__(
+        self,
+        search: str = "{current_version}",
+        replace: str = "{new_version}",
+        encoding: str = "utf-8",
+    ) -> None:
+        super().__init__(search=search, replace=replace)
+        self.encoding = encoding
+
+    def _encode_patterns(self, **kwargs: Any) -> Tuple[bytes, bytes]:
+        """Return encoded search and replace patterns."""
+        search = self._search_template.format(**kwargs).encode(self.encoding)
+        replace = self._replace_template.format(**kwargs).encode(self.encoding)
+        if not search:
+            raise ValueError("Search pattern must not be empty")
+        return search, replace
+
+    def __call__(self, *, path: Path, **kwargs: Any) -> ReplaceMode:
+        """Replace version occurences in file."""
+        search, replace = self._encode_patterns(**kwargs)
+
+        with open(path, "rb") as fh:
+            file_content = fh.read()
+
+        if search not in file_content:
             raise RuntimeError(
-                "Pattern {} was not found in file {}".format(self.search.format(**kwargs), path)
+                "Pattern {} was not found in file {}".format(search.decode(self.encoding), path)
             )
 
-        replaced = file_content.replace(
-            self.search.format(**kwargs), self.replace.format(**kwargs)
+        with open(path, "wb") as fh:
+            fh.write(file_content.replace(search, replace))
+        return ReplaceMode.rewrite
+
+
+class MmapSearchReplaceReplacer(BytesSearchReplaceReplacer):
+    """Search and replace versions in file using a memory map.
+
+    If the replacement has the same length in bytes as the search pattern, the occurences are
+    overwritten in place, so only the matched bytes are written. Otherwise the file is rewritten
+    through a temporary file which replaces the original file.
+
+    Search and replace patterns are encoded using `encoding`.
+
+    Returns:
+        The :class:`ReplaceMode` used.
+    """
+
+    def _find_offsets(self, path: Path, data: mmap.mmap, search: bytes) -> List[int]:
+        """Return offsets of non-overlapping occurences of `search` in `data`."""
+        offsets = []
+        pos = 0
+        while (index := data.find(search, pos)) != -1:
+            offsets.append(index)
+            pos = index + len(search)
+        return offsets
+
+    def _replace(self, path: Path, search: bytes, replace: bytes) -> Tuple[ReplaceMode, List[int]]:
+        """Replace occurences of `search` in file.
+
+        Returns:
+            The :class:`ReplaceMode` used and offsets of the replacements in the new file.
+        """
+        with open(path, "r+b") as fh:
+            if os.fstat(fh.fileno()).st_size:
+                with mmap.mmap(fh.fileno(), 0) as data:
+                    offsets = self._find_offsets(path, data, search)
+                    if offsets and len(search) == len(replace):
+                        for offset in offsets:
+                            data[offset : offset + len(search)] = replace
+                        data.flush()
+                        return ReplaceMode.in_place, offsets
+                    elif offsets:
+                        self._rewrite(path, data, offsets, len(search), replace)
+                        shift = len(replace) - len(search)
+                        return ReplaceMode.rewrite, [o + i * shift for i, o in enumerate(offsets)]
+        raise RuntimeError(
+            "Pattern {} was not found in file {}".format(search.decode(self.encoding), path)
+        )
+
+    def __call__(self, *, path: Path, **kwargs: Any) -> ReplaceMode:
+        """Replace version occurences in file."""
+        search, replace = self._encode_patterns(**kwargs)
+        return self._replace(path, search, replace)[0]
+
+    @staticmethod
+    def _rewrite(
+        path: Path, data: mmap.mmap, offsets: List[int], length: int, replace: bytes
+    ) -> None:
+        """Rewrite file with replaced occurences through a temporary file."""
+        with NamedTemporaryFile(
+            "wb", dir=os.path.dirname(os.path.abspath(path)), delete=False
+        ) as dst:
+            try:
+                pos = 0
+                for offset in offsets:
+                    dst.write(data[pos:offset])
+                    dst.write(replace)
+                    pos = offset + length
+                dst.write(data[pos:])
+            except BaseException:
+                dst.close()
+                os.unlink(dst.name)
+                raise
+        shutil.copymode(path, dst.name)
+        os.replace(dst.name, path)
+
+
+class IndexedSearchReplaceReplacer(MmapSearchReplaceReplacer):
+    """Search and replace versions in file using a persistent index of occurences.
+
+    After each replacement, the size, modification time and inode of the file together with
+    offsets of the replaced occurences are stored in `index_dir`. If the file wasn't changed
+    since, the next bump goes straight to the stored offsets instead of scanning the file.
+    The stored occurences are verified before they are replaced. If the file was changed
+    or the verification fails, the file is scanned as usual.
+
+    Note that once the file is indexed, only the occurences replaced by the previous bump
+    are replaced until the file is changed.
+
+    Index is stored in `bumpversion` directory of the git directory by default.
+    If no `index_dir` is defined and the git directory is not found, no index is used.
+    """
+
+    def __init__(
+        self,
+        search: str = "{current_version}",
+        replace: str = "{new_version}",
+        encoding: str = "utf-8",
+        index_dir: Optional[str] = None,
+    ) -> None:
+        super().__init__(search=search, replace=replace, encoding=encoding)
+        self.index_dir = Path(index_dir) if index_dir is not None else get_cache_dir()
+
+    def _get_index_path(self, path: Path) -> Optional[Path]:
+        """Return path to index entry of file or None if index is not used."""
+        if self.index_dir is None:
+            return None
+        key = hashlib.sha256(os.fsencode(os.path.abspath(path))).hexdigest()
+        return self.index_dir / "occurrences" / f"{key}.json"
+
+    @staticmethod
+    def _get_fingerprint(path: Path) -> List[int]:
+        """Return fingerprint of the file state."""
+        stat = os.stat(path)
+        return [stat.st_size, stat.st_mtime_ns, stat.st_ino]
+
+    def _find_offsets(self, path: Path, data: mmap.mmap, search: bytes) -> List[int]:
+        """Return offsets of `search` from the index if valid, scan the file otherwise."""
+        index_path = self._get_index_path(path)
+        if index_path is not None:
+            try:
+                entry = json.loads(index_path.read_text())
+            except (OSError, ValueError):
+                pass
+            else:
+                offsets = entry["offsets"]
+                if (
+                    entry["pattern"] == search.hex()
+                    and entry["fingerprint"] == self._get_fingerprint(path)
+                    and all(data[o : o + len(search)] == search for o in offsets)
+                ):
+                    return cast(List[int], offsets)
+        return super()._find_offsets(path, data, search)
+
+    def _store_offsets(self, path: Path, pattern: bytes, offsets: List[int]) -> None:
+        """Store offsets of `pattern` in the file to the index."""
+        index_path = self._get_index_path(path)
+        if index_path is None:
+            return
+        entry = {
+            "path": os.path.abspath(path),
+            "pattern": pattern.hex(),
+            "fingerprint": self._get_fingerprint(path),
+            "offsets": offsets,
+        }
+        write_cache(index_path, json.dumps(entry))
+
+    def __call__(self, *, path: Path, **kwargs: Any) -> ReplaceMode:
+        """Replace version occurences in file."""
+        search, replace = self._encode_patterns(**kwargs)
+        mode, offsets = self._replace(path, search, replace)
+        self._store_offsets(path, replace, offsets)
+        return mode
+
+
+class PatternDefinition(TypedDict, total=False):
+    """Defines structure of patterns for :class:`MultiSearchReplaceReplacer`."""
+
+    search: str
+    """Search pattern.
+
+    Defaults to `{current_version}`.
+    """
+    replace: str
+    """Replace pattern.
+
+    Defaults to `{new_version}`.
+    """
+
+
+class MultiSearchReplaceReplacer:
+    """Search and replace several patterns in file at once.
+
+    All patterns are searched for in a single pass over the file content and all
+    replacements are written at once. At each position the longest matching pattern wins,
+    matches don't overlap and the replaced text is never searched again.
+    Every pattern has to be found in the file at least once.
+
+    .. code-block:: toml
+
+       [[bumpversion.file]]
+       path = "pyproject.toml"
+
+       [bumpversion.file.replacer]
+       cls = "bumpversion.MultiSearchReplaceReplacer"
+       patterns = [
+          {search = 'version = "{current_version}"', replace = 'version = "{new_version}"'},
+          {search = "sibling == {current_version}", replace = "sibling == {new_version}"},
+       ]
+    """
+
+    def __init__(self, patterns: List[PatternDefinition]) -> None:
+        if not patterns:
+            raise ValueError("At least one pattern must be defined")
+        self.patterns = patterns
+        self._templates = [
+            (
+                compile_template(pattern.get("search", "{current_version}")),
+                compile_template(pattern.get("replace", "{new_version}")),
+            )
+            for pattern in patterns
+        ]
+
+    def _get_replacements(self, **kwargs: Any) -> Dict[str, str]:
+        """Return mapping of formatted search patterns to formatted replacements."""
+        replacements: Dict[str, str] = {}
+        for search_template, replace_template in self._templates:
+            search = search_template.format(**kwargs)
+            replace = replace_template.format(**kwargs)
+            if not search:
+                raise ValueError("Search pattern must not be empty")
+            if replacements.setdefault(search, replace) != replace:
+                raise ValueError(f"Pattern {search} has conflicting replacements")
+        return replacements
+
+    def __call__(self, *, path: Path, **kwargs: Any) -> ReplaceMode:
+        """Replace version occurences in file."""
+        replacements = self._get_replacements(**kwargs)
+        # Longer patterns first, so the longest pattern matches at each position.
+        regex = re.compile(
+            "|".join(re.escape(s) for s in sorted(replacements, key=len, reverse=True))
         )
 
+        with open(path, "r") as fh:
+            file_content = fh.read()
+
+        found: Set[str] = set()
+
+        def _replace(match: "re.Match[str]") -> str:
+            found.add(match[0])
+            return replacements[match[0]]
+
+        replaced = regex.sub(_replace, file_content)
+
+        missing = [s for s in replacements if s not in found]
+        if missing:
+            raise RuntimeError(
+                "Patterns {} were not found in file {}".format(", ".join(missing), path)
+            )
+
         with open(path, "w") as fh:
             fh.write(replaced)
+        return ReplaceMode.rewrite
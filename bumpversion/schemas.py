@@ -1,6 +1,8 @@
 """Definitions of basic versioning schemas."""
 from enum import Enum
-from typing import Any, Dict
+from typing import Any, Dict, List
+
+from .constants import ChangeType
 
 
 class Schema(str, Enum):
@@ -26,6 +28,20 @@ SCHEMAS = {
 }
 
 
+AUTO_PARTS: Dict[Schema, Dict[ChangeType, List[str]]] = {
+    Schema.semver: {
+        ChangeType.breaking: ["major"],
+        ChangeType.feature: ["minor"],
+        ChangeType.fix: ["patch"],
+    },
+    Schema.pep440: {
+        ChangeType.breaking: ["major"],
+        ChangeType.feature: ["minor"],
+        ChangeType.fix: ["micro"],
+    },
+}
+
+
 def get_schema(schema: Schema, part: str) -> Dict[str, Any]:
     """Get schema definition."""
     try:
@@ -1,34 +1,23 @@
 """Bumpversion serializers."""
 import itertools
-from string import Formatter
-from typing import Any, List, Mapping, Sequence, Set, Union
+from typing import Dict, FrozenSet, List, Union
 
-import semver
+from .template import Template, compile_template
 
 
-class StrictFormatter(Formatter):
-    """Strict formatter.
+class FormatSerializer:
+    """Serialize version using python `format`.
 
-    Raises ValueError in case of unused kwargs.
+    Formats are indexed by the set of arguments they use, so only formats which use exactly
+    the parts of the version are tried.
     """
 
-    def check_unused_args(
-        self,
-        used_args: Set[Union[int, str]],
-        args: Sequence[Any],
-        kwargs: Mapping[str, Any],
-    ) -> None:
-        """Check that all args were used when filling format."""
-        if set(kwargs.keys()) > used_args:
-            raise TypeError("Too many arguments for format")
-
-
-class FormatSerializer:
-    """Serialize version using python `format`."""
-
     def __init__(self, formats: List[str]):
-        self.formatter = StrictFormatter()
         self.formats = formats
+        self._index: Dict[FrozenSet[Union[int, str]], List[Template]] = {}
+        for format in formats:
+            template = compile_template(format)
+            self._index.setdefault(template.fields, []).append(template)
 
     def __call__(self, version: dict, /) -> str:
         """Serialize using python `format`.
@@ -37,9 +26,9 @@ class FormatSerializer:
         Then check that all provided kwargs that weren't None were actually used.
         """
         version_dict = {k: v for k, v in version.items() if v is not None}
-        for format in self.formats:
+        for template in self._index.get(frozenset(version_dict), ()):
             try:
-                return self.formatter.format(format, **version_dict)
+                return template.format_strict(**version_dict)
             except (KeyError, TypeError):
                 pass
         raise ValueError("Version cannot be serialized")
@@ -68,4 +57,6 @@ class SemVerSerializer:
 
     def __call__(self, version: dict, /) -> str:
         """Serialize SemVer version."""
+        import semver
+
         return str(semver.Version(**version))
@@ -5,9 +5,15 @@ Currently supported locations are `.bumpversion.toml` and `pyproject.toml`
 (searched in that order). The first found is used.
 
 Arguments defined on CLI have a precedence over definition in configuration file.
+
+In a monorepo, each project in a subdirectory has its own configuration file.
+Paths of files maintained by a project are relative to the project directory.
 """
+import hashlib
+import json
 import os
-from typing import Any, Dict, List, Optional, Tuple, cast
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Tuple, cast
 
 import tomli
 from pydantic import (
@@ -17,14 +23,17 @@ from pydantic import (
     Field,
     FilePath,
     PrivateAttr,
+    ValidationError,
     root_validator,
     validator,
 )
 from pydantic.env_settings import SettingsSourceCallable
 from pydantic.fields import ModelField
 
-from .constants import Verbosity
-from .schemas import Schema, get_schema
+from . import __version__
+from .constants import ChangeType, DirtyScope, Verbosity, VersionSource
+from .schemas import AUTO_PARTS, Schema, get_schema
+from .utils import get_cache_dir, write_cache
 
 CONFIG_FILES = {
     ".bumpversion.toml": ["bumpversion"],
@@ -32,26 +41,61 @@ CONFIG_FILES = {
 }
 
 
-def _config_file_settings(settings: "Settings") -> Dict[str, Any]:
-    config_file = settings._config_file
-    sections = ["bumpversion"]
+def _find_config_file(config_file: Optional[str]) -> Tuple[Optional[str], List[str]]:
+    """Return config file to be used and sections with settings."""
     if config_file is None:
         for _config_file, _sections in CONFIG_FILES.items():
             if os.path.isfile(_config_file):
-                sections = _sections
-                config_file = _config_file
-                break
+                return _config_file, _sections
+        return None, []
+    return config_file, CONFIG_FILES.get(os.path.basename(config_file), ["bumpversion"])
+
+
+def _read_config_file(config_file: str, sections: List[str]) -> Optional[Dict[str, Any]]:
+    """Return settings from the config file or None if it doesn't contain any."""
+    with open(config_file) as file:
+        content = tomli.loads(file.read())
+    for section in sections:
+        if section not in content:
+            return None
+        content = content[section]
+    return content
+
+
+def _config_file_settings(settings: "Settings") -> Dict[str, Any]:
+    config_file, sections = _find_config_file(settings._config_file)
     if config_file:
-        with open(config_file) as file:
-            content = tomli.loads(file.read())
-            for section in sections:
-                content = content.get(section, {})
-            content.setdefault("file", [])
+        content = _read_config_file(config_file, sections) or {}
+        content.setdefault("file", [])
+        if settings._project_dir is not None:
+            for file in content["file"]:
+                if isinstance(file, dict) and "path" in file:
+                    file["path"] = os.path.join(settings._project_dir, file["path"])
+        if content.get("version_source") != VersionSource.tags:
+            # Current version isn't stored in the config file.
             content["file"].append({"path": config_file})
-            return content
+        return content
     return {}
 
 
+def find_config_files() -> Iterator[Tuple[str, str]]:
+    """Yield directories of projects in a monorepo and their config files.
+
+    Subdirectories of the working directory are searched, hidden directories are skipped.
+    Only the first config file with bumpversion settings found in a directory is used.
+    """
+    for directory, dirnames, filenames in os.walk(os.curdir):
+        dirnames[:] = sorted(d for d in dirnames if not d.startswith("."))
+        if directory == os.curdir:
+            continue
+        directory = os.path.normpath(directory)
+        for config_file, sections in CONFIG_FILES.items():
+            path = os.path.join(directory, config_file)
+            if config_file in filenames and _read_config_file(path, sections) is not None:
+                yield directory, path
+                break
+
+
 class Component(BaseModel):
     """Definition of a component in schema.
 
@@ -86,12 +130,22 @@ class Settings(BaseSettings):
     """Settings class."""
 
     _config_file: Optional[str] = PrivateAttr(None)
+    _project_dir: Optional[str] = PrivateAttr(None)
     _verbosity: Verbosity = PrivateAttr(Verbosity.INFO)
 
     dry_run: bool = False
     """Whether actual replacements are performered."""
     allow_dirty: bool = False
     """Whether to proceed with bumping even though the VCS directory is not in a clean state."""
+    dirty_scope: DirtyScope = DirtyScope.files
+    """
+    Which files are checked whether the VCS directory is clean.
+
+    * `files`: Only the maintained files are checked.
+    * `repo`: All files in the repository are checked.
+
+    Untracked files are always ignored.
+    """
     commit: bool = False
     """Whether to create a commit in VCS."""
     commit_message: str = "Bump version: {current_version} → {new_version}"
@@ -99,6 +153,7 @@ class Settings(BaseSettings):
     The commit message that will be used when creating a commit.
 
     The message can use `current_version` and `new_version` placeholders.
+    In monorepo mode, it can only use `projects` placeholder with a list of bumped projects.
     """
     commit_args: List[str] = []
     """Extra arguments to commit command.
@@ -123,6 +178,16 @@ class Settings(BaseSettings):
     """Whether to sign tags."""
     current_version: str = "0.0.0"
     """Current version in a string representation. It will be passed through `parser`."""
+    version_source: VersionSource = VersionSource.config
+    """
+    Where the current version is taken from.
+
+    * `config`: The `current_version` setting is used.
+    * `tags`: The latest version from tags matching `tag_name` is used.
+      The config file isn't bumped in that case.
+    """
+    jobs: int = Field(default=1, ge=1)
+    """Number of files bumped concurrently."""
     version_schema: Optional[Schema] = Field(default=Schema.semver, alias="schema", env="schema")
     """
     What versioning schema to use.
@@ -151,6 +216,20 @@ class Settings(BaseSettings):
     """
     file: List[File] = []
     """Definition for maintained files."""
+    vcs: Optional[Component] = None
+    """
+    Dotted path to a class that manages the version control system.
+
+    Detected automatically if not defined.
+    """
+    auto_parts: Dict[ChangeType, List[str]] = Field(default=None)  # type: ignore[assignment]
+    """
+    Parts bumped by the `--auto` option for each type of change since the last tag.
+
+    Keys are `breaking`, `feature` and `fix`. Defined by the schema if not defined,
+    e.g. `major`, `minor` and `patch` for `semver`. Pre-releases can be bumped instead,
+    e.g. by `fix = ["prerelease"]`.
+    """
 
     class Config:
         extra = Extra.ignore
@@ -170,10 +249,38 @@ class Settings(BaseSettings):
                 file_secret_settings,
             )
 
-    def __init__(self, *args: Any, config_file: Optional[str] = None, **kwargs: Any):
+    def __init__(
+        self,
+        *args: Any,
+        config_file: Optional[str] = None,
+        project_dir: Optional[str] = None,
+        **kwargs: Any,
+    ):
         self._config_file = config_file
+        self._project_dir = project_dir
         super().__init__(*args, **kwargs)
 
+    def copy_validated(self, **values: Any) -> "Settings":
+        """Return a copy of settings updated by validated values.
+
+        Only fields which other fields don't depend on may be updated.
+
+        Raises:
+            ValidationError: If any of the values is not valid.
+        """
+        validated: Dict[str, Any] = {}
+        errors = []
+        for name, value in values.items():
+            field = self.__fields__[name]
+            validated[name], error = field.validate(
+                value, validated, loc=field.alias, cls=type(self)
+            )
+            if error:
+                errors.append(error)
+        if errors:
+            raise ValidationError(errors, type(self))
+        return self.copy(update=validated)
+
     @root_validator
     def schema_definiton(cls, values: Dict[str, Any]) -> Dict[str, Any]:
         """Check that either schema is defined or all necessary components are defined."""
@@ -221,3 +328,116 @@ class Settings(BaseSettings):
         if v is None and values.get("version_schema") is not None:
             v = get_schema(cast(Schema, values.get("version_schema")), field.name)
         return v
+
+    @validator("auto_parts", pre=True, always=True)
+    def fill_auto_parts(
+        cls, v: Optional[Dict[str, List[str]]], values: Dict[str, Any]
+    ) -> Dict[ChangeType, List[str]]:
+        """Fill parts bumped for the types of changes missing in the definition."""
+        schema = values.get("version_schema") or Schema.semver
+        defined = {ChangeType(change): parts for change, parts in (v or {}).items()}
+        return {**AUTO_PARTS[schema], **defined}
+
+
+def _get_cache_key(
+    config_file: Optional[str], found_config_file: str, project_dir: Optional[str]
+) -> Dict[str, Any]:
+    """Return key of settings loaded from the config file in a persistent cache."""
+    with open(found_config_file, "rb") as fh:
+        stat = os.fstat(fh.fileno())
+        content = fh.read()
+    env_names = set()
+    for field in Settings.__fields__.values():
+        env_names.update(field.field_info.extra.get("env_names", ()))
+    return {
+        "version": __version__,
+        "cwd": os.getcwd(),
+        "config_file": config_file,
+        "project_dir": project_dir,
+        "path": os.path.abspath(found_config_file),
+        "mtime": stat.st_mtime_ns,
+        "size": stat.st_size,
+        "hash": hashlib.sha256(content).hexdigest(),
+        "environ": {k: v for k, v in os.environ.items() if k.lower() in env_names},
+    }
+
+
+def _json_default(value: Any) -> Any:
+    if isinstance(value, Path):
+        return os.fspath(value)
+    raise TypeError(f"Object of type {type(value).__name__} can't be cached")
+
+
+def _construct_settings(values: Dict[str, Any]) -> Settings:
+    """Return settings from cached values without validation."""
+    # Components are trivial to validate, `construct` can't be used because of the `cls` key.
+    values = values.copy()
+    for name in ("bumper", "parser", "serializer", "replacer", "vcs"):
+        if values.get(name) is not None:
+            values[name] = Component.parse_obj(values[name])
+    values["file"] = [
+        File.construct(
+            **{
+                **file,
+                "path": Path(file["path"]),
+                "serializer": Component.parse_obj(file["serializer"]),
+                "replacer": Component.parse_obj(file["replacer"]),
+            }
+        )
+        for file in values["file"]
+    ]
+    values["dirty_scope"] = DirtyScope(values["dirty_scope"])
+    values["version_source"] = VersionSource(values["version_source"])
+    values["auto_parts"] = {ChangeType(k): v for k, v in values["auto_parts"].items()}
+    if values["version_schema"] is not None:
+        values["version_schema"] = Schema(values["version_schema"])
+    return Settings.construct(**values)
+
+
+def load_settings(
+    config_file: Optional[str] = None, *, project_dir: Optional[str] = None
+) -> Settings:
+    """Return settings loaded from the config file and environment.
+
+    If `project_dir` is defined, paths of maintained files are relative to that directory.
+
+    Validated settings are stored in a persistent cache in the directory returned by
+    :func:`bumpversion.utils.get_cache_dir`, one entry for each config file and working
+    directory. The cache is keyed by the path, modification time and hash of the config file,
+    working directory and environment variables with settings.
+    If the key matches and all the maintained files exist, settings are restored from the cache
+    without parsing and validation.
+    """
+    found_config_file = _find_config_file(config_file)[0]
+    cache_dir = get_cache_dir()
+    if found_config_file is None or cache_dir is None:
+        return Settings(config_file=config_file, project_dir=project_dir)
+
+    try:
+        key_data = _get_cache_key(config_file, found_config_file, project_dir)
+    except OSError:
+        return Settings(config_file=config_file, project_dir=project_dir)
+    key = json.dumps(key_data, sort_keys=True)
+    # Entry is named by the loaded configuration, so it's replaced once the key changes.
+    identity = json.dumps(
+        [key_data["cwd"], key_data["path"], key_data["config_file"], key_data["project_dir"]]
+    )
+    cache_path = cache_dir / "settings" / f"{hashlib.sha256(identity.encode()).hexdigest()}.json"
+    try:
+        entry = json.loads(cache_path.read_text())
+    except (OSError, ValueError):
+        pass
+    else:
+        # Maintained files aren't part of the key, validate settings if any of them is missing.
+        files = entry["settings"]["file"] if entry["key"] == key else None
+        if files is not None and all(os.path.isfile(file["path"]) for file in files):
+            return _construct_settings(entry["settings"])
+
+    settings = Settings(config_file=config_file, project_dir=project_dir)
+    try:
+        data = json.dumps({"key": key, "settings": settings.dict()}, default=_json_default)
+    except TypeError:
+        # Settings with values which can't be stored are not cached.
+        return settings
+    write_cache(cache_path, data)
+    return settings
@@ -0,0 +1,150 @@
+"""Versions derived from tags in version control system."""
+import bisect
+import hashlib
+import json
+from typing import TYPE_CHECKING, Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from . import __version__
+from .template import compile_template
+from .utils import get_cache_dir, write_cache
+from .vcs import AbstractVcs
+
+if TYPE_CHECKING:  # pragma: no cover
+    from .parser import BaseParser
+
+_MARKER = "\0"
+_UNKNOWN = object()
+
+
+def get_tag_affixes(tag_name: str, project: Optional[str] = None) -> Tuple[str, str]:
+    """Return prefix and suffix of tags created from the tag name template.
+
+    Arguments:
+        tag_name: Template of the tag name.
+        project: Directory of a project in monorepo.
+
+    Raises:
+        ValueError: If the template uses other placeholders than `new_version` and `project`
+            or doesn't use `new_version` exactly once.
+    """
+    try:
+        tag = compile_template(tag_name).format(new_version=_MARKER, project=project)
+    except KeyError as error:
+        raise ValueError(
+            f"Tag name {tag_name} can only use new_version and project placeholders."
+        ) from error
+    if tag.count(_MARKER) != 1:
+        raise ValueError(f"Tag name {tag_name} must use new_version exactly once.")
+    prefix, suffix = tag.split(_MARKER)
+    return prefix, suffix
+
+
+class VersionIndex:
+    """Versions sorted by the keys of their parser.
+
+    Queries for the latest version are answered by a binary search.
+
+    Arguments:
+        entries: Pairs of key and version. Keys are compared in their JSON form.
+    """
+
+    def __init__(self, entries: Iterable[Sequence[Any]]) -> None:
+        self.entries: List[Tuple[Any, str]] = sorted(json.loads(json.dumps(list(entries))))
+        self._keys = [key for key, _ in self.entries]
+
+    @classmethod
+    def from_versions(cls, parser: "BaseParser", versions: Iterable[str]) -> "VersionIndex":
+        """Return index of the versions, versions which can't be parsed are skipped."""
+        entries = []
+        for version in versions:
+            try:
+                parsed = parser(version)
+            except ValueError:
+                continue
+            entries.append((parser.key(parsed), version))
+        return cls(entries)
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def latest(self, before: Optional[Sequence[Any]] = None) -> Optional[str]:
+        """Return the latest version or None if there is no such version.
+
+        Arguments:
+            before: If defined, return the latest version with a lower key, e.g. the latest
+                release of the previous major version.
+        """
+        if before is None:
+            index = len(self._keys)
+        else:
+            index = bisect.bisect_left(self._keys, json.loads(json.dumps(before)))
+        if not index:
+            return None
+        return self.entries[index - 1][1]
+
+
+class TagVersions:
+    """Versions from tags in version control system.
+
+    All tags are listed by a single query to VCS. Indexes of versions are stored in a persistent
+    cache in the directory returned by :func:`bumpversion.utils.get_cache_dir`. The cache is keyed
+    by the state of tags in VCS, the parser configuration and the affixes of tags, so the tags are
+    listed and parsed again only if any of them change.
+    """
+
+    def __init__(self, vcs: AbstractVcs) -> None:
+        self.vcs = vcs
+        self._tags: Optional[List[str]] = None
+        self._state: Any = _UNKNOWN
+
+    def _get_tags(self) -> List[str]:
+        if self._tags is None:
+            self._tags = self.vcs.get_tags()
+        return self._tags
+
+    def _build_index(self, parser: "BaseParser", prefix: str, suffix: str) -> VersionIndex:
+        end = -len(suffix) or None
+        versions = (
+            tag[len(prefix) : end]
+            for tag in self._get_tags()
+            if len(tag) > len(prefix) + len(suffix)
+            and tag.startswith(prefix)
+            and tag.endswith(suffix)
+        )
+        return VersionIndex.from_versions(parser, versions)
+
+    def get_index(
+        self, parser: "BaseParser", config: Dict[str, Any], prefix: str, suffix: str
+    ) -> VersionIndex:
+        """Return index of versions from tags with the prefix and suffix.
+
+        Arguments:
+            parser: Parser of the versions.
+            config: Configuration of the parser, a part of the cache key.
+            prefix: Prefix of the tags.
+            suffix: Suffix of the tags.
+        """
+        if self._state is _UNKNOWN:
+            self._state = self.vcs.get_tags_state()
+        cache_dir = get_cache_dir()
+        if self._state is None or cache_dir is None:
+            return self._build_index(parser, prefix, suffix)
+
+        identity = {"parser": config, "prefix": prefix, "suffix": suffix}
+        key = json.dumps(
+            {"version": __version__, "state": self._state, **identity}, sort_keys=True
+        )
+        # Entry is named without the tags state, so it's replaced once tags change.
+        name = hashlib.sha256(json.dumps(identity, sort_keys=True).encode()).hexdigest()
+        cache_path = cache_dir / "tags" / f"{name}.json"
+        try:
+            entry = json.loads(cache_path.read_text())
+        except (OSError, ValueError):
+            pass
+        else:
+            if entry["key"] == key:
+                return VersionIndex(entry["entries"])
+
+        index = self._build_index(parser, prefix, suffix)
+        write_cache(cache_path, json.dumps({"key": key, "entries": index.entries}))
+        return index
@@ -0,0 +1,65 @@
+"""Precompiled format templates."""
+import re
+from functools import lru_cache
+from string import Formatter
+from typing import Any, FrozenSet, Set, Union
+
+# Argument name is followed by any number of `.attribute` or `[index]` accessors.
+_ACCESSOR_REGEX = re.compile(r"[.\[]")
+
+
+def get_format_fields(format: str) -> FrozenSet[Union[int, str]]:
+    """Return names of arguments used by a format string.
+
+    Positional arguments are returned as integers, automatically numbered fields
+    as an empty string.
+    """
+    fields: Set[Union[int, str]] = set()
+    for _, field_name, format_spec, _ in Formatter().parse(format):
+        if field_name is not None:
+            arg_name = _ACCESSOR_REGEX.split(field_name, 1)[0]
+            fields.add(int(arg_name) if arg_name.isdigit() else arg_name)
+        if format_spec:
+            fields.update(get_format_fields(format_spec))
+    return frozenset(fields)
+
+
+class Template:
+    """Format string with arguments extracted only once.
+
+    Names of arguments used by the format are extracted by `string.Formatter` when the template
+    is created. Formatting itself is performed by `str.format_map`, which parses the format
+    string in C, so the slow Python-level parsing of `string.Formatter` isn't repeated.
+    """
+
+    def __init__(self, format: str) -> None:
+        self.format_string = format
+        self.fields = get_format_fields(format)
+
+    def __repr__(self) -> str:
+        return f"Template({self.format_string!r})"
+
+    def format(self, **kwargs: Any) -> str:
+        """Fill the template with keyword arguments."""
+        return self.format_string.format_map(kwargs)
+
+    def format_strict(self, **kwargs: Any) -> str:
+        """Fill the template with keyword arguments and check all of them were used.
+
+        Raises:
+            KeyError: If an argument used by the template is missing.
+            TypeError: If some of the arguments are not used by the template.
+        """
+        result = self.format_string.format_map(kwargs)
+        if not self.fields.issuperset(kwargs):
+            raise TypeError("Too many arguments for format")
+        return result
+
+
+@lru_cache(maxsize=1024)
+def compile_template(format: str) -> Template:
+    """Return template for a format string.
+
+    Templates are cached, so each format string is parsed only once.
+    """
+    return Template(format)
@@ -0,0 +1,172 @@
+"""Benchmarks locking in the performance optimizations."""
+import os
+import subprocess  # nosec
+import sys
+import timeit
+from pathlib import Path
+from typing import Any, Dict, List, Set, Tuple
+from unittest import TestCase, skipUnless
+
+import bumpversion
+from bumpversion.bumper import RegexBumper
+from bumpversion.parser import PEP440Parser, _parse_cached
+
+BENCHMARKS = bool(os.environ.get("BUMPVERSION_BENCHMARKS"))
+"""Whether to run timing benchmarks, which are skipped by default."""
+
+
+class ParserBenchmarkTest(TestCase):
+    """Benchmarks of parsers."""
+
+    # Historical tags parsed repeatedly, e.g. by release tooling.
+    versions = [f"{i % 5}.{i % 7}.{i % 11}rc{i % 3}.post{i % 2}" for i in range(200)] * 50
+
+    def test_parse_many_cached(self):
+        parser = PEP440Parser()
+        _parse_cached.cache_clear()
+
+        for _ in parser.parse_many(self.versions):
+            pass
+
+        unique = len(set(self.versions))
+        self.assertEqual(_parse_cached.cache_info().misses, unique)
+        self.assertEqual(_parse_cached.cache_info().hits, len(self.versions) - unique)
+
+    @skipUnless(BENCHMARKS, "Set BUMPVERSION_BENCHMARKS to run timing benchmarks.")
+    def test_parse_many_cached_timing(self):
+        parser = PEP440Parser()
+
+        def parse_uncached() -> None:
+            for version in self.versions:
+                parser._parse(version)
+
+        def parse_cached() -> None:
+            for _ in parser.parse_many(self.versions):
+                pass
+
+        _parse_cached.cache_clear()
+        uncached = min(timeit.repeat(parse_uncached, number=1, repeat=3))
+        cached = min(timeit.repeat(parse_cached, number=1, repeat=3))
+
+        self.assertLess(
+            cached,
+            uncached,
+            msg=f"{len(self.versions) / cached:.0f} cached vs {len(self.versions) / uncached:.0f} "
+            "uncached versions per second",
+        )
+
+
+class LegacyRegexBumper(RegexBumper):
+    """RegexBumper implementation before the bump plan was introduced."""
+
+    def __call__(self, version: Dict[str, Any], bumped_parts: List[str]) -> Dict[str, Any]:
+        new_version = version.copy()
+        for part in bumped_parts:
+            parsed_version = new_version.get(part)
+            if parsed_version is None:
+                new_version[part] = str(self.parts.get(part, {}).get("start", 1))
+            else:
+                new_version[part] = self._increase_number(parsed_version)
+            bumped_index = list(new_version).index(part)
+            keys_to_null = list(new_version)[bumped_index + 1 :]
+            for key in keys_to_null:
+                if new_version[key].isnumeric() and self.parts.get(key, {}).get("final", True):
+                    new_version[key] = "0"
+                else:
+                    del new_version[key]
+        return new_version
+
+
+class RegexBumperBenchmarkTest(TestCase):
+    """Benchmarks of RegexBumper."""
+
+    parts: Dict = {f"part{i}": {"final": bool(i % 2)} for i in range(32)}
+    version = {f"part{i}": f"p{i}" if i % 8 == 0 else str(i) for i in range(32)}
+    bumped_parts = ["part24", "part16", "part8", "part0"]
+
+    def test_bump_plan(self):
+        bumper = RegexBumper(parts=self.parts)
+        # Part definitions are resolved into the bump plan, they aren't looked up while bumping.
+        bumper.parts = None  # type: ignore[assignment]
+
+        result = bumper(self.version, self.bumped_parts)
+
+        self.assertEqual(result, {"part0": "p1", **{f"part{i}": "0" for i in range(1, 32, 2)}})
+
+    @skipUnless(BENCHMARKS, "Set BUMPVERSION_BENCHMARKS to run timing benchmarks.")
+    def test_bump_timing(self):
+        bumper = RegexBumper(parts=self.parts)
+        legacy_bumper = LegacyRegexBumper(parts=self.parts)
+        self.assertEqual(
+            bumper(self.version, self.bumped_parts), legacy_bumper(self.version, self.bumped_parts)
+        )
+
+        # Measurements are interleaved and the best of them is taken to filter out noise.
+        legacy_times, planned_times = [], []
+        for _ in range(15):
+            legacy_times.append(
+                timeit.timeit(lambda: legacy_bumper(self.version, self.bumped_parts), number=2000)
+            )
+            planned_times.append(
+                timeit.timeit(lambda: bumper(self.version, self.bumped_parts), number=2000)
+            )
+        legacy, planned = min(legacy_times), min(planned_times)
+
+        self.assertLess(
+            planned,
+            legacy,
+            msg=f"{2000 / planned:.0f} vs legacy {2000 / legacy:.0f} bumps per second",
+        )
+
+
+IMPORT_TIME_BUDGET = 1.0
+"""Maximal time in seconds to import the command line interface."""
+
+
+def run_import(code: str) -> Tuple[Set[str], Dict[str, int]]:
+    """Run code in a new interpreter.
+
+    Returns:
+        Loaded modules and cumulative import times of modules in microseconds.
+    """
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"{code}; import sys; print(*sys.modules)"],
+        cwd=Path(bumpversion.__file__).parent.parent,
+        check=True,
+        capture_output=True,
+        text=True,
+    )  # nosec
+    times = {}
+    for line in result.stderr.splitlines()[1:]:
+        _, cumulative, name = line.split("|")
+        times[name.strip()] = int(cumulative)
+    return set(result.stdout.split()), times
+
+
+class ImportBenchmarkTest(TestCase):
+    """Benchmarks of import time."""
+
+    def test_import_package(self):
+        modules, _ = run_import("import bumpversion")
+
+        self.assertNotIn("semver", modules)
+        self.assertEqual([m for m in modules if m.startswith("bumpversion.")], [])
+
+    def test_import_main(self):
+        modules, times = run_import("import bumpversion.main")
+
+        self.assertNotIn("semver", modules)
+        for module in ("bumper", "parser", "replacer", "serializer"):
+            self.assertNotIn(f"bumpversion.{module}", modules)
+        self.assertLess(
+            times["bumpversion.main"] / 1e6,
+            IMPORT_TIME_BUDGET,
+            msg=f"Import of bumpversion.main takes {times['bumpversion.main'] / 1e3:.0f} ms",
+        )
+
+    def test_lazy_component(self):
+        modules, _ = run_import("import bumpversion; bumpversion.PEP440Parser")
+
+        self.assertIn("bumpversion.parser", modules)
+        self.assertNotIn("bumpversion.bumper", modules)
+        self.assertNotIn("semver", modules)
@@ -1,7 +1,11 @@
 """Unittests for bumper module."""
+import itertools
 from unittest import TestCase
 
+import semver
+
 from bumpversion.bumper import RegexBumper, SemVerBumper
+from bumpversion.parser import RegexParser
 
 
 class SemVerBumperTest(TestCase):
@@ -178,3 +182,89 @@ class RegexBumperTest(TestCase):
         for part, result in scenarios.items():
             with self.subTest(part=part, result=result):
                 self.assertEqual(bumper(version=version, bumped_parts=part.split(" ")), result)
+
+    def test_bump_optional_part(self):
+        parser = RegexParser(r"(?P<major>\d+)\.(?P<minor>\d+)(?:rc(?P<rc>\d+))?")
+        bumper = RegexBumper(parts={"rc": {"final": False}})
+        version = parser("1.2")
+        scenarios = {
+            "rc": {"major": "1", "minor": "2", "rc": "1"},
+            "minor": {"major": "1", "minor": "3"},
+            "minor rc": {"major": "1", "minor": "3", "rc": "1"},
+        }
+        for part, result in scenarios.items():
+            with self.subTest(part=part, result=result):
+                self.assertEqual(bumper(version=version, bumped_parts=part.split(" ")), result)
+
+    def test_bump_many_parts(self):
+        bumper = RegexBumper(parts={f"part{i}": {"final": bool(i % 2)} for i in range(8)})
+        version = {f"part{i}": f"p{i}" if i % 4 == 0 else str(i) for i in range(8)}
+        scenarios = {
+            "part4": {
+                "part0": "p0",
+                "part1": "1",
+                "part2": "2",
+                "part3": "3",
+                "part4": "p5",
+                "part5": "0",
+                "part7": "0",
+            },
+            "part4 part0": {"part0": "p1", "part1": "0", "part3": "0", "part5": "0", "part7": "0"},
+            "part2 part5": {
+                "part0": "p0",
+                "part1": "1",
+                "part2": "3",
+                "part3": "0",
+                "part5": "1",
+                "part7": "0",
+            },
+        }
+        for part, result in scenarios.items():
+            with self.subTest(part=part, result=result):
+                self.assertEqual(bumper(version=version, bumped_parts=part.split(" ")), result)
+
+
+class SequenceTest(TestCase):
+    """Unittests for sequence of bumpers."""
+
+    def test_regex_sequence(self):
+        bumper = RegexBumper(parts={"micro": {"final": False}, "rc": {"final": False}})
+        steps = itertools.cycle([["micro", "rc"], ["rc"], ["minor"]])
+
+        versions = bumper.sequence({"major": "1", "minor": "0"}, steps)
+
+        self.assertEqual(
+            list(itertools.islice(versions, 4)),
+            [
+                {"major": "1", "minor": "0", "micro": "1", "rc": "1"},
+                {"major": "1", "minor": "0", "micro": "1", "rc": "2"},
+                {"major": "1", "minor": "1"},
+                {"major": "1", "minor": "1", "micro": "1", "rc": "1"},
+            ],
+        )
+
+    def test_regex_sequence_copies(self):
+        bumper = RegexBumper()
+        version = {"major": "1"}
+
+        versions = list(bumper.sequence(version, [["major"], [], ["major"]]))
+
+        self.assertEqual(versions, [{"major": "2"}, {"major": "2"}, {"major": "3"}])
+        self.assertEqual(version, {"major": "1"})
+        self.assertEqual(len({id(v) for v in versions}), 3)
+
+    def test_semver_sequence(self):
+        bumper = SemVerBumper()
+        steps = [("patch", "prerelease"), ("prerelease",), ("patch",), ("minor",)]
+
+        versions = bumper.sequence({"major": 1, "minor": 0, "patch": 0}, steps)
+
+        self.assertEqual(
+            [str(semver.Version(**v)) for v in versions],
+            ["1.0.1-rc.1", "1.0.1-rc.2", "1.0.1", "1.1.0"],
+        )
+
+    def test_sequence_empty(self):
+        for bumper in (RegexBumper(), SemVerBumper()):
+            with self.subTest(bumper=bumper):
+                self.assertEqual(list(bumper.sequence({"major": 1}, [])), [])
@@ -0,0 +1,51 @@
+from typing import List
+from unittest import TestCase
+
+from bumpversion.commits import classify_commit, get_change_type
+from bumpversion.constants import ChangeType
+
+
+class ClassifyCommitTest(TestCase):
+    def test_classify(self):
+        data = (
+            ("feat: Add option", ChangeType.feature),
+            ("fix: Fix bug\n\nDetails\n", ChangeType.fix),
+            ("Fix(parser): Fix bug", ChangeType.fix),
+            ("feat!: Drop option", ChangeType.breaking),
+            ("refactor(main)!: Drop option", ChangeType.breaking),
+            ("fix: Fix bug\n\nBREAKING CHANGE: Option removed\n", ChangeType.breaking),
+            ("feat: Add option\n\nBREAKING-CHANGE: Option renamed", ChangeType.breaking),
+            ("docs: Update docs", None),
+            ("docs: Mention\n\nthe BREAKING CHANGE: in text", None),
+            ("Merge branch 'feat: option'", None),
+            ("Fix bug", None),
+            ("", None),
+        )
+        for message, change_type in data:
+            with self.subTest(message=message):
+                self.assertEqual(classify_commit(message), change_type)
+
+
+class GetChangeTypeTest(TestCase):
+    def test_highest(self):
+        self.assertEqual(get_change_type(["fix: A", "feat: B", "docs: C"]), ChangeType.feature)
+
+    def test_none(self):
+        self.assertIsNone(get_change_type(["docs: A", "chore: B"]))
+        self.assertIsNone(get_change_type([]))
+
+    def test_stop_early(self):
+        consumed: List[str] = []
+
+        def messages():
+            for message in ("fix: A", "feat!: B", "feat: C"):
+                consumed.append(message)
+                yield message
+
+        generator = messages()
+
+        self.assertEqual(get_change_type(generator), ChangeType.breaking)
+        self.assertEqual(consumed, ["fix: A", "feat!: B"])
+        # Generator is closed, so the stream is released.
+        with self.assertRaises(StopIteration):
+            next(generator)
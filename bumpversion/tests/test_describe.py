@@ -0,0 +1,125 @@
+import os
+from typing import Dict, List, Optional
+from unittest import TestCase
+from unittest.mock import patch
+
+from testfixtures import TempDirectory
+
+from bumpversion.describe import (
+    Distance,
+    get_cache_key,
+    get_distances,
+    load_distances,
+    store_distances,
+)
+
+# History with first parents: e <- d <- c <- b <- a, x is a root of an unrelated line.
+FIRST_PARENTS: Dict[str, Optional[str]] = {
+    "e": "d",
+    "d": "c",
+    "c": "b",
+    "b": "a",
+    "a": None,
+    "x": None,
+}
+
+
+class Walk:
+    """Walk of the first parents which records the walked commits."""
+
+    def __init__(self) -> None:
+        self.walked: List[str] = []
+
+    def __call__(self, revisions):
+        seen = set()
+        for revision in revisions:
+            commit: Optional[str] = revision
+            while commit is not None and commit not in seen:
+                seen.add(commit)
+                self.walked.append(commit)
+                yield commit, FIRST_PARENTS[commit]
+                commit = FIRST_PARENTS[commit]
+
+
+class GetDistancesTest(TestCase):
+    def test_distances(self):
+        distances: Dict[str, Distance] = {}
+        walk = Walk()
+
+        result = get_distances(["e", "b"], {"b": "1.0"}, distances, walk)
+
+        self.assertEqual(result, {"e": ("1.0", 3), "b": ("1.0", 0)})
+        # Walk stops once all the commits are resolved.
+        self.assertNotIn("a", walk.walked)
+        self.assertEqual(distances["c"], ("1.0", 1))
+
+    def test_latest_tag(self):
+        result = get_distances(["e"], {"b": "1.0", "d": "1.1"}, {}, Walk())
+
+        self.assertEqual(result, {"e": ("1.1", 1)})
+
+    def test_incremental(self):
+        distances: Dict[str, Distance] = {"d": ("1.0", 2)}
+        walk = Walk()
+
+        result = get_distances(["e", "d"], {"b": "1.0"}, distances, walk)
+
+        self.assertEqual(result, {"e": ("1.0", 3), "d": ("1.0", 2)})
+        self.assertEqual(walk.walked, ["e"])
+
+    def test_resolved(self):
+        walk = Walk()
+
+        result = get_distances(["b"], {"b": "1.0"}, {"c": ("1.0", 1)}, walk)
+
+        self.assertEqual(result, {"b": ("1.0", 0)})
+        self.assertEqual(walk.walked, [])
+
+    def test_no_tag(self):
+        result = get_distances(["c", "x"], {}, {}, Walk())
+
+        self.assertEqual(result, {"c": None, "x": None})
+
+
+class CacheTest(TestCase):
+    def setUp(self):
+        self.cache_dir = TempDirectory()
+        environ = patch.dict(os.environ, {"BUMPVERSION_CACHE_DIR": self.cache_dir.path})
+        environ.start()
+        self.addCleanup(environ.stop)
+
+    def tearDown(self):
+        self.cache_dir.cleanup()
+
+    def test_store(self):
+        key = get_cache_key({"b": "1.0"})
+
+        store_distances(key, {"c": ("1.0", 1), "x": None})
+
+        self.assertEqual(load_distances(key), {"c": ("1.0", 1), "x": None})
+        self.assertEqual(load_distances(get_cache_key({"b": "1.1"})), {})
+
+    def test_store_replaced(self):
+        store_distances(get_cache_key({"b": "1.0"}), {"c": ("1.0", 1)})
+        key = get_cache_key({"b": "1.1"})
+
+        store_distances(key, {"c": ("1.1", 1)})
+
+        self.assertEqual(load_distances(key), {"c": ("1.1", 1)})
+        self.assertEqual(load_distances(get_cache_key({"b": "1.0"})), {})
+        self.assertEqual(
+            os.listdir(os.path.join(self.cache_dir.path, "describe")), ["distances.json"]
+        )
+
+    def test_no_cache_dir(self):
+        key = get_cache_key({"b": "1.0"})
+        cwd = os.getcwd()
+        # Cache isn't available outside of a git repository.
+        os.chdir(self.cache_dir.path)
+        self.addCleanup(os.chdir, cwd)
+
+        with patch.dict(os.environ, {"BUMPVERSION_CACHE_DIR": ""}):
+            store_distances(key, {"c": ("1.0", 1)})
+            self.assertEqual(load_distances(key), {})
+
+        self.assertEqual(os.listdir(self.cache_dir.path), [])
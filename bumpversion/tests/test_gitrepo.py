@@ -0,0 +1,371 @@
+import os
+from pathlib import Path
+from typing import Optional, cast
+from unittest import TestCase
+from unittest.mock import patch
+
+from testfixtures import TempDirectory
+
+from bumpversion.gitrepo import (
+    Repository,
+    UnsupportedRepositoryError,
+    _cleanup_message,
+    _parse_config,
+)
+
+from .utils import GitRepoMixin
+
+
+class RepositoryTest(GitRepoMixin, TestCase):
+    def get_repository(self, path: Optional[Path] = None) -> Repository:
+        repository = Repository.discover(path)
+        self.assertIsNotNone(repository)
+        return cast(Repository, repository)
+
+    def test_discover(self):
+        self.tmp_dir.makedir("sub/dir")
+        repository = self.get_repository(Path(self.tmp_dir.path, "sub", "dir"))
+
+        self.assertEqual(repository.work_tree, Path(self.tmp_dir.path))
+        self.assertEqual(repository.git_dir, Path(self.tmp_dir.path, ".git"))
+        self.assertEqual(repository.common_dir, Path(self.tmp_dir.path, ".git"))
+
+    def test_discover_worktree(self):
+        worktree = os.path.join(self.tmp_dir.path, "worktree")
+        self.git("worktree", "add", "--quiet", worktree)
+
+        repository = self.get_repository(Path(worktree))
+
+        self.assertEqual(repository.work_tree, Path(worktree))
+        self.assertEqual(
+            repository.git_dir, Path(self.tmp_dir.path, ".git", "worktrees", "worktree")
+        )
+        self.assertEqual(repository.common_dir, Path(self.tmp_dir.path, ".git"))
+
+    def test_discover_none(self):
+        with TempDirectory() as tmp_dir:
+            self.assertIsNone(Repository.discover(Path(tmp_dir.path)))
+
+    def test_read_index(self):
+        self.tmp_dir.write("dir/a.txt", "a\n")
+        self.tmp_dir.write("dir/b.txt", "b\n")
+        self.git("add", "dir")
+        self.git("commit", "--quiet", "--message", "Dir")
+        for version in ("2", "3", "4"):
+            with self.subTest(version=version):
+                self.git("update-index", "--index-version", version)
+
+                index = self.get_repository().read_index()
+
+                self.assertEqual(list(index.entries), ["dir/a.txt", "dir/b.txt", "file.txt"])
+                entry = index.entries["dir/b.txt"]
+                self.assertEqual(entry.sha, self.git("rev-parse", ":dir/b.txt"))
+                self.assertEqual(entry.size, 2)
+                self.assertEqual(entry.mode, 0o100644)
+                self.assertEqual(index.tree, self.git("rev-parse", "HEAD^{tree}"))
+
+    def test_read_index_extended_flags(self):
+        self.tmp_dir.write("new.txt", "new\n")
+        self.git("add", "--intent-to-add", "new.txt")
+
+        index = self.get_repository().read_index()
+
+        self.assertEqual(list(index.entries), ["file.txt", "new.txt"])
+        self.assertNotEqual(index.entries["new.txt"].extended_flags, 0)
+        self.assertEqual(index.entries["file.txt"].extended_flags, 0)
+
+    def test_read_index_split(self):
+        self.git("update-index", "--split-index")
+
+        with self.assertRaisesRegex(UnsupportedRepositoryError, "extension b'link'"):
+            self.get_repository().read_index()
+
+    def test_check_supported(self):
+        self.get_repository().check_supported()
+
+        self.git("config", "core.sparseCheckout", "true")
+        with self.assertRaisesRegex(UnsupportedRepositoryError, "core.sparsecheckout"):
+            self.get_repository().check_supported()
+
+    def test_check_supported_extensions(self):
+        self.git("config", "extensions.worktreeConfig", "true")
+
+        with self.assertRaisesRegex(UnsupportedRepositoryError, "extensions.worktreeconfig"):
+            self.get_repository().check_supported()
+
+    def test_check_supported_environ(self):
+        with patch.dict(os.environ, {"GIT_INDEX_FILE": "other"}):
+            with self.assertRaisesRegex(UnsupportedRepositoryError, "GIT_INDEX_FILE"):
+                self.get_repository().check_supported()
+
+    def test_read_object_loose(self):
+        repository = self.get_repository()
+
+        self.assertEqual(
+            repository.read_object(self.git("rev-parse", "HEAD:file.txt")), ("blob", b"1.0\n")
+        )
+
+    def test_read_object_packed(self):
+        content = "".join(f"line {i}\n" for i in range(1000))
+        for i in range(5):
+            self.tmp_dir.write("file.txt", content + f"version {i}\n")
+            self.git("commit", "--quiet", "--all", "--message", f"Version {i}")
+        self.git("repack", "-a", "-d", "-f", "--quiet")
+        repository = self.get_repository()
+
+        for i in range(5):
+            sha = self.git("rev-parse", f"HEAD~{4 - i}:file.txt")
+            self.assertEqual(
+                repository.read_object(sha), ("blob", (content + f"version {i}\n").encode())
+            )
+        self.assertEqual(repository.get_head_tree(), self.git("rev-parse", "HEAD^{tree}"))
+
+    def test_read_object_missing(self):
+        with self.assertRaisesRegex(UnsupportedRepositoryError, "not found"):
+            self.get_repository().read_object("0" * 40)
+
+    def test_resolve_ref(self):
+        repository = self.get_repository()
+        head = self.git("rev-parse", "HEAD")
+
+        self.assertEqual(repository.resolve_ref(), head)
+        self.git("pack-refs", "--all")
+        self.assertEqual(repository.resolve_ref(), head)
+        self.assertIsNone(repository.resolve_ref("refs/heads/unknown"))
+
+    def test_get_head_tree_unborn(self):
+        self.git("checkout", "--quiet", "--orphan", "unborn")
+
+        self.assertIsNone(self.get_repository().get_head_tree())
+
+    def test_get_dirty_files(self):
+        self.tmp_dir.write("other.txt", "1.0\n")
+        self.tmp_dir.write("deleted.txt", "1.0\n")
+        self.git("add", "other.txt", "deleted.txt")
+        self.git("commit", "--quiet", "--message", "Other")
+        os.utime("other.txt", (0, 0))
+        os.remove("deleted.txt")
+        self.tmp_dir.write("untracked.txt", "1.1\n")
+
+        self.assertEqual(
+            list(
+                self.get_repository().get_dirty_files(
+                    [Path(p) for p in ("file.txt", "other.txt", "deleted.txt", "untracked.txt")]
+                )
+            ),
+            ["deleted.txt"],
+        )
+
+    def test_get_dirty_files_mtime_rounding(self):
+        # Float timestamp of the modification time rounds up to the next second.
+        os.utime("file.txt", ns=(0, 1_700_000_000_999_999_999))
+        self.git("update-index", "--refresh")
+        repository = self.get_repository()
+
+        with patch.object(repository, "hash_object") as hash_mock:
+            self.assertEqual(list(repository.get_dirty_files([Path("file.txt")])), [])
+
+        hash_mock.assert_not_called()
+
+    def test_get_dirty_files_subdir(self):
+        self.tmp_dir.write("dir/a.txt", "a\n")
+        self.git("add", "dir")
+        self.git("commit", "--quiet", "--message", "Dir")
+        os.chdir("dir")
+        os.remove("a.txt")
+
+        self.assertEqual(
+            list(self.get_repository().get_dirty_files([Path("a.txt")])), ["dir/a.txt"]
+        )
+
+    def test_get_dirty_files_modified(self):
+        self.tmp_dir.write("file.txt", "1.1\n")
+
+        with self.assertRaisesRegex(UnsupportedRepositoryError, "Content of file.txt differs"):
+            list(self.get_repository().get_dirty_files([Path("file.txt")]))
+
+    def test_get_dirty_files_staged(self):
+        self.tmp_dir.write("other.txt", "1.0\n")
+        self.git("add", "other.txt")
+
+        with self.assertRaisesRegex(UnsupportedRepositoryError, "staged"):
+            list(self.get_repository().get_dirty_files([Path("file.txt")]))
+
+    def test_write_object(self):
+        sha = self.get_repository().write_object("blob", b"content\n")
+
+        self.tmp_dir.write("content.txt", "content\n")
+        self.assertEqual(sha, self.git("hash-object", "content.txt"))
+        self.assertEqual(self.git("cat-file", "-p", sha), "content")
+        self.assertEqual(self.git("cat-file", "-t", sha), "blob")
+
+    def test_add_files(self):
+        for version in ("2", "4"):
+            with self.subTest(version=version):
+                self.git("update-index", "--index-version", version)
+                self.tmp_dir.write("file.txt", f"version {version}\n")
+
+                self.get_repository().add_files([Path("file.txt")])
+
+                self.assertEqual(self.git("status", "--porcelain"), "M  file.txt")
+                self.assertEqual(self.git("show", ":file.txt"), f"version {version}")
+                self.assertEqual(self.get_repository().read_index().version, int(version))
+                self.git("reset", "--quiet", "--hard")
+
+    def test_add_files_mtime_rounding(self):
+        self.tmp_dir.write("file.txt", "1.1\n")
+        # Float timestamp of the modification time rounds up to the next second.
+        os.utime("file.txt", ns=(0, 1_700_000_000_999_999_999))
+
+        self.get_repository().add_files([Path("file.txt")])
+
+        entry = self.get_repository().read_index().entries["file.txt"]
+        self.assertEqual(entry.mtime, (1_700_000_000, 999_999_999))
+
+    def test_add_files_untracked(self):
+        self.tmp_dir.write("untracked.txt", "1.1\n")
+
+        with self.assertRaisesRegex(UnsupportedRepositoryError, "untracked.txt"):
+            self.get_repository().add_files([Path("untracked.txt")])
+
+        self.assertEqual(self.git("status", "--porcelain"), "?? untracked.txt")
+
+    def test_add_files_attributes(self):
+        self.tmp_dir.write(".gitattributes", "*.txt text\n")
+
+        with self.assertRaisesRegex(UnsupportedRepositoryError, "Attributes"):
+            self.get_repository().add_files([Path("file.txt")])
+
+    def test_commit(self):
+        self.tmp_dir.write("dir/sub/a.txt", "a\n")
+        self.tmp_dir.write("dir-b.txt", "b\n")
+        self.git("add", "dir", "dir-b.txt")
+        self.git("commit", "--quiet", "--message", "Dir")
+        self.tmp_dir.write("dir/sub/a.txt", "a 1.1\n")
+        self.tmp_dir.write("file.txt", "1.1\n")
+        repository = self.get_repository()
+        repository.add_files([Path("file.txt"), Path("dir/sub/a.txt")])
+
+        commit = repository.commit("Bump  \n\n\nBody\n")
+
+        self.assertEqual(self.git("rev-parse", "HEAD"), commit)
+        self.assertEqual(self.git("log", "--format=%B", "-1"), "Bump\n\nBody")
+        self.assertEqual(
+            self.git("log", "--format=%an <%ae>", "-1"), "Tester <tester@example.com>"
+        )
+        self.assertEqual(self.git("status", "--porcelain"), "")
+        self.assertEqual(self.git("show", "HEAD:dir/sub/a.txt"), "a 1.1")
+        self.assertEqual(self.git("write-tree"), self.git("rev-parse", "HEAD^{tree}"))
+        self.assertEqual(self.git("reflog", "-1", "--format=%gs"), "commit: Bump")
+        self.git("fsck", "--strict")
+        # Index contains a valid cache tree
+        self.assertEqual(repository.read_index().tree, self.git("rev-parse", "HEAD^{tree}"))
+
+    def test_commit_hooks(self):
+        self.tmp_dir.write(".git/hooks/pre-commit", "#!/bin/sh\nexit 1\n")
+
+        with self.assertRaisesRegex(UnsupportedRepositoryError, "Hooks"):
+            self.get_repository().commit("Bump")
+
+    def test_commit_nothing(self):
+        with self.assertRaisesRegex(UnsupportedRepositoryError, "Nothing to commit"):
+            self.get_repository().commit("Bump")
+
+    def test_commit_gpgsign(self):
+        self.git("config", "commit.gpgsign", "true")
+
+        with self.assertRaisesRegex(UnsupportedRepositoryError, "commit.gpgsign"):
+            self.get_repository().commit("Bump")
+
+    def test_tags(self):
+        self.get_repository().tags([("a/v1.0", "Package A"), ("b/v2.0", "Package B\n")])
+
+        self.assertEqual(
+            self.git("tag", "--list", "--format=%(refname:strip=2) %(objecttype) %(subject)"),
+            "a/v1.0 tag Package A\nb/v2.0 tag Package B",
+        )
+        self.assertEqual(self.git("rev-parse", "a/v1.0^{commit}"), self.git("rev-parse", "HEAD"))
+        self.git("fsck", "--strict")
+
+    def test_tags_atomic(self):
+        self.git("tag", "b/v2.0")
+        self.git("pack-refs", "--all")
+
+        with self.assertRaisesRegex(UnsupportedRepositoryError, "refs/tags/b/v2.0 has changed"):
+            self.get_repository().tags([("a/v1.0", "Package A"), ("b/v2.0", "Package B")])
+
+        self.assertEqual(self.git("tag", "--list"), "b/v2.0")
+        self.assertEqual(list(Path(".git/refs/tags").rglob("*.lock")), [])
+
+    def test_tags_invalid(self):
+        with self.assertRaisesRegex(UnsupportedRepositoryError, "Invalid reference"):
+            self.get_repository().tags([("v1.0..", "Invalid")])
+
+    def test_get_refs_state(self):
+        self.git("tag", "v1.0")
+        self.backdate_refs()
+        repository = self.get_repository()
+
+        state = repository.get_refs_state()
+
+        self.assertEqual([path for path, _, _ in state], [os.path.join("refs", "tags")])
+        self.assertEqual(repository.get_refs_state(), state)
+        self.git("pack-refs", "--all")
+        self.git("tag", "nested/v1.1")
+        self.backdate_refs()
+        packed_state = repository.get_refs_state()
+        self.assertEqual(
+            [path for path, _, _ in packed_state],
+            ["packed-refs", os.path.join("refs", "tags"), os.path.join("refs", "tags", "nested")],
+        )
+        self.git("tag", "--delete", "v1.0")
+        self.backdate_refs()
+        self.assertNotEqual(repository.get_refs_state(), packed_state)
+
+    def test_get_refs_state_racy(self):
+        self.git("tag", "v1.0")
+
+        with self.assertRaisesRegex(UnsupportedRepositoryError, "modified too recently"):
+            self.get_repository().get_refs_state()
+
+    def test_get_ident(self):
+        self.assertRegex(
+            self.get_repository().get_ident("author"),
+            r"^Tester <tester@example.com> \d+ [+-]\d{4}$",
+        )
+        with patch.dict(os.environ, {"GIT_COMMITTER_NAME": "Committer"}):
+            self.assertRegex(
+                self.get_repository().get_ident("committer"), r"^Committer <tester@example.com> "
+            )
+
+
+class ParseConfigTest(TestCase):
+    def test_parse_config(self):
+        config = (
+            "[core]\n"
+            "\tbare = false ; comment\n"
+            '[remote "origin"]\n'
+            '  url = "https://example.com/repo.git"\n'
+            "[User]\n"
+            '  Name = "Tester \\"Test\\" Testing"  # comment\n'
+            "  multiline = first \\\n"
+            "second\n"
+            "  flag\n"
+            "[alias] st = status\n"
+        )
+
+        self.assertEqual(
+            _parse_config(config),
+            [
+                ("core.bare", "false"),
+                ("remote.origin.url", "https://example.com/repo.git"),
+                ("user.name", 'Tester "Test" Testing'),
+                ("user.multiline", "first second"),
+                ("user.flag", "true"),
+                ("alias.st", "status"),
+            ],
+        )
+
+    def test_cleanup_message(self):
+        self.assertEqual(_cleanup_message("\n\nSubject  \n\n\n\nBody\t\n\n"), "Subject\n\nBody\n")
+        self.assertEqual(_cleanup_message(" \n"), "")
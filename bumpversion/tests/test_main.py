@@ -1,12 +1,25 @@
+from pathlib import Path
+from typing import List
 from unittest import TestCase
+from unittest.mock import patch
 
 import tomli
 from testfixtures import TempDirectory
 
 import bumpversion
-from bumpversion.main import main
+from bumpversion.main import describe, main
 
-from .utils import CommandMixin
+from .utils import CommandMixin, GitRepoMixin
+
+
+class CountingSerializer(bumpversion.SemVerSerializer):
+    """Serializer which counts serialized versions."""
+
+    calls: List[dict] = []
+
+    def __call__(self, version: dict, /) -> str:
+        self.calls.append(version)
+        return super().__call__(version)
 
 
 class MainTest(CommandMixin, TestCase):
@@ -21,15 +34,25 @@ class MainTest(CommandMixin, TestCase):
     def test_missing_parts(self):
         """Test comand fails if neither parts nor --new-version is provided."""
         self.assertCommandFail(
-            [], stderr="Either parts or --new-version must be defined.", repo=self.tmp_dir.path
+            [],
+            stderr="Either parts, --new-version or --auto must be defined.",
+            repo=Path(self.tmp_dir.path),
         )
 
     def test_conflict_version(self):
         """Test comand fails if both parts and --new-version are provided."""
         self.assertCommandFail(
             ["major", "--new-version", "42"],
-            stderr="Only one of parts or --new-version must be defined.",
-            repo=self.tmp_dir.path,
+            stderr="Only one of parts, --new-version or --auto must be defined.",
+            repo=Path(self.tmp_dir.path),
+        )
+
+    def test_conflict_auto(self):
+        """Test comand fails if both parts and --auto are provided."""
+        self.assertCommandFail(
+            ["major", "--auto"],
+            stderr="Only one of parts, --new-version or --auto must be defined.",
+            repo=Path(self.tmp_dir.path),
         )
 
     def test_part(self):
@@ -82,3 +105,507 @@ class MainTest(CommandMixin, TestCase):
 
         new_config = tomli.loads(self.tmp_dir.as_path(".bumpversion.toml").read_text())
         self.assertEqual(new_config["bumpversion"]["current_version"], "0.0.0")
+
+    def test_jobs(self):
+        """Test bump with --jobs."""
+        config = '[bumpversion]\ncurrent_version = "0.0.0"\n'
+        for index in range(5):
+            config += f'[[bumpversion.file]]\npath = "file{index}.txt"\n'
+            self.tmp_dir.as_path(f"file{index}.txt").write_text("version = 0.0.0\n")
+        self.tmp_dir.as_path(".bumpversion.toml").write_text(config)
+
+        stdout = "".join(f"Bumping file file{index}.txt\n" for index in range(5))
+        stdout += "Bumping file .bumpversion.toml\n"
+        self.assertCommandSuccess(
+            ["major", "--jobs", "3"], stdout=stdout, repo=Path(self.tmp_dir.path)
+        )
+
+        for index in range(5):
+            with self.subTest(index=index):
+                content = self.tmp_dir.as_path(f"file{index}.txt").read_text()
+                self.assertEqual(content, "version = 1.0.0\n")
+
+    def test_jobs_errors(self):
+        """Test bump with --jobs reports all errors in order."""
+        config = '[bumpversion]\ncurrent_version = "0.0.0"\n'
+        for index in range(4):
+            config += f'[[bumpversion.file]]\npath = "file{index}.txt"\n'
+            content = "version = 0.0.0\n" if index % 2 else "version = 4.2\n"
+            self.tmp_dir.as_path(f"file{index}.txt").write_text(content)
+        self.tmp_dir.as_path(".bumpversion.toml").write_text(config)
+
+        stdout = "".join(f"Bumping file file{index}.txt\n" for index in range(4))
+        stdout += (
+            "Bumping file .bumpversion.toml\n"
+            "Bumping files failed:\n"
+            "file0.txt: Pattern 0.0.0 was not found in file file0.txt\n"
+            "file2.txt: Pattern 0.0.0 was not found in file file2.txt\n"
+        )
+        self.assertCommandFail(
+            ["major", "--jobs", "2"], stdout=stdout, repo=Path(self.tmp_dir.path)
+        )
+
+        self.assertEqual(self.tmp_dir.as_path("file1.txt").read_text(), "version = 1.0.0\n")
+        self.assertEqual(self.tmp_dir.as_path("file3.txt").read_text(), "version = 1.0.0\n")
+
+    def test_jobs_same_file(self):
+        """Test bump with --jobs keeps changes of all entries of the same file."""
+        config = '[bumpversion]\ncurrent_version = "0.0.0"\n'
+        for prefix in ("a", "b"):
+            config += (
+                '[[bumpversion.file]]\npath = "big.txt"\n'
+                '[bumpversion.file.replacer]\ncls = "bumpversion.SearchReplaceReplacer"\n'
+                f'search = "{prefix}{{current_version}}"\nreplace = "{prefix}{{new_version}}"\n'
+            )
+        self.tmp_dir.as_path("big.txt").write_text("a0.0.0 b0.0.0\n" * 200000)
+        self.tmp_dir.as_path(".bumpversion.toml").write_text(config)
+
+        stdout = "Bumping file big.txt\nBumping file big.txt\nBumping file .bumpversion.toml\n"
+        self.assertCommandSuccess(
+            ["major", "--jobs", "2"], stdout=stdout, repo=Path(self.tmp_dir.path)
+        )
+
+        self.assertEqual(self.tmp_dir.as_path("big.txt").read_text(), "a1.0.0 b1.0.0\n" * 200000)
+
+    def test_replace_mode(self):
+        """Test replace mode is reported in debug output."""
+        self.tmp_dir.as_path(".bumpversion.toml").write_text(
+            '[bumpversion]\ncurrent_version = "0.0.0"\n'
+            '[bumpversion.replacer]\ncls = "bumpversion.MmapSearchReplaceReplacer"\n'
+        )
+
+        result = self.invoke(["major", "--verbosity", "3"], repo=Path(self.tmp_dir.path))
+
+        self.assertEqual(result.exit_code, 0)
+        self.assertIn("Bumping file .bumpversion.toml\nReplace mode: in-place\n", result.stdout)
+
+    def test_instance_pool(self):
+        """Test files with the same configuration share component instances."""
+        config = '[bumpversion]\ncurrent_version = "0.0.0"\n'
+        for index in range(3):
+            config += f'[[bumpversion.file]]\npath = "file{index}.txt"\n'
+            self.tmp_dir.as_path(f"file{index}.txt").write_text("version = 0.0.0\n")
+        config += '[bumpversion.file.replacer]\ncls = "bumpversion.MmapSearchReplaceReplacer"\n'
+        self.tmp_dir.as_path(".bumpversion.toml").write_text(config)
+
+        result = self.invoke(["major", "--verbosity", "3"], repo=Path(self.tmp_dir.path))
+
+        self.assertEqual(result.exit_code, 0)
+        self.assertIn("Instance pool: 6 hits, 5 misses\n", result.stdout)
+
+    def test_serialized_once(self):
+        """Test versions are serialized only once for each serializer."""
+        config = (
+            '[bumpversion]\ncurrent_version = "0.0.0"\n'
+            '[bumpversion.serializer]\ncls = "bumpversion.tests.test_main.CountingSerializer"\n'
+        )
+        for index in range(5):
+            config += f'[[bumpversion.file]]\npath = "file{index}.txt"\n'
+            self.tmp_dir.as_path(f"file{index}.txt").write_text("version = 0.0.0\n")
+        self.tmp_dir.as_path(".bumpversion.toml").write_text(config)
+
+        calls: List[dict] = []
+        with patch.object(CountingSerializer, "calls", calls):
+            self.assertCommandSuccess(["major", "--jobs", "3"], repo=Path(self.tmp_dir.path))
+
+        # Current and new versions are serialized once for messages and replacers.
+        self.assertEqual([c["major"] for c in calls], [0, 1])
+        for index in range(5):
+            with self.subTest(index=index):
+                content = self.tmp_dir.as_path(f"file{index}.txt").read_text()
+                self.assertEqual(content, "version = 1.0.0\n")
+
+
+class MainGitTest(GitRepoMixin, CommandMixin, TestCase):
+    command = main
+
+    def setUp(self):
+        super().setUp()
+        self.tmp_dir.write(".bumpversion.toml", '[bumpversion]\ncurrent_version = "0.0.0"\n')
+        self.git("add", ".bumpversion.toml")
+        self.git("commit", "--quiet", "--message", "Config")
+
+    def test_dirty_scope_files(self):
+        """Test only maintained files are checked by default."""
+        self.tmp_dir.write("file.txt", "changed\n")
+
+        self.assertCommandSuccess(["major"], repo=Path(self.tmp_dir.path))
+
+        new_config = tomli.loads(self.tmp_dir.as_path(".bumpversion.toml").read_text())
+        self.assertEqual(new_config["bumpversion"]["current_version"], "1.0.0")
+
+    def test_dirty_scope_files_dirty(self):
+        """Test bump fails if a maintained file is dirty."""
+        self.tmp_dir.write(".bumpversion.toml", '[bumpversion]\ncurrent_version = "0.1.0"\n')
+
+        self.assertCommandFail(
+            ["major"],
+            stdout="VCS directory not clean: ('.bumpversion.toml',)\n",
+            repo=Path(self.tmp_dir.path),
+        )
+
+    def test_dirty_scope_repo(self):
+        """Test whole repository is checked with --dirty-scope repo."""
+        self.tmp_dir.write("file.txt", "changed\n")
+
+        self.assertCommandFail(
+            ["major", "--dirty-scope", "repo"],
+            stdout="VCS directory not clean: ('file.txt',)\n",
+            repo=Path(self.tmp_dir.path),
+        )
+
+    def test_vcs_session(self):
+        """Test VCS session is open for the whole run."""
+        with patch("bumpversion.main.get_vcs") as get_vcs_mock:
+            self.assertCommandSuccess(["major", "--commit"], repo=Path(self.tmp_dir.path))
+
+        calls = [c[0] for c in get_vcs_mock.return_value.mock_calls if "." not in c[0]]
+        self.assertEqual(
+            [c for c in calls if c != "__bool__"],
+            ["__enter__", "get_dirty_files", "add_files", "commit", "__exit__"],
+        )
+
+    def test_vcs_native_git(self):
+        """Test configured VCS manager is used."""
+        config = (
+            '[bumpversion]\ncurrent_version = "0.0.0"\n'
+            '[bumpversion.vcs]\ncls = "bumpversion.NativeGit"\n'
+        )
+        self.tmp_dir.write(".bumpversion.toml", config)
+        self.git("commit", "--quiet", "--all", "--message", "Native git")
+
+        with patch("bumpversion.vcs.subprocess.run") as run_mock:
+            self.assertCommandSuccess(["major"], repo=Path(self.tmp_dir.path))
+
+        run_mock.assert_not_called()
+        new_config = tomli.loads(self.tmp_dir.as_path(".bumpversion.toml").read_text())
+        self.assertEqual(new_config["bumpversion"]["current_version"], "1.0.0")
+
+    def test_version_source_tags(self):
+        """Test current version is taken from tags."""
+        config = (
+            '[bumpversion]\nversion_source = "tags"\n'
+            '[[bumpversion.file]]\npath = "version.txt"\n'
+        )
+        self.tmp_dir.write(".bumpversion.toml", config)
+        self.tmp_dir.write("version.txt", "1.0.0\n")
+        self.git("add", ".")
+        self.git("commit", "--quiet", "--message", "Tags")
+        for tag in ("v0.9.0", "v1.0.0", "v1.0.0-rc.1", "other"):
+            self.git("tag", tag)
+
+        stdout = (
+            "Bumping file version.txt\n"
+            "Adding version.txt\n"
+            "Commiting: Bump version: 1.0.0 → 1.1.0\n"
+            "Tagging v1.1.0\n"
+        )
+        self.assertCommandSuccess(
+            ["minor", "--commit", "--tag"], stdout=stdout, repo=Path(self.tmp_dir.path)
+        )
+
+        self.assertEqual(self.tmp_dir.read("version.txt", encoding="utf-8"), "1.1.0\n")
+        self.assertEqual(self.tmp_dir.read(".bumpversion.toml", encoding="utf-8"), config)
+        self.assertEqual(self.git("tag", "--points-at", "HEAD"), "v1.1.0")
+
+    def test_version_source_tags_current_version(self):
+        """Test current version defined on command line takes precedence over tags."""
+        self.tmp_dir.write(".bumpversion.toml", '[bumpversion]\nversion_source = "tags"\n')
+        self.git("commit", "--quiet", "--all", "--message", "Tags")
+
+        self.assertCommandSuccess(
+            ["major", "--current-version", "0.0.0", "--allow-dirty"],
+            stdout="",
+            repo=Path(self.tmp_dir.path),
+        )
+
+    def test_version_source_tags_missing(self):
+        """Test bump fails if there is no tag with a version."""
+        self.tmp_dir.write(".bumpversion.toml", '[bumpversion]\nversion_source = "tags"\n')
+        self.git("commit", "--quiet", "--all", "--message", "Tags")
+
+        self.assertCommandFail(
+            ["major"],
+            stdout="No tag matching v{new_version} found.\n",
+            repo=Path(self.tmp_dir.path),
+        )
+
+    def test_auto(self):
+        """Test parts are picked from commits since the last tag."""
+        self.git("tag", "v0.0.0")
+        self.git("commit", "--quiet", "--allow-empty", "--message", "fix: Fix")
+        self.git("commit", "--quiet", "--allow-empty", "--message", "feat(cli): Add option")
+        self.git("commit", "--quiet", "--allow-empty", "--message", "docs: Update")
+
+        self.assertCommandSuccess(
+            ["--auto"], stdout="Bumping file .bumpversion.toml\n", repo=Path(self.tmp_dir.path)
+        )
+
+        new_config = tomli.loads(self.tmp_dir.as_path(".bumpversion.toml").read_text())
+        self.assertEqual(new_config["bumpversion"]["current_version"], "0.1.0")
+
+    def test_auto_no_tag(self):
+        """Test all commits are analyzed if the last tag is missing."""
+        self.git("commit", "--quiet", "--allow-empty", "--message", "refactor!: Drop option")
+        self.git("commit", "--quiet", "--allow-empty", "--message", "fix: Fix")
+
+        self.assertCommandSuccess(["--auto"], repo=Path(self.tmp_dir.path))
+
+        new_config = tomli.loads(self.tmp_dir.as_path(".bumpversion.toml").read_text())
+        self.assertEqual(new_config["bumpversion"]["current_version"], "1.0.0")
+
+    def test_auto_no_changes(self):
+        """Test bump fails if no commit requires a version bump."""
+        self.git("tag", "v0.0.0")
+        self.git("commit", "--quiet", "--allow-empty", "--message", "docs: Update")
+
+        self.assertCommandFail(
+            ["--auto"],
+            stdout="No commits requiring a version bump found.\n",
+            repo=Path(self.tmp_dir.path),
+        )
+
+
+class MainMonorepoTest(GitRepoMixin, CommandMixin, TestCase):
+    command = main
+
+    def setUp(self):
+        super().setUp()
+        self.tmp_dir.write(".bumpversion.toml", '[bumpversion]\ncurrent_version = "0.0.0"\n')
+        self.tmp_dir.write(
+            "packages/a/.bumpversion.toml",
+            '[bumpversion]\ncurrent_version = "1.0.0"\ntag_name = "{project}/v{new_version}"\n'
+            '[[bumpversion.file]]\npath = "version.txt"\n',
+        )
+        self.tmp_dir.write("packages/a/version.txt", "1.0.0\n")
+        self.tmp_dir.write(
+            "packages/b/pyproject.toml",
+            '[tool.bumpversion]\ncurrent_version = "2.1"\nschema = "pep440"\n'
+            'tag_name = "b-{new_version}"\n',
+        )
+        self.tmp_dir.write("packages/c/pyproject.toml", '[tool.other]\nversion = "1.0"\n')
+        self.tmp_dir.write(".hidden/.bumpversion.toml", '[bumpversion]\ncurrent_version = "1.0"\n')
+        self.git("add", ".")
+        self.git("commit", "--quiet", "--message", "Monorepo")
+
+    def test_monorepo(self):
+        """Test all projects are bumped in a single commit."""
+        stdout = (
+            "Bumping project packages/a: 1.0.0 → 1.1.0\n"
+            "Bumping project packages/b: 2.1 → 2.2\n"
+            "Bumping file packages/a/version.txt\n"
+            "Bumping file packages/a/.bumpversion.toml\n"
+            "Bumping file packages/b/pyproject.toml\n"
+            "Adding packages/a/version.txt\n"
+            "Adding packages/a/.bumpversion.toml\n"
+            "Adding packages/b/pyproject.toml\n"
+            "Commiting: Bump versions\n\n"
+            "packages/a: 1.0.0 → 1.1.0\n"
+            "packages/b: 2.1 → 2.2\n"
+            "Tagging packages/a/v1.1.0\n"
+            "Tagging b-2.2\n"
+        )
+        self.assertCommandSuccess(
+            ["minor", "--monorepo", "--commit", "--tag", "--jobs", "2"],
+            stdout=stdout,
+            repo=Path(self.tmp_dir.path),
+        )
+
+        self.assertEqual(self.tmp_dir.read("packages/a/version.txt", encoding="utf-8"), "1.1.0\n")
+        config = tomli.loads(self.tmp_dir.as_path("packages/b/pyproject.toml").read_text())
+        self.assertEqual(config["tool"]["bumpversion"]["current_version"], "2.2")
+        config = tomli.loads(self.tmp_dir.as_path(".bumpversion.toml").read_text())
+        self.assertEqual(config["bumpversion"]["current_version"], "0.0.0")
+        self.assertEqual(self.git("status", "--porcelain"), "")
+        self.assertEqual(self.git("log", "--format=%s", "HEAD~1.."), "Bump versions")
+        self.assertEqual(self.git("tag", "--points-at", "HEAD"), "b-2.2\npackages/a/v1.1.0")
+
+    def test_project(self):
+        """Test only selected projects are bumped."""
+        stdout = (
+            "Bumping project packages/b: 2.1 → 3.0\n" "Bumping file packages/b/pyproject.toml\n"
+        )
+        self.assertCommandSuccess(
+            ["major", "--monorepo", "--project", "packages/b/"],
+            stdout=stdout,
+            repo=Path(self.tmp_dir.path),
+        )
+
+        self.assertEqual(self.tmp_dir.read("packages/a/version.txt", encoding="utf-8"), "1.0.0\n")
+
+    def test_project_missing(self):
+        """Test bump fails if a selected project doesn't exist."""
+        self.assertCommandFail(
+            ["major", "--monorepo", "--project", "packages/c"],
+            stderr="Projects not found: packages/c",
+            repo=Path(self.tmp_dir.path),
+        )
+
+    def test_commit_message(self):
+        """Test custom commit message lists the projects."""
+        self.assertCommandSuccess(
+            ["minor", "--monorepo", "--commit", "--commit-message", "Release\n\n{projects}"],
+            repo=Path(self.tmp_dir.path),
+        )
+
+        self.assertEqual(
+            self.git("log", "--format=%B", "HEAD~1.."),
+            "Release\n\npackages/a: 1.0.0 → 1.1.0\npackages/b: 2.1 → 2.2",
+        )
+
+    def test_commit_message_invalid(self):
+        """Test commit message can't use versions of a single project."""
+        self.assertCommandFail(
+            ["minor", "--monorepo", "--commit", "--commit-message", "Release {new_version}"],
+            stderr="commit_message can only use projects placeholder in monorepo.",
+            repo=Path(self.tmp_dir.path),
+        )
+        self.assertEqual(self.git("status", "--porcelain"), "")
+
+    def test_project_not_monorepo(self):
+        """Test --project requires --monorepo."""
+        self.assertCommandFail(
+            ["major", "--project", "packages/a"],
+            stderr="--project can only be used with --monorepo.",
+            repo=Path(self.tmp_dir.path),
+        )
+
+    def test_changed_only(self):
+        """Test only projects changed since their last tag are bumped."""
+        self.git("tag", "packages/a/v1.0.0")
+        self.git("tag", "b-2.1")
+        self.tmp_dir.write(
+            "packages/a/nested/.bumpversion.toml", '[bumpversion]\ncurrent_version = "0.0.0"\n'
+        )
+        self.tmp_dir.write("packages/a/nested/file.txt", "changed\n")
+        self.tmp_dir.write("packages/b/file.txt", "changed\n")
+        self.git("add", ".")
+        self.git("commit", "--quiet", "--message", "Change")
+
+        stdout = (
+            "Bumping project packages/a/nested: 0.0.0 → 1.0.0\n"
+            "Bumping project packages/b: 2.1 → 3.0\n"
+            "Bumping file packages/a/nested/.bumpversion.toml\n"
+            "Bumping file packages/b/pyproject.toml\n"
+        )
+        self.assertCommandSuccess(
+            ["major", "--monorepo", "--changed-only"],
+            stdout=stdout,
+            repo=Path(self.tmp_dir.path),
+        )
+
+    def test_changed_only_not_monorepo(self):
+        """Test --changed-only requires --monorepo."""
+        self.assertCommandFail(
+            ["major", "--changed-only"],
+            stderr="--changed-only can only be used with --monorepo.",
+            repo=Path(self.tmp_dir.path),
+        )
+
+    def test_current_version(self):
+        """Test --current-version can't be used with --monorepo."""
+        self.assertCommandFail(
+            ["major", "--monorepo", "--current-version", "1.0.0"],
+            stderr="--current-version can't be used with --monorepo.",
+            repo=Path(self.tmp_dir.path),
+        )
+
+    def test_invalid_project(self):
+        """Test all invalid projects are reported."""
+        self.tmp_dir.write("packages/a/.bumpversion.toml", "[bumpversion]\njobs = 0\n")
+        self.tmp_dir.write("packages/b/pyproject.toml", "[tool.bumpversion]\nschema = 'x'\n")
+
+        result = self.invoke(["major", "--monorepo"], repo=Path(self.tmp_dir.path))
+
+        self.assertEqual(result.exit_code, 1)
+        self.assertRegex(
+            result.stdout,
+            r"(?s)^Loading projects failed:\npackages/a/.bumpversion.toml: .*jobs.*"
+            r"packages/b/pyproject.toml: .*schema",
+        )
+
+    def test_auto(self):
+        """Test parts are picked from commits changing each project."""
+        self.git("tag", "packages/a/v1.0.0")
+        self.git("tag", "b-2.1")
+        self.tmp_dir.write("packages/a/new.txt", "new\n")
+        self.git("add", "packages/a/new.txt")
+        self.git("commit", "--quiet", "--message", "feat: Add file")
+        self.tmp_dir.write("root.txt", "new\n")
+        self.git("add", "root.txt")
+        self.git("commit", "--quiet", "--message", "feat!: Change root")
+        stdout = (
+            "Skipping project packages/b: no changes\n"
+            "Bumping project packages/a: 1.0.0 → 1.1.0\n"
+            "Bumping file packages/a/version.txt\n"
+            "Bumping file packages/a/.bumpversion.toml\n"
+        )
+
+        self.assertCommandSuccess(
+            ["--auto", "--monorepo"], stdout=stdout, repo=Path(self.tmp_dir.path)
+        )
+
+        self.assertEqual(self.tmp_dir.read("packages/a/version.txt", encoding="utf-8"), "1.1.0\n")
+
+
+class DescribeTest(GitRepoMixin, CommandMixin, TestCase):
+    command = describe
+
+    def setUp(self):
+        super().setUp()
+        self.tmp_dir.write(
+            ".bumpversion.toml", '[bumpversion]\ncurrent_version = "1.3"\nschema = "pep440"\n'
+        )
+        self.git("add", ".bumpversion.toml")
+        self.git("commit", "--quiet", "--message", "Config")
+        self.git("tag", "v1.2")
+        self.git("tag", "v1.3")
+        self.git("tag", "other")
+        for index in range(3):
+            self.git("commit", "--quiet", "--allow-empty", "--message", f"Commit {index}")
+
+    def test_describe(self):
+        self.assertCommandSuccess(stdout="1.3.1.dev3\n", repo=Path(self.tmp_dir.path))
+
+    def test_revisions(self):
+        self.assertCommandSuccess(
+            ["HEAD~2", "v1.3", "HEAD", "--part", "minor"],
+            stdout="1.4.dev1\n1.3\n1.4.dev3\n",
+            repo=Path(self.tmp_dir.path),
+        )
+
+    def test_cached(self):
+        self.assertCommandSuccess(["HEAD~1"], stdout="1.3.1.dev2\n", repo=Path(self.tmp_dir.path))
+
+        with patch("bumpversion.vcs.Git.iter_first_parents") as walk_mock:
+            self.assertCommandSuccess(
+                ["HEAD~1", "HEAD~2"],
+                stdout="1.3.1.dev2\n1.3.1.dev1\n",
+                repo=Path(self.tmp_dir.path),
+            )
+
+        walk_mock.assert_not_called()
+
+    def test_unknown_revision(self):
+        self.assertCommandFail(
+            ["unknown"], stdout="Revision unknown not found.\n", repo=Path(self.tmp_dir.path)
+        )
+
+    def test_semver(self):
+        self.tmp_dir.write(".bumpversion.toml", '[bumpversion]\ncurrent_version = "1.3.0"\n')
+        self.git("tag", "v1.3.0", "HEAD~1")
+
+        self.assertCommandSuccess(stdout="1.3.1-dev.1\n", repo=Path(self.tmp_dir.path))
+        self.assertCommandFail(
+            ["--part", "micro"],
+            stdout="Development version of HEAD can't be bumped: Invalid part. Expected one of "
+            "('major', 'minor', 'patch', 'prerelease'), but got 'micro'\n",
+            repo=Path(self.tmp_dir.path),
+        )
+
+    def test_no_tag(self):
+        self.git("tag", "--delete", "v1.2", "v1.3")
+
+        self.assertCommandFail(
+            stdout="No release tag found in history of HEAD.\n", repo=Path(self.tmp_dir.path)
+        )
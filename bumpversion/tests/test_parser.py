@@ -1,7 +1,8 @@
 """Unittests for parser module."""
+import re
 from unittest import TestCase
 
-from bumpversion.parser import PEP440Parser, RegexParser, SemVerParser
+from bumpversion.parser import PEP440Parser, RegexParser, SemVerParser, _parse_cached
 
 
 class RegexParserTest(TestCase):
@@ -16,6 +17,58 @@ class RegexParserTest(TestCase):
         with self.assertRaisesRegex(ValueError, "Version 2.a does not match regex"):
             parser("2.a")
 
+    def test_parse_many(self):
+        parser = RegexParser(r"(?P<major>\d+)\.(?P<minor>\d+)")
+        self.assertEqual(
+            list(parser.parse_many(["2.3", "4.5"])),
+            [{"major": "2", "minor": "3"}, {"major": "4", "minor": "5"}],
+        )
+
+    def test_parse_many_invalid(self):
+        parser = RegexParser(r"(?P<major>\d+)\.(?P<minor>\d+)")
+        with self.assertRaisesRegex(ValueError, "Version 2.a does not match regex"):
+            list(parser.parse_many(["2.3", "2.a", "4.5"]))
+
+    def test_parse_many_skip_invalid(self):
+        parser = RegexParser(r"(?P<major>\d+)\.(?P<minor>\d+)")
+        self.assertEqual(
+            list(parser.parse_many(["2.3", "2.a", "4.5"], skip_invalid=True)),
+            [{"major": "2", "minor": "3"}, {"major": "4", "minor": "5"}],
+        )
+
+    def test_cache(self):
+        _parse_cached.cache_clear()
+        parser = RegexParser(r"(?P<major>\d+)\.(?P<minor>\d+)")
+        other = RegexParser(re.compile(r"(?P<major>\d+)\.(?P<minor>\d+)"))
+
+        parsed = parser("2.3")
+        parsed["major"] = "42"
+
+        # Cache is shared by parsers with the same configuration and can't be modified.
+        self.assertEqual(parser, other)
+        self.assertEqual(other("2.3"), {"major": "2", "minor": "3"})
+        self.assertEqual(_parse_cached.cache_info().hits, 1)
+        self.assertEqual(_parse_cached.cache_info().misses, 1)
+
+    def test_cache_configuration(self):
+        parser = RegexParser(r"(?P<major>\d+)\.(?P<minor>\d+)")
+        data = (
+            RegexParser(r"(?P<major>\d+)"),
+            RegexParser(re.compile(r"(?P<major>\d+)\.(?P<minor>\d+)", re.IGNORECASE)),
+            PEP440Parser(),
+            SemVerParser(),
+        )
+        for other in data:
+            with self.subTest(other=other):
+                self.assertNotEqual(parser, other)
+                self.assertNotEqual(hash(parser), hash(other))
+
+    def test_key(self):
+        parser = RegexParser(r"(?P<major>\d+)")
+
+        with self.assertRaisesRegex(NotImplementedError, "doesn't define ordering"):
+            parser.key(parser("1"))
+
 
 class PEP440ParserTest(TestCase):
     """Unittests for PEP440Parser."""
@@ -50,6 +103,29 @@ class PEP440ParserTest(TestCase):
             with self.subTest(input=input, output=output):
                 self.assertEqual(parser(input), output)
 
+    def test_key(self):
+        versions = [
+            "1.0.dev0",
+            "1.0a1",
+            "1.0a2.dev1",
+            "1.0a2",
+            "1.0b1",
+            "1.0rc1",
+            "1.0",
+            "1.0+abc",
+            "1.0+abc.5",
+            "1.0+5",
+            "1.0.post1.dev0",
+            "1.0.post1",
+            "1.0.1",
+            "1.10",
+            "1!0.1",
+        ]
+        parser = PEP440Parser()
+
+        self.assertEqual(sorted(reversed(versions), key=lambda v: parser.key(parser(v))), versions)
+        self.assertEqual(parser.key(parser("1.0")), parser.key(parser("1.0.0")))
+
 
 class SemVerParserTest(TestCase):
     """Unittests for SemVerParser."""
@@ -70,3 +146,22 @@ class SemVerParserTest(TestCase):
         for input, output in data:
             with self.subTest(input=input, output=output):
                 self.assertEqual(parser(input), output)
+
+    def test_key(self):
+        versions = [
+            "1.0.0-alpha",
+            "1.0.0-alpha.1",
+            "1.0.0-alpha.beta",
+            "1.0.0-beta",
+            "1.0.0-beta.2",
+            "1.0.0-beta.11",
+            "1.0.0-rc.1",
+            "1.0.0",
+            "1.0.1",
+            "1.10.0",
+            "2.0.0",
+        ]
+        parser = SemVerParser()
+
+        self.assertEqual(sorted(reversed(versions), key=lambda v: parser.key(parser(v))), versions)
+        self.assertEqual(parser.key(parser("1.0.0+build")), parser.key(parser("1.0.0")))
@@ -0,0 +1,372 @@
+"""Unittests for replacer module."""
+import os
+from typing import Any
+from unittest import TestCase
+from unittest.mock import patch
+
+from testfixtures import TempDirectory
+
+from bumpversion.replacer import (
+    BytesSearchReplaceReplacer,
+    IndexedSearchReplaceReplacer,
+    MmapSearchReplaceReplacer,
+    MultiSearchReplaceReplacer,
+    ReplaceMode,
+    SearchReplaceReplacer,
+    StreamingSearchReplaceReplacer,
+)
+
+
+class SearchReplaceReplacerTest(TestCase):
+    """Unittests for SearchReplaceReplacer."""
+
+    def setUp(self):
+        self.tmp_dir = TempDirectory()
+        self.path = self.tmp_dir.as_path("file.txt")
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def test_replace(self):
+        self.path.write_text("version = 1.0\nother = 1.0\n")
+        replacer = SearchReplaceReplacer(
+            search="version = {current_version}", replace="version = {new_version}"
+        )
+
+        result = replacer(path=self.path, current_version="1.0", new_version="1.1")
+
+        self.assertEqual(result, ReplaceMode.rewrite)
+        self.assertEqual(self.path.read_text(), "version = 1.1\nother = 1.0\n")
+
+    def test_not_found(self):
+        self.path.write_text("version = 1.0\n")
+        replacer = SearchReplaceReplacer()
+
+        with self.assertRaisesRegex(RuntimeError, "Pattern 2.0 was not found"):
+            replacer(path=self.path, current_version="2.0", new_version="2.1")
+
+
+class StreamingSearchReplaceReplacerTest(TestCase):
+    """Unittests for StreamingSearchReplaceReplacer."""
+
+    def setUp(self):
+        self.tmp_dir = TempDirectory()
+        self.path = self.tmp_dir.as_path("file.txt")
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def test_replace(self):
+        content = "1.0.0 a 1.0.0 bb 1.0.01.0.0 ccc 1.0.0"
+        # Chunk sizes smaller, around and larger than the pattern to hit the chunk boundaries.
+        for chunk_size in (1, 2, 3, 4, 5, 6, 7, 100):
+            with self.subTest(chunk_size=chunk_size):
+                self.path.write_text(content)
+                replacer = StreamingSearchReplaceReplacer(chunk_size=chunk_size)
+
+                replacer(path=self.path, current_version="1.0.0", new_version="1.0.10")
+
+                self.assertEqual(self.path.read_text(), content.replace("1.0.0", "1.0.10"))
+
+    def test_replace_overlapping(self):
+        self.path.write_text("aaaaa")
+        replacer = StreamingSearchReplaceReplacer(chunk_size=2)
+
+        replacer(path=self.path, current_version="aa", new_version="b")
+
+        self.assertEqual(self.path.read_text(), "aaaaa".replace("aa", "b"))
+
+    def test_replace_keeps_mode(self):
+        self.path.write_text("1.0")
+        os.chmod(self.path, 0o751)
+        replacer = StreamingSearchReplaceReplacer()
+
+        replacer(path=self.path, current_version="1.0", new_version="1.1")
+
+        self.assertEqual(self.path.read_text(), "1.1")
+        self.assertEqual(os.stat(self.path).st_mode & 0o777, 0o751)
+
+    def test_not_found(self):
+        self.path.write_text("version = 1.0\n")
+        replacer = StreamingSearchReplaceReplacer(chunk_size=4)
+
+        with self.assertRaisesRegex(RuntimeError, "Pattern 2.0 was not found"):
+            replacer(path=self.path, current_version="2.0", new_version="2.1")
+
+        self.assertEqual(self.path.read_text(), "version = 1.0\n")
+        self.assertEqual(os.listdir(self.tmp_dir.path), ["file.txt"])
+
+    def test_empty_search(self):
+        self.path.write_text("1.0")
+        replacer = StreamingSearchReplaceReplacer(search="")
+
+        with self.assertRaisesRegex(ValueError, "Search pattern must not be empty"):
+            replacer(path=self.path, current_version="1.0", new_version="1.1")
+
+    def test_invalid_chunk_size(self):
+        with self.assertRaisesRegex(ValueError, "Chunk size must be positive"):
+            StreamingSearchReplaceReplacer(chunk_size=0)
+
+
+class BytesSearchReplaceReplacerTest(TestCase):
+    """Unittests for BytesSearchReplaceReplacer."""
+
+    def setUp(self):
+        self.tmp_dir = TempDirectory()
+        self.path = self.tmp_dir.as_path("file.txt")
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def test_replace(self):
+        # Invalid UTF-8 and CRLF line endings are kept untouched.
+        self.path.write_bytes(b"version = 1.0\r\nname = \xff\xfe\nother = 1.0\r\n")
+        replacer = BytesSearchReplaceReplacer(
+            search="version = {current_version}", replace="version = {new_version}"
+        )
+
+        result = replacer(path=self.path, current_version="1.0", new_version="1.0.1")
+
+        self.assertEqual(result, ReplaceMode.rewrite)
+        self.assertEqual(
+            self.path.read_bytes(), b"version = 1.0.1\r\nname = \xff\xfe\nother = 1.0\r\n"
+        )
+
+    def test_replace_encoding(self):
+        self.path.write_bytes("název = 1.0".encode("cp1250"))
+        replacer = BytesSearchReplaceReplacer(
+            search="název = {current_version}", replace="název = {new_version}", encoding="cp1250"
+        )
+
+        replacer(path=self.path, current_version="1.0", new_version="1.1")
+
+        self.assertEqual(self.path.read_bytes(), "název = 1.1".encode("cp1250"))
+
+    def test_not_found(self):
+        self.path.write_bytes(b"version = 1.0\n")
+        replacer = BytesSearchReplaceReplacer()
+
+        with self.assertRaisesRegex(RuntimeError, "Pattern 2.0 was not found"):
+            replacer(path=self.path, current_version="2.0", new_version="2.1")
+
+    def test_empty_search(self):
+        self.path.write_bytes(b"1.0")
+        replacer = BytesSearchReplaceReplacer(search="")
+
+        with self.assertRaisesRegex(ValueError, "Search pattern must not be empty"):
+            replacer(path=self.path, current_version="1.0", new_version="1.1")
+
+
+class MmapSearchReplaceReplacerTest(TestCase):
+    """Unittests for MmapSearchReplaceReplacer."""
+
+    def setUp(self):
+        self.tmp_dir = TempDirectory()
+        self.path = self.tmp_dir.as_path("file.txt")
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def test_replace_in_place(self):
+        self.path.write_text("1.2.3 a 1.2.3 1.2.31.2.3")
+        inode = os.stat(self.path).st_ino
+        replacer = MmapSearchReplaceReplacer()
+
+        result = replacer(path=self.path, current_version="1.2.3", new_version="1.2.4")
+
+        self.assertEqual(result, ReplaceMode.in_place)
+        self.assertEqual(str(result), "in-place")
+        self.assertEqual(self.path.read_text(), "1.2.4 a 1.2.4 1.2.41.2.4")
+        self.assertEqual(os.stat(self.path).st_ino, inode)
+
+    def test_replace_rewrite(self):
+        self.path.write_text("2.0.9 a 2.0.9\n")
+        os.chmod(self.path, 0o751)
+        replacer = MmapSearchReplaceReplacer()
+
+        result = replacer(path=self.path, current_version="2.0.9", new_version="2.0.10")
+
+        self.assertEqual(result, ReplaceMode.rewrite)
+        self.assertEqual(self.path.read_text(), "2.0.10 a 2.0.10\n")
+        self.assertEqual(os.stat(self.path).st_mode & 0o777, 0o751)
+        self.assertEqual(os.listdir(self.tmp_dir.path), ["file.txt"])
+
+    def test_replace_encoding(self):
+        self.path.write_text("verzé 1.0", encoding="utf-16")
+        replacer = MmapSearchReplaceReplacer(
+            search="é {current_version}", replace="é {new_version}", encoding="utf-16-le"
+        )
+
+        result = replacer(path=self.path, current_version="1.0", new_version="1.1")
+
+        self.assertEqual(result, ReplaceMode.in_place)
+        self.assertEqual(self.path.read_text(encoding="utf-16"), "verzé 1.1")
+
+    def test_not_found(self):
+        data = ("version = 1.0\n", "")
+        for content in data:
+            with self.subTest(content=content):
+                self.path.write_text(content)
+                replacer = MmapSearchReplaceReplacer()
+
+                with self.assertRaisesRegex(RuntimeError, "Pattern 2.0 was not found"):
+                    replacer(path=self.path, current_version="2.0", new_version="2.1")
+
+                self.assertEqual(self.path.read_text(), content)
+
+    def test_empty_search(self):
+        self.path.write_text("1.0")
+        replacer = MmapSearchReplaceReplacer(search="")
+
+        with self.assertRaisesRegex(ValueError, "Search pattern must not be empty"):
+            replacer(path=self.path, current_version="1.0", new_version="1.1")
+
+
+class IndexedSearchReplaceReplacerTest(TestCase):
+    """Unittests for IndexedSearchReplaceReplacer."""
+
+    def setUp(self):
+        self.tmp_dir = TempDirectory()
+        self.path = self.tmp_dir.as_path("file.txt")
+        self.index_dir = self.tmp_dir.as_path("index")
+        self.replacer = IndexedSearchReplaceReplacer(
+            search="v{current_version}", replace="v{new_version}", index_dir=str(self.index_dir)
+        )
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def test_replace(self):
+        self.path.write_bytes(b"v1.0 a v1.0 v1.1")
+
+        result = self.replacer(path=self.path, current_version="1.0", new_version="1.1")
+
+        self.assertEqual(result, ReplaceMode.in_place)
+        self.assertEqual(self.path.read_bytes(), b"v1.1 a v1.1 v1.1")
+        # Only replaced occurences are indexed, so the last one is left untouched.
+        with patch.object(MmapSearchReplaceReplacer, "_find_offsets") as find_mock:
+            result = self.replacer(path=self.path, current_version="1.1", new_version="1.10")
+
+        self.assertEqual(result, ReplaceMode.rewrite)
+        self.assertEqual(self.path.read_bytes(), b"v1.10 a v1.10 v1.1")
+        find_mock.assert_not_called()
+        # Offsets are shifted after the rewrite.
+        self.replacer(path=self.path, current_version="1.10", new_version="1.11")
+
+        self.assertEqual(self.path.read_bytes(), b"v1.11 a v1.11 v1.1")
+
+    def test_replace_changed_file(self):
+        self.path.write_bytes(b"v1.0")
+        self.replacer(path=self.path, current_version="1.0", new_version="1.1")
+        self.path.write_bytes(b"a v1.1 v1.1")
+
+        self.replacer(path=self.path, current_version="1.1", new_version="1.2")
+
+        self.assertEqual(self.path.read_bytes(), b"a v1.2 v1.2")
+
+    def test_replace_verification_failed(self):
+        self.path.write_bytes(b"v1.0 aaaa")
+        self.replacer(path=self.path, current_version="1.0", new_version="1.1")
+        stat = os.stat(self.path)
+        # Change the file, but keep its fingerprint.
+        with open(self.path, "r+b") as fh:
+            fh.write(b"aaaa v1.1")
+        os.utime(self.path, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+
+        self.replacer(path=self.path, current_version="1.1", new_version="1.2")
+
+        self.assertEqual(self.path.read_bytes(), b"aaaa v1.2")
+
+    def test_replace_invalid_index(self):
+        self.path.write_bytes(b"v1.0")
+        self.replacer(path=self.path, current_version="1.0", new_version="1.1")
+        for index_file in self.index_dir.glob("*/*.json"):
+            index_file.write_text("{invalid")
+
+        self.replacer(path=self.path, current_version="1.1", new_version="1.2")
+
+        self.assertEqual(self.path.read_bytes(), b"v1.2")
+
+    def test_replace_index_not_writable(self):
+        self.path.write_bytes(b"v1.0")
+        self.index_dir.write_text("Not a directory")
+
+        self.replacer(path=self.path, current_version="1.0", new_version="1.1")
+
+        self.assertEqual(self.path.read_bytes(), b"v1.1")
+
+    def test_replace_no_index(self):
+        self.path.write_bytes(b"v1.0")
+        with patch("bumpversion.replacer.get_cache_dir", return_value=None):
+            replacer = IndexedSearchReplaceReplacer()
+
+        replacer(path=self.path, current_version="1.0", new_version="1.1")
+
+        self.assertIsNone(replacer.index_dir)
+        self.assertEqual(self.path.read_bytes(), b"v1.1")
+
+
+class MultiSearchReplaceReplacerTest(TestCase):
+    """Unittests for MultiSearchReplaceReplacer."""
+
+    def setUp(self):
+        self.tmp_dir = TempDirectory()
+        self.path = self.tmp_dir.as_path("file.txt")
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def test_replace(self):
+        self.path.write_text('version = "1.0"\nsibling == 1.0\nother = 1.0\n')
+        replacer = MultiSearchReplaceReplacer(
+            patterns=[
+                {
+                    "search": 'version = "{current_version}"',
+                    "replace": 'version = "{new_version}"',
+                },
+                {"search": "sibling == {current_version}", "replace": "sibling == {new_version}"},
+            ]
+        )
+
+        replacer(path=self.path, current_version="1.0", new_version="1.1")
+
+        self.assertEqual(self.path.read_text(), 'version = "1.1"\nsibling == 1.1\nother = 1.0\n')
+
+    def test_replace_longest_match(self):
+        self.path.write_text("v1.0 1.0")
+        replacer = MultiSearchReplaceReplacer(
+            patterns=[{}, {"search": "v{current_version}", "replace": "V{new_version}"}]
+        )
+
+        replacer(path=self.path, current_version="1.0", new_version="1.0.1")
+
+        # Replaced text is not searched again.
+        self.assertEqual(self.path.read_text(), "V1.0.1 1.0.1")
+
+    def test_not_found(self):
+        self.path.write_text("version = 1.0\n")
+        replacer = MultiSearchReplaceReplacer(
+            patterns=[{}, {"search": "pin = {current_version}"}, {"search": "x{current_version}"}]
+        )
+
+        with self.assertRaisesRegex(RuntimeError, "Patterns pin = 1.0, x1.0 were not found"):
+            replacer(path=self.path, current_version="1.0", new_version="1.1")
+
+        self.assertEqual(self.path.read_text(), "version = 1.0\n")
+
+    def test_invalid_patterns(self):
+        self.path.write_text("1.0")
+        data: Any = (
+            # patterns, error_message
+            ([{"search": ""}], "Search pattern must not be empty"),
+            ([{}, {"replace": "{current_version}"}], "Pattern 1.0 has conflicting replacements"),
+        )
+        for patterns, error in data:
+            with self.subTest(patterns=patterns):
+                replacer = MultiSearchReplaceReplacer(patterns=patterns)
+                with self.assertRaisesRegex(ValueError, error):
+                    replacer(path=self.path, current_version="1.0", new_version="1.1")
+
+    def test_no_patterns(self):
+        with self.assertRaisesRegex(ValueError, "At least one pattern must be defined"):
+            MultiSearchReplaceReplacer(patterns=[])
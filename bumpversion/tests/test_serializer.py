@@ -5,34 +5,9 @@ from bumpversion.serializer import (
     FormatSerializer,
     PEP440Serializer,
     SemVerSerializer,
-    StrictFormatter,
 )
 
 
-class StrictFormatterTest(TestCase):
-    def test_format(self):
-        data: Any = (
-            ("", {}, ""),
-            ("abc", {}, "abc"),
-            ("{a}", {"a": "B"}, "B"),
-            ("{a}.{b}", {"a": "B", "b": "A"}, "B.A"),
-        )
-        for input, kwargs, output in data:
-            with self.subTest(input=input, kwargs=kwargs, output=output):
-                self.assertEqual(StrictFormatter().format(input, **kwargs), output)
-
-    def test_format_too_many(self):
-        message = "Too many arguments for format"
-        data: Any = (
-            ("", {"a": "A"}),
-            ("{a}.{b}", {"a": "B", "b": "A", "c": "C"}),
-        )
-        for input, kwargs in data:
-            with self.subTest(input=input, kwargs=kwargs):
-                with self.assertRaisesRegex(TypeError, message):
-                    StrictFormatter().format(input, **kwargs)
-
-
 class FormatSerializerTest(TestCase):
     def setUp(self):
         formats = [
@@ -60,6 +35,14 @@ class FormatSerializerTest(TestCase):
         with self.assertRaisesRegex(ValueError, message):
             self.serializer({"rc": 0})
 
+    def test_serialize_first_match(self):
+        serializer = FormatSerializer(
+            formats=["{major}", "{major[0]}.{minor}", "{minor}-{major}", "{major}.{minor}"]
+        )
+        self.assertEqual(serializer({"major": 1}), "1")
+        # Format which fails to be filled is skipped.
+        self.assertEqual(serializer({"major": 1, "minor": 2}), "2-1")
+
 
 class PEP440SerializerTest(TestCase):
     def setUp(self):
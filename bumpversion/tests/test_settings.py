@@ -0,0 +1,215 @@
+import os
+from pathlib import Path
+from unittest import TestCase
+from unittest.mock import patch
+
+from pydantic import ValidationError
+from testfixtures import TempDirectory
+
+from bumpversion.constants import ChangeType, DirtyScope, VersionSource
+from bumpversion.settings import Component, File, Settings, find_config_files, load_settings
+
+CONFIG = """
+[bumpversion]
+current_version = "1.0.0"
+schema = "pep440"
+
+[[bumpversion.file]]
+path = "setup.py"
+search = "version={current_version}"
+
+[bumpversion.file.replacer]
+cls = "bumpversion.MmapSearchReplaceReplacer"
+encoding = "latin-1"
+"""
+
+
+class LoadSettingsTest(TestCase):
+    def setUp(self):
+        self.tmp_dir = TempDirectory()
+        self.cache_dir = TempDirectory()
+        self.cwd = os.getcwd()
+        os.chdir(self.tmp_dir.path)
+        self.tmp_dir.write(".bumpversion.toml", CONFIG)
+        self.tmp_dir.write("setup.py", "version=1.0.0\n")
+        environ = patch.dict(os.environ, {"BUMPVERSION_CACHE_DIR": self.cache_dir.path})
+        environ.start()
+        self.addCleanup(environ.stop)
+
+    def tearDown(self):
+        os.chdir(self.cwd)
+        self.tmp_dir.cleanup()
+        self.cache_dir.cleanup()
+
+    def test_cached(self):
+        settings = load_settings()
+
+        with patch("bumpversion.settings.tomli.loads") as loads_mock:
+            cached = load_settings()
+
+        loads_mock.assert_not_called()
+        self.assertEqual(cached, settings)
+        self.assertEqual(cached, Settings())
+        self.assertEqual(cached._config_file, settings._config_file)
+        self.assertEqual(cached.dirty_scope, DirtyScope.files)
+        self.assertIsInstance(cached.parser, Component)
+        file = cached.file[0]
+        self.assertIsInstance(file, File)
+        self.assertEqual(file.path, Path("setup.py"))
+        self.assertEqual(file.replacer.dict(exclude={"cls"}), {"encoding": "latin-1"})
+        self.assertEqual(file.dict()["search"], "version={current_version}")
+
+    def test_config_file(self):
+        self.tmp_dir.write("other.toml", CONFIG.replace("1.0.0", "2.0.0"))
+        load_settings()
+
+        settings = load_settings("other.toml")
+
+        self.assertEqual(settings.current_version, "2.0.0")
+        self.assertEqual(load_settings("other.toml").current_version, "2.0.0")
+        self.assertEqual(load_settings().current_version, "1.0.0")
+
+    def test_config_changed(self):
+        load_settings()
+        self.tmp_dir.write(".bumpversion.toml", CONFIG.replace("1.0.0", "1.1.0"))
+
+        self.assertEqual(load_settings().current_version, "1.1.0")
+
+    def test_config_changed_replaced(self):
+        load_settings()
+        self.tmp_dir.write(".bumpversion.toml", CONFIG.replace("1.0.0", "1.1.0"))
+        load_settings()
+
+        self.assertEqual(len(os.listdir(os.path.join(self.cache_dir.path, "settings"))), 1)
+        self.assertEqual(load_settings().current_version, "1.1.0")
+
+    def test_environ_changed(self):
+        load_settings()
+
+        with patch.dict(os.environ, {"COMMIT": "true"}):
+            self.assertTrue(load_settings().commit)
+
+    def test_file_deleted(self):
+        load_settings()
+        os.remove("setup.py")
+
+        with self.assertRaisesRegex(ValidationError, "does not exist"):
+            load_settings()
+
+    def test_project_dir(self):
+        self.tmp_dir.write("project/.bumpversion.toml", CONFIG)
+        self.tmp_dir.write("project/setup.py", "version=1.0.0\n")
+
+        settings = load_settings("project/.bumpversion.toml", project_dir="project")
+
+        self.assertEqual(
+            [file.path for file in settings.file],
+            [Path("project/setup.py"), Path("project/.bumpversion.toml")],
+        )
+        cached = load_settings("project/.bumpversion.toml", project_dir="project")
+        self.assertEqual(cached, settings)
+        self.assertEqual(load_settings("project/.bumpversion.toml").file[0].path, Path("setup.py"))
+
+    def test_pyproject(self):
+        self.tmp_dir.write(
+            "project/pyproject.toml", '[tool.bumpversion]\ncurrent_version = "2.0"\n'
+        )
+
+        settings = load_settings("project/pyproject.toml")
+
+        self.assertEqual(settings.current_version, "2.0")
+
+    def test_version_source_tags(self):
+        self.tmp_dir.write(
+            ".bumpversion.toml",
+            CONFIG.replace("[bumpversion]", '[bumpversion]\nversion_source = "tags"', 1),
+        )
+
+        settings = load_settings()
+
+        self.assertEqual(settings.version_source, VersionSource.tags)
+        self.assertEqual([file.path for file in settings.file], [Path("setup.py")])
+        self.assertEqual(load_settings().version_source, VersionSource.tags)
+
+    def test_auto_parts(self):
+        self.tmp_dir.write(
+            ".bumpversion.toml",
+            CONFIG.replace("[bumpversion]", '[bumpversion]\nauto_parts = {fix = ["rc"]}', 1),
+        )
+
+        settings = load_settings()
+
+        auto_parts = {
+            ChangeType.breaking: ["major"],
+            ChangeType.feature: ["minor"],
+            ChangeType.fix: ["rc"],
+        }
+        self.assertEqual(settings.auto_parts, auto_parts)
+        self.assertEqual(load_settings().auto_parts, auto_parts)
+
+    def test_no_cache_dir(self):
+        with patch.dict(os.environ, {"BUMPVERSION_CACHE_DIR": ""}):
+            settings = load_settings()
+
+        self.assertEqual(settings, Settings())
+        self.assertEqual(os.listdir(self.cache_dir.path), [])
+
+
+class CopyValidatedTest(TestCase):
+    def setUp(self):
+        self.tmp_dir = TempDirectory()
+        self.config_file = self.tmp_dir.write(
+            "config.toml", '[bumpversion]\ncurrent_version = "1.0"\n'
+        )
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def test_copy_validated(self):
+        settings = Settings(config_file=self.config_file)
+
+        copy = settings.copy_validated(dirty_scope="repo", jobs="4", commit_args=["-s"])
+
+        self.assertEqual(copy.dirty_scope, DirtyScope.repo)
+        self.assertEqual(copy.jobs, 4)
+        self.assertEqual(copy.commit_args, ["-s"])
+        self.assertEqual(copy.current_version, "1.0")
+        self.assertEqual(settings.jobs, 1)
+
+    def test_invalid_auto_parts(self):
+        with self.assertRaisesRegex(ValidationError, "auto_parts"):
+            Settings(config_file=self.config_file, auto_parts={"docs": ["patch"]})
+
+    def test_invalid(self):
+        settings = Settings(config_file=self.config_file)
+
+        with self.assertRaisesRegex(ValidationError, "jobs"):
+            settings.copy_validated(jobs=0)
+
+
+class FindConfigFilesTest(TestCase):
+    def setUp(self):
+        self.tmp_dir = TempDirectory()
+        self.cwd = os.getcwd()
+        os.chdir(self.tmp_dir.path)
+
+    def tearDown(self):
+        os.chdir(self.cwd)
+        self.tmp_dir.cleanup()
+
+    def test_find(self):
+        self.tmp_dir.write(".bumpversion.toml", "[bumpversion]\n")
+        self.tmp_dir.write("b/.bumpversion.toml", "[bumpversion]\n")
+        self.tmp_dir.write("b/pyproject.toml", "[tool.bumpversion]\n")
+        self.tmp_dir.write("a/nested/pyproject.toml", "[tool.bumpversion]\n")
+        self.tmp_dir.write("a/pyproject.toml", "[tool.other]\n")
+        self.tmp_dir.write("c/.bumpversion.toml", "[other]\n")
+        self.tmp_dir.write(".hidden/.bumpversion.toml", "[bumpversion]\n")
+
+        self.assertEqual(
+            list(find_config_files()),
+            [
+                ("a/nested", "a/nested/pyproject.toml"),
+                ("b", "b/.bumpversion.toml"),
+            ],
+        )
@@ -0,0 +1,121 @@
+import os
+from unittest import TestCase
+from unittest.mock import patch
+
+from testfixtures import TempDirectory
+
+from bumpversion.parser import PEP440Parser, SemVerParser
+from bumpversion.tags import TagVersions, VersionIndex, get_tag_affixes
+from bumpversion.vcs import Git
+
+from .utils import GitRepoMixin
+
+
+class GetTagAffixesTest(TestCase):
+    def test_affixes(self):
+        data = (
+            # tag_name, project, affixes
+            ("v{new_version}", None, ("v", "")),
+            ("{new_version}", None, ("", "")),
+            ("{project}/v{new_version}-final", "packages/a", ("packages/a/v", "-final")),
+        )
+        for tag_name, project, affixes in data:
+            with self.subTest(tag_name=tag_name):
+                self.assertEqual(get_tag_affixes(tag_name, project), affixes)
+
+    def test_invalid(self):
+        data = (
+            # tag_name, error
+            ("v{current_version}-{new_version}", "can only use new_version and project"),
+            ("release", "must use new_version exactly once"),
+            ("{new_version}-{new_version}", "must use new_version exactly once"),
+        )
+        for tag_name, error in data:
+            with self.subTest(tag_name=tag_name):
+                with self.assertRaisesRegex(ValueError, error):
+                    get_tag_affixes(tag_name)
+
+
+class VersionIndexTest(TestCase):
+    def test_latest(self):
+        parser = PEP440Parser()
+        versions = ["1.10", "1.2", "invalid", "2.0rc1", "1.9.1", "0.1"]
+
+        index = VersionIndex.from_versions(parser, versions)
+
+        self.assertEqual(len(index), 5)
+        self.assertEqual(index.latest(), "2.0rc1")
+        self.assertEqual(index.latest(parser.key(parser("2.0rc1"))), "1.10")
+        self.assertEqual(index.latest(parser.key(parser("1.10"))), "1.9.1")
+        self.assertEqual(index.latest(parser.key(parser("1.3"))), "1.2")
+        self.assertIsNone(index.latest(parser.key(parser("0.1"))))
+
+    def test_empty(self):
+        index = VersionIndex.from_versions(SemVerParser(), ["invalid"])
+
+        self.assertIsNone(index.latest())
+        self.assertIsNone(index.latest((1, 0, 0, (1,))))
+
+    def test_entries(self):
+        parser = SemVerParser()
+        index = VersionIndex.from_versions(parser, ["1.0.0", "1.0.0-rc.1"])
+
+        restored = VersionIndex(index.entries)
+
+        self.assertEqual(restored.entries, index.entries)
+        self.assertEqual(restored.latest(parser.key(parser("1.0.0"))), "1.0.0-rc.1")
+
+
+class TagVersionsTest(GitRepoMixin, TestCase):
+    def setUp(self):
+        super().setUp()
+        self.cache_dir = TempDirectory()
+        environ = patch.dict(os.environ, {"BUMPVERSION_CACHE_DIR": self.cache_dir.path})
+        environ.start()
+        self.addCleanup(environ.stop)
+        for tag in ("v1.0.0", "v1.1.0", "v1.1.0-rc.1", "vinvalid", "a/v3.0.0", "v2.0"):
+            self.git("tag", tag)
+
+    def tearDown(self):
+        self.cache_dir.cleanup()
+        super().tearDown()
+
+    def test_get_index(self):
+        self.backdate_refs()
+        parser = SemVerParser()
+
+        index = TagVersions(Git()).get_index(parser, {"cls": "semver"}, "v", "")
+        other = TagVersions(Git()).get_index(parser, {"cls": "semver"}, "a/v", "")
+
+        self.assertEqual(index.latest(), "1.1.0")
+        self.assertEqual(other.latest(), "3.0.0")
+        self.assertEqual(len(os.listdir(os.path.join(self.cache_dir.path, "tags"))), 2)
+        with patch.object(Git, "get_tags") as get_tags_mock:
+            cached = TagVersions(Git()).get_index(parser, {"cls": "semver"}, "v", "")
+        get_tags_mock.assert_not_called()
+        self.assertEqual(cached.entries, index.entries)
+
+    def test_get_index_changed(self):
+        self.backdate_refs()
+        parser = SemVerParser()
+        TagVersions(Git()).get_index(parser, {"cls": "semver"}, "v", "")
+        self.git("tag", "v1.2.0")
+        self.backdate_refs()
+
+        index = TagVersions(Git()).get_index(parser, {"cls": "semver"}, "v", "")
+
+        self.assertEqual(index.latest(), "1.2.0")
+        # Entry of the previous tags is replaced.
+        self.assertEqual(len(os.listdir(os.path.join(self.cache_dir.path, "tags"))), 1)
+
+    def test_get_index_racy(self):
+        tag_versions = TagVersions(Git())
+
+        with patch.object(Git, "get_tags", wraps=tag_versions.vcs.get_tags) as get_tags_mock:
+            index = tag_versions.get_index(SemVerParser(), {}, "v", "")
+            other = tag_versions.get_index(SemVerParser(), {}, "a/v", "")
+
+        get_tags_mock.assert_called_once_with()
+        self.assertEqual(index.latest(), "1.1.0")
+        self.assertEqual(other.latest(), "3.0.0")
+        self.assertFalse(os.path.exists(os.path.join(self.cache_dir.path, "tags")))
@@ -0,0 +1,78 @@
+from typing import Any
+from unittest import TestCase
+
+from bumpversion.template import Template, compile_template, get_format_fields
+
+
+class GetFormatFieldsTest(TestCase):
+    def test_fields(self):
+        data: Any = (
+            ("", set()),
+            ("abc", set()),
+            ("{a}.{b}", {"a", "b"}),
+            ("{a}.{a}", {"a"}),
+            ("{a.real}-{b[0]}", {"a", "b"}),
+            ("{a!r:>{width}}", {"a", "width"}),
+            ("{0}.{}", {0, ""}),
+            ("{0[a.b]}.{1.c}", {0, 1}),
+        )
+        for format, fields in data:
+            with self.subTest(format=format):
+                self.assertEqual(get_format_fields(format), fields)
+
+
+class TemplateTest(TestCase):
+    def test_fields(self):
+        self.assertEqual(Template("{a}.{b[0]}").fields, {"a", "b"})
+
+    def test_format(self):
+        data: Any = (
+            ("", {}, ""),
+            ("abc", {"a": "A"}, "abc"),
+            ("{a}.{b}", {"a": "B", "b": "A", "c": "C"}, "B.A"),
+            ("{a!r:>{width}}", {"a": "B", "width": 4}, " 'B'"),
+        )
+        for format, kwargs, output in data:
+            with self.subTest(format=format, kwargs=kwargs):
+                self.assertEqual(Template(format).format(**kwargs), output)
+
+    def test_format_missing(self):
+        with self.assertRaises(KeyError):
+            Template("{a}.{b}").format(a="A")
+
+    def test_format_strict(self):
+        data: Any = (
+            ("", {}, ""),
+            ("abc", {}, "abc"),
+            ("{a}", {"a": "B"}, "B"),
+            ("{a}.{b}", {"a": "B", "b": "A"}, "B.A"),
+        )
+        for format, kwargs, output in data:
+            with self.subTest(format=format, kwargs=kwargs):
+                self.assertEqual(Template(format).format_strict(**kwargs), output)
+
+    def test_format_strict_too_many(self):
+        data: Any = (
+            ("", {"a": "A"}),
+            ("{a}.{b}", {"a": "B", "b": "A", "c": "C"}),
+        )
+        for format, kwargs in data:
+            with self.subTest(format=format, kwargs=kwargs):
+                with self.assertRaisesRegex(TypeError, "Too many arguments for format"):
+                    Template(format).format_strict(**kwargs)
+
+    def test_format_strict_missing(self):
+        with self.assertRaises(KeyError):
+            Template("{a}.{b}").format_strict(a="A")
+
+    def test_repr(self):
+        self.assertEqual(repr(Template("{a}")), "Template('{a}')")
+
+
+class CompileTemplateTest(TestCase):
+    def test_cache(self):
+        template = compile_template("{a}.{b}")
+
+        self.assertIsInstance(template, Template)
+        self.assertEqual(template.format_string, "{a}.{b}")
+        self.assertIs(compile_template("{a}.{b}"), template)
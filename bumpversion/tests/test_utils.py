@@ -1,8 +1,21 @@
+import os
+from pathlib import Path
+from typing import Any, Dict, Tuple
 from unittest import TestCase
-from unittest.mock import sentinel
+from unittest.mock import patch, sentinel
+
+from testfixtures import TempDirectory
 
 from bumpversion.settings import CONFIG_FILES
-from bumpversion.utils import import_path, load_instance
+from bumpversion.utils import (
+    InstancePool,
+    PathTrie,
+    get_cache_dir,
+    get_git_dir,
+    import_path,
+    load_instance,
+    write_cache,
+)
 
 
 class ImportPathTest(TestCase):
@@ -85,3 +98,163 @@ class LoadInstanceTest(TestCase):
             with self.subTest(kwargs=kwargs):
                 with self.assertRaises(TypeError):
                     load_instance("bumpversion.tests.test_utils.TestClass", **kwargs)
+
+
+class GetGitDirTest(TestCase):
+    def setUp(self):
+        self.tmp_dir = TempDirectory()
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def test_git_dir(self):
+        self.tmp_dir.makedir(".git")
+        subdir = self.tmp_dir.makedir("sub/dir")
+
+        git_dir = Path(self.tmp_dir.path, ".git")
+        self.assertEqual(get_git_dir(Path(self.tmp_dir.path)), git_dir)
+        self.assertEqual(get_git_dir(Path(subdir)), git_dir)
+
+    def test_git_file(self):
+        self.tmp_dir.write("worktree/.git", "gitdir: ../main/.git/worktrees/wt\n")
+
+        self.assertEqual(
+            get_git_dir(self.tmp_dir.as_path("worktree")),
+            self.tmp_dir.as_path("worktree/../main/.git/worktrees/wt"),
+        )
+
+    def test_not_found(self):
+        self.tmp_dir.write("invalid/.git", "invalid")
+
+        with patch.object(Path, "parents", ()):
+            self.assertIsNone(get_git_dir(self.tmp_dir.as_path("invalid")))
+
+    def test_cwd(self):
+        self.assertEqual(get_git_dir(), get_git_dir(Path(os.getcwd())))
+
+
+class GetCacheDirTest(TestCase):
+    def test_env(self):
+        with patch.dict(os.environ, {"BUMPVERSION_CACHE_DIR": "/cache"}):
+            self.assertEqual(get_cache_dir(), Path("/cache"))
+
+    def test_git_dir(self):
+        with patch.dict(os.environ, {"BUMPVERSION_CACHE_DIR": ""}):
+            with patch("bumpversion.utils.get_git_dir", return_value=Path("/repo/.git")):
+                self.assertEqual(get_cache_dir(), Path("/repo/.git/bumpversion"))
+
+    def test_no_git_dir(self):
+        with patch.dict(os.environ, {"BUMPVERSION_CACHE_DIR": ""}):
+            with patch("bumpversion.utils.get_git_dir", return_value=None):
+                self.assertIsNone(get_cache_dir())
+
+
+class WriteCacheTest(TestCase):
+    def setUp(self):
+        self.tmp_dir = TempDirectory()
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def test_write(self):
+        path = self.tmp_dir.as_path("cache/entry.json")
+
+        write_cache(path, "first")
+        write_cache(path, "second")
+
+        self.assertEqual(path.read_text(), "second")
+        self.assertEqual(os.listdir(path.parent), ["entry.json"])
+
+    def test_replace_error(self):
+        path = self.tmp_dir.as_path("cache/entry.json")
+
+        with patch("bumpversion.utils.os.replace", side_effect=OSError):
+            write_cache(path, "content")
+
+        self.assertEqual(os.listdir(path.parent), [])
+
+    def test_not_writable(self):
+        self.tmp_dir.write("cache", "")
+
+        write_cache(self.tmp_dir.as_path("cache/entry.json"), "content")
+
+        self.assertEqual(self.tmp_dir.read("cache", encoding="utf-8"), "")
+
+
+class InstancePoolTest(TestCase):
+    def test_shared(self):
+        pool = InstancePool()
+
+        obj = pool.get("bumpversion.tests.test_utils.TestClass", keyword={"a": [1, 2]})
+        same = pool.get("bumpversion.tests.test_utils.TestClass", keyword={"a": [1, 2]})
+
+        self.assertIsInstance(obj, TestClass)
+        self.assertIs(same, obj)
+        self.assertEqual((pool.hits, pool.misses), (1, 1))
+
+    def test_different(self):
+        pool = InstancePool()
+        data: Tuple[Dict[str, Any], ...] = (
+            # kwargs
+            {},
+            {"keyword": 1},
+            {"keyword": [1]},
+            {"keyword": (1,)},
+            {"keyword": {"a": 1}},
+            {"keyword": [("a", 1)]},
+            {"another": 1},
+        )
+
+        instances = [
+            pool.get("bumpversion.tests.test_utils.TestClass", **kwargs) for kwargs in data
+        ]
+
+        self.assertEqual(len({id(obj) for obj in instances}), len(data))
+        self.assertEqual((pool.hits, pool.misses), (0, len(data)))
+
+    def test_unhashable(self):
+        pool = InstancePool()
+
+        obj = pool.get("bumpversion.tests.test_utils.TestClass", keyword=bytearray())
+        other = pool.get("bumpversion.tests.test_utils.TestClass", keyword=bytearray())
+
+        self.assertIsInstance(obj, TestClass)
+        self.assertIsNot(obj, other)
+        self.assertEqual((pool.hits, pool.misses), (0, 2))
+
+    def test_invalid_path(self):
+        pool = InstancePool()
+
+        with self.assertRaisesRegex(ImportError, "does not have a class or attribute"):
+            pool.get("bumpversion.tests.test_utils.InvalidTestCase")
+        self.assertEqual((pool.hits, pool.misses), (0, 0))
+
+
+class PathTrieTest(TestCase):
+    def test_find(self):
+        trie = PathTrie()
+        trie.add("packages/a", sentinel.a)
+        trie.add("packages/a/nested", sentinel.nested)
+        trie.add("./b/", sentinel.b)
+        data = (
+            # path, value
+            ("packages/a/file.txt", sentinel.a),
+            ("packages/a", sentinel.a),
+            ("packages/a/nested/file.txt", sentinel.nested),
+            ("packages/a/other/file.txt", sentinel.a),
+            ("packages/ab/file.txt", None),
+            ("packages/file.txt", None),
+            ("b/c/file.txt", sentinel.b),
+            ("file.txt", None),
+        )
+        for path, value in data:
+            with self.subTest(path=path):
+                self.assertEqual(trie.find(path), value)
+
+    def test_root(self):
+        trie = PathTrie()
+        trie.add(".", sentinel.root)
+        trie.add("a", sentinel.a)
+
+        self.assertEqual(trie.find("file.txt"), sentinel.root)
+        self.assertEqual(trie.find("a/file.txt"), sentinel.a)
@@ -0,0 +1,376 @@
+import os
+import subprocess
+from pathlib import Path
+from typing import Generator, Iterator, cast
+from unittest import TestCase
+from unittest.mock import patch
+
+from bumpversion.vcs import Git, NativeGit, get_vcs
+
+from .utils import GitRepoMixin
+
+
+class GitTest(GitRepoMixin, TestCase):
+    def test_is_available(self):
+        self.assertTrue(Git.is_available())
+
+    def test_get_dirty_files(self):
+        self.tmp_dir.write("other.txt", "1.0\n")
+        self.tmp_dir.write("renamed.txt", "1.0\n")
+        self.git("add", "other.txt", "renamed.txt")
+        self.git("commit", "--quiet", "--message", "Other")
+        self.tmp_dir.write("file.txt", "1.1\n")
+        self.tmp_dir.write("other.txt", "1.1\n")
+        self.git("mv", "renamed.txt", "new name.txt")
+        self.tmp_dir.write("untracked.txt", "1.1\n")
+
+        self.assertEqual(
+            sorted(Git().get_dirty_files()), ["file.txt", "new name.txt", "other.txt"]
+        )
+
+    def test_get_dirty_files_paths(self):
+        self.tmp_dir.write("other.txt", "1.0\n")
+        self.git("add", "other.txt")
+        self.git("commit", "--quiet", "--message", "Other")
+        self.tmp_dir.write("file.txt", "1.1\n")
+        self.tmp_dir.write("other.txt", "1.1\n")
+        self.tmp_dir.write("untracked.txt", "1.1\n")
+
+        git = Git()
+        self.assertEqual(list(git.get_dirty_files([Path("file.txt")])), ["file.txt"])
+        self.assertEqual(list(git.get_dirty_files([Path("untracked.txt")])), [])
+        self.assertEqual(list(git.get_dirty_files([Path("*.txt")])), [])
+        self.assertEqual(list(git.get_dirty_files([])), [])
+
+    def test_get_dirty_files_many_paths(self):
+        self.tmp_dir.write("file.txt", "1.1\n")
+        self.tmp_dir.write("other.txt", "1.1\n")
+        self.git("add", "other.txt")
+        paths = [Path(f"missing{i}.txt") for i in range(10)] + [Path("file.txt")] * 2
+        paths.append(Path("other.txt"))
+
+        with patch("bumpversion.vcs._MAX_PATHSPECS_LENGTH", 40):
+            with patch("bumpversion.vcs.subprocess.run", wraps=subprocess.run) as run_mock:
+                dirty_files = list(Git().get_dirty_files(paths))
+
+        self.assertEqual(dirty_files, ["file.txt", "other.txt"])
+        self.assertGreater(run_mock.call_count, 1)
+
+    def test_add_files(self):
+        self.tmp_dir.write("file.txt", "1.1\n")
+        self.tmp_dir.write("other file.txt", "1.1\n")
+        self.tmp_dir.write("ignored.txt", "1.1\n")
+
+        Git().add_files([Path("file.txt"), Path("other file.txt")])
+
+        self.assertEqual(
+            self.git("diff", "--cached", "--name-only").splitlines(),
+            ["file.txt", "other file.txt"],
+        )
+
+    def test_add_files_literal(self):
+        self.tmp_dir.write("[ab].txt", "1.0\n")
+        self.tmp_dir.write("a.txt", "1.0\n")
+        self.git("add", "[ab].txt", "a.txt")
+        self.git("commit", "--quiet", "--message", "Other")
+        self.tmp_dir.write("[ab].txt", "1.1\n")
+        self.tmp_dir.write("a.txt", "1.1\n")
+
+        Git().add_files([Path("[ab].txt")])
+
+        self.assertEqual(self.git("diff", "--cached", "--name-only"), "[ab].txt")
+
+    def test_add_files_empty(self):
+        Git().add_files([])
+
+        self.assertEqual(self.git("diff", "--cached", "--name-only"), "")
+
+    def test_commit(self):
+        self.tmp_dir.write("file.txt", "1.1\n")
+        git = Git()
+        git.add_files([Path("file.txt")])
+
+        git.commit("Bump", extra_args=[])
+
+        self.assertEqual(self.git("log", "--format=%s"), "Bump\nInitial")
+
+    def test_tag(self):
+        Git().tag("v1.0", message="Version 1.0", sign_tags=False)
+
+        self.assertEqual(self.git("tag", "--list", "--format=%(subject)"), "Version 1.0")
+
+    def test_tags(self):
+        Git().tags([("a/v1.0", "Package A"), ("b/v2.0", "Package B\n")], sign_tags=False)
+
+        self.assertEqual(
+            self.git("tag", "--list", "--format=%(refname:strip=2) %(objecttype) %(subject)"),
+            "a/v1.0 tag Package A\nb/v2.0 tag Package B",
+        )
+        self.assertEqual(self.git("rev-parse", "a/v1.0^{commit}"), self.git("rev-parse", "HEAD"))
+        tagger = self.git("cat-file", "-p", "a/v1.0").splitlines()[3]
+        self.assertTrue(tagger.startswith("tagger Tester <tester@example.com> "))
+
+    def test_tags_atomic(self):
+        self.git("tag", "b/v2.0")
+
+        with self.assertRaises(subprocess.CalledProcessError):
+            Git().tags([("a/v1.0", "Package A"), ("b/v2.0", "Package B")], sign_tags=False)
+
+        self.assertEqual(self.git("tag", "--list"), "b/v2.0")
+
+    def test_resolve(self):
+        head = self.git("rev-parse", "HEAD")
+        git = Git()
+
+        self.assertEqual(git.resolve("HEAD"), head)
+        self.assertIsNone(git.resolve("unknown"))
+
+    def test_resolve_session(self):
+        head = self.git("rev-parse", "HEAD")
+        tree = self.git("rev-parse", "HEAD^{tree}")
+
+        with Git() as git:
+            self.assertEqual(git.resolve("HEAD"), head)
+            self.assertIsNone(git.resolve("unknown"))
+            self.assertEqual(git.resolve("HEAD^{tree}"), tree)
+            batch = cast(subprocess.Popen, git._batch)
+
+        self.assertIsNotNone(batch.returncode)
+        self.assertIsNone(git._batch)
+
+    def test_get_changed_files(self):
+        self.git("tag", "base")
+        self.tmp_dir.write("sub/new.txt", "new\n")
+        self.git("add", "sub/new.txt")
+        self.git("mv", "file.txt", "sub/moved.txt")
+        self.git("commit", "--quiet", "--message", "Change")
+        self.tmp_dir.write("sub/uncommited.txt", "new\n")
+        git = Git()
+
+        self.assertEqual(
+            git.get_changed_files("refs/tags/base"), ["file.txt", "sub/moved.txt", "sub/new.txt"]
+        )
+        self.assertEqual(git.get_changed_files("HEAD"), [])
+        self.assertIsNone(git.get_changed_files("refs/tags/unknown"))
+        os.chdir("sub")
+        self.assertEqual(git.get_changed_files("refs/tags/base"), ["moved.txt", "new.txt"])
+
+    def test_get_tags(self):
+        self.git("tag", "v1.0")
+        self.git("tag", "nested/v2.0", "--message", "Nested")
+
+        self.assertEqual(Git().get_tags(), ["nested/v2.0", "v1.0"])
+
+    def test_get_tags_state(self):
+        self.git("tag", "v1.0")
+        git = Git()
+
+        self.assertIsNone(git.get_tags_state())
+        self.backdate_refs()
+        state = git.get_tags_state()
+        self.assertIsNotNone(state)
+        self.git("tag", "v2.0")
+        self.backdate_refs()
+        self.assertNotEqual(git.get_tags_state(), state)
+
+    def test_get_tagged_commits(self):
+        head = self.git("rev-parse", "HEAD")
+        self.git("tag", "v1.0")
+        self.git("tag", "v2.0", "--message", "Annotated")
+
+        self.assertEqual(Git().get_tagged_commits(), [("v1.0", head), ("v2.0", head)])
+
+    def test_iter_first_parents(self):
+        initial = self.git("rev-parse", "HEAD")
+        self.git("checkout", "--quiet", "-b", "feature")
+        self.git("commit", "--quiet", "--allow-empty", "--message", "Feature")
+        feature = self.git("rev-parse", "HEAD")
+        self.git("checkout", "--quiet", "-")
+        self.git("merge", "--quiet", "--no-ff", "--message", "Merge", "feature")
+        merge = self.git("rev-parse", "HEAD")
+
+        self.assertEqual(
+            list(Git().iter_first_parents(["HEAD"])), [(merge, initial), (initial, None)]
+        )
+        self.assertEqual(
+            list(Git().iter_first_parents([feature])), [(feature, initial), (initial, None)]
+        )
+
+    def test_iter_first_parents_close(self):
+        self.git("commit", "--quiet", "--allow-empty", "--message", "Second")
+        walker = Git().iter_first_parents(["HEAD"])
+
+        next(walker)
+        walker.close()
+
+    def test_iter_first_parents_invalid(self):
+        with self.assertRaises(subprocess.CalledProcessError):
+            list(Git().iter_first_parents(["unknown"]))
+
+    def test_iter_commit_messages(self):
+        self.git("tag", "v1.0")
+        self.tmp_dir.write("sub/file.txt", "1.1\n")
+        self.git("add", "sub/file.txt")
+        self.git("commit", "--quiet", "--message", "feat: Add sub", "--message", "Body")
+        self.git("commit", "--quiet", "--allow-empty", "--message", "fix: Fix")
+        git = Git()
+
+        self.assertEqual(
+            list(cast(Iterator[str], git.iter_commit_messages("refs/tags/v1.0"))),
+            ["fix: Fix\n", "feat: Add sub\n\nBody\n"],
+        )
+        self.assertEqual(
+            list(cast(Iterator[str], git.iter_commit_messages("refs/tags/v1.0", ["sub"]))),
+            ["feat: Add sub\n\nBody\n"],
+        )
+        self.assertEqual(len(list(cast(Iterator[str], git.iter_commit_messages()))), 3)
+        self.assertIsNone(git.iter_commit_messages("refs/tags/unknown"))
+
+    def test_iter_commit_messages_close(self):
+        self.git("commit", "--quiet", "--allow-empty", "--message", "Second")
+        messages = cast(Generator[str, None, None], Git().iter_commit_messages())
+
+        self.assertEqual(next(messages), "Second\n")
+        messages.close()
+
+    def test_tags_session(self):
+        with Git() as git:
+            git.tags([("a/v1.0", "Package A"), ("b/v2.0", "Package B")], sign_tags=False)
+
+        self.assertEqual(self.git("rev-parse", "a/v1.0^{commit}"), self.git("rev-parse", "HEAD"))
+
+    def test_tags_encoding(self):
+        def ascii_open(*args, **kwargs):
+            # Simulate a C locale, where the default encoding is ASCII.
+            return open(*args, **{"encoding": "ascii", **kwargs})
+
+        with patch("bumpversion.vcs.open", side_effect=ascii_open, create=True):
+            Git().tags([("a/v1.0", "Package A → 1.0"), ("b/v2.0", "Package B")], sign_tags=False)
+
+        self.assertEqual(
+            subprocess.run(
+                ["git", "tag", "--list", "--format=%(subject)", "a/v1.0"],
+                check=True,
+                capture_output=True,
+            ).stdout.decode("utf-8"),
+            "Package A → 1.0\n",
+        )
+
+    def test_tags_single(self):
+        Git().tags([("v1.0", "Version 1.0")], sign_tags=False)
+
+        self.assertEqual(self.git("tag", "--list", "--format=%(subject)"), "Version 1.0")
+
+
+class NativeGitTest(GitRepoMixin, TestCase):
+    def test_is_available(self):
+        with patch("bumpversion.vcs.subprocess.run") as run_mock:
+            self.assertTrue(NativeGit.is_available())
+
+        run_mock.assert_not_called()
+
+    def test_get_dirty_files_clean(self):
+        with patch("bumpversion.vcs.subprocess.run") as run_mock:
+            self.assertEqual(list(NativeGit().get_dirty_files([Path("file.txt")])), [])
+
+        run_mock.assert_not_called()
+
+    def test_get_dirty_files_paths(self):
+        self.tmp_dir.write("other.txt", "1.0\n")
+        self.git("add", "other.txt")
+        self.git("commit", "--quiet", "--message", "Other")
+        self.tmp_dir.write("file.txt", "1.1\n")
+        self.tmp_dir.write("untracked.txt", "1.1\n")
+
+        git = NativeGit()
+        self.assertEqual(list(git.get_dirty_files([Path("file.txt")])), ["file.txt"])
+        self.assertEqual(list(git.get_dirty_files([Path("other.txt")])), [])
+        self.assertEqual(list(git.get_dirty_files([Path("untracked.txt")])), [])
+        self.assertEqual(list(git.get_dirty_files([])), [])
+
+    def test_get_dirty_files_unsupported(self):
+        self.git("update-index", "--split-index")
+        self.tmp_dir.write("file.txt", "1.1\n")
+
+        self.assertEqual(list(NativeGit().get_dirty_files([Path("file.txt")])), ["file.txt"])
+
+    def test_get_dirty_files_repo(self):
+        self.tmp_dir.write("file.txt", "1.1\n")
+
+        self.assertEqual(list(NativeGit().get_dirty_files()), ["file.txt"])
+
+    def test_commit_and_tag(self):
+        self.tmp_dir.write("file.txt", "1.1\n")
+        git = NativeGit()
+
+        with patch("bumpversion.vcs.subprocess.run") as run_mock:
+            git.add_files([Path("file.txt")])
+            git.commit("Bump", extra_args=[])
+            git.tag("v1.1", message="Version 1.1", sign_tags=False)
+
+        run_mock.assert_not_called()
+        self.assertEqual(self.git("log", "--format=%s"), "Bump\nInitial")
+        self.assertEqual(self.git("status", "--porcelain"), "")
+        self.assertEqual(self.git("tag", "--list", "--format=%(subject)"), "Version 1.1")
+        self.assertEqual(self.git("rev-parse", "v1.1^{commit}"), self.git("rev-parse", "HEAD"))
+
+    def test_commit_hooks(self):
+        self.tmp_dir.write(".git/hooks/commit-msg", "#!/bin/sh\necho Hooked >> $1\n")
+        os.chmod(".git/hooks/commit-msg", 0o755)
+        self.tmp_dir.write("file.txt", "1.1\n")
+        git = NativeGit()
+        git.add_files([Path("file.txt")])
+
+        git.commit("Bump", extra_args=[])
+
+        self.assertEqual(self.git("log", "--format=%B", "-1"), "Bump\nHooked")
+
+    def test_commit_extra_args(self):
+        self.tmp_dir.write("file.txt", "1.1\n")
+        git = NativeGit()
+        git.add_files([Path("file.txt")])
+
+        git.commit("Bump", extra_args=["--signoff"])
+
+        self.assertEqual(
+            self.git("log", "--format=%B", "-1"),
+            "Bump\n\nSigned-off-by: Tester <tester@example.com>",
+        )
+
+    def test_session(self):
+        self.tmp_dir.write("file.txt", "1.1\n")
+
+        with NativeGit() as git:
+            repository = git._get_repository()
+            self.assertIs(git._get_repository(), repository)
+            git.add_files([Path("file.txt")])
+            git.commit("Bump", extra_args=[])
+
+        self.assertIsNone(git._repository)
+        self.assertEqual(self.git("log", "--format=%s"), "Bump\nInitial")
+
+    def test_tags(self):
+        with patch("bumpversion.vcs.subprocess.run") as run_mock:
+            NativeGit().tags([("a/v1.0", "Package A"), ("b/v2.0", "Package B")], sign_tags=False)
+
+        run_mock.assert_not_called()
+        self.assertEqual(
+            self.git("tag", "--list", "--format=%(refname:strip=2) %(subject)"),
+            "a/v1.0 Package A\nb/v2.0 Package B",
+        )
+
+    def test_tags_existing(self):
+        self.git("tag", "b/v2.0")
+
+        with self.assertRaises(subprocess.CalledProcessError):
+            NativeGit().tags([("a/v1.0", "Package A"), ("b/v2.0", "Package B")], sign_tags=False)
+
+        self.assertEqual(self.git("tag", "--list"), "b/v2.0")
+
+
+class GetVcsTest(GitRepoMixin, TestCase):
+    def test_default(self):
+        self.assertIsInstance(get_vcs(), Git)
+
+    def test_cls(self):
+        self.assertIsInstance(get_vcs("bumpversion.NativeGit"), NativeGit)
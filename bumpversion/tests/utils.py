@@ -1,4 +1,6 @@
 import os
+import subprocess
+import time
 import traceback
 from pathlib import Path
 from typing import Optional, Sequence, cast
@@ -7,6 +9,7 @@ from unittest.mock import ANY
 
 from click import BaseCommand
 from click.testing import CliRunner, Result
+from testfixtures import TempDirectory
 
 
 class CommandMixin:
@@ -65,3 +68,39 @@ class CommandMixin:
         cast(TestCase, self).assertNotEqual(result.exit_code, 0)
         cast(TestCase, self).assertEqual(result.stdout, stdout)
         cast(TestCase, self).assertIn(stderr, result.stderr)
+
+
+class GitRepoMixin:
+    """Mixin which creates a temporary git repository and runs the test inside of it."""
+
+    def setUp(self):
+        self.tmp_dir = TempDirectory()
+        self.cwd = os.getcwd()
+        os.chdir(self.tmp_dir.path)
+        self.git("init", "--quiet")
+        self.git("config", "user.name", "Tester")
+        self.git("config", "user.email", "tester@example.com")
+        self.git("config", "commit.gpgsign", "false")
+        self.tmp_dir.write("file.txt", "1.0\n")
+        self.git("add", "file.txt")
+        self.git("commit", "--quiet", "--message", "Initial")
+
+    def tearDown(self):
+        os.chdir(self.cwd)
+        self.tmp_dir.cleanup()
+
+    def git(self, *args: str) -> str:
+        """Run git command in the repository and return its output."""
+        return subprocess.run(
+            ["git", *args], check=True, capture_output=True, text=True
+        ).stdout.strip()
+
+    def backdate_refs(self) -> None:
+        """Set modification time of refs in the past, so they are not considered racy."""
+        mtime = time.time() - 10
+        paths = [os.path.join(".git", "packed-refs")]
+        for directory, _, _ in os.walk(os.path.join(".git", "refs")):
+            paths.append(directory)
+        for path in paths:
+            if os.path.exists(path):
+                os.utime(path, (mtime, mtime))
@@ -1,6 +1,13 @@
 """Various utility functions."""
+import os
+import threading
+from contextlib import suppress
 from importlib import import_module
-from typing import Any
+from pathlib import Path
+from tempfile import NamedTemporaryFile
+from typing import Any, Dict, Hashable, List, Optional, Tuple, cast
+
+CACHE_DIR_ENV = "BUMPVERSION_CACHE_DIR"
 
 
 def import_path(path: str) -> Any:
@@ -31,3 +38,139 @@ def load_instance(_path: str, /, **kwargs: Any) -> Any:
     """Return instance of class specified by a dotted path and keyword arguments."""
     cls = import_path(_path)
     return cls(**kwargs)
+
+
+def _freeze(value: Any) -> Hashable:
+    """Return hashable representation of a value from component configuration."""
+    if isinstance(value, dict):
+        return (dict, tuple(sorted((key, _freeze(item)) for key, item in value.items())))
+    if isinstance(value, (list, tuple)):
+        return (type(value), tuple(_freeze(item) for item in value))
+    return cast(Hashable, value)
+
+
+class InstancePool:
+    """Pool of instances shared by components with the same configuration.
+
+    Instances are keyed by the dotted path and keyword arguments, so components with identical
+    configuration are created only once. Pool is thread-safe.
+
+    Attributes:
+        hits: Number of requests served by existing instance.
+        misses: Number of instances created.
+    """
+
+    def __init__(self) -> None:
+        self.hits = 0
+        self.misses = 0
+        self._instances: Dict[Tuple[str, Hashable], Any] = {}
+        self._lock = threading.Lock()
+
+    def get(self, _path: str, /, **kwargs: Any) -> Any:
+        """Return instance of class specified by a dotted path and keyword arguments."""
+        try:
+            key = (_path, _freeze(kwargs))
+            hash(key)
+        except TypeError:
+            # Unhashable arguments, instance can't be shared.
+            with self._lock:
+                self.misses += 1
+            return load_instance(_path, **kwargs)
+
+        with self._lock:
+            if key in self._instances:
+                self.hits += 1
+                return self._instances[key]
+            instance = load_instance(_path, **kwargs)
+            self.misses += 1
+            self._instances[key] = instance
+            return instance
+
+
+class PathTrie:
+    """Trie of path prefixes.
+
+    Paths are mapped to the value of their longest prefix added to the trie
+    in the number of steps given by the depth of the path.
+    """
+
+    # Key of a value in a node, path components are never empty.
+    _VALUE = ""
+
+    def __init__(self) -> None:
+        self._root: Dict[str, Any] = {}
+
+    @staticmethod
+    def _split(path: str) -> List[str]:
+        return [part for part in os.path.normpath(path).split(os.sep) if part != os.curdir]
+
+    def add(self, prefix: str, value: Any) -> None:
+        """Add a path prefix with a value."""
+        node = self._root
+        for part in self._split(prefix):
+            node = node.setdefault(part, {})
+        node[self._VALUE] = value
+
+    def find(self, path: str) -> Any:
+        """Return value of the longest prefix of the path or None if there is no prefix."""
+        node = self._root
+        value = node.get(self._VALUE)
+        for part in self._split(path):
+            try:
+                node = node[part]
+            except KeyError:
+                break
+            value = node.get(self._VALUE, value)
+        return value
+
+
+def get_git_dir(path: Optional[Path] = None) -> Optional[Path]:
+    """Return git directory of repository containing `path` or None if not found.
+
+    Working directory is used if `path` is not defined.
+    """
+    path = Path(path or os.getcwd()).absolute()
+    for directory in (path, *path.parents):
+        dot_git = directory / ".git"
+        if dot_git.is_dir():
+            return dot_git
+        if dot_git.is_file():
+            # Worktrees and submodules use file with a link to the actual git directory.
+            content = dot_git.read_text().strip()
+            if content.startswith("gitdir:"):
+                return directory / content[len("gitdir:") :].strip()
+    return None
+
+
+def get_cache_dir() -> Optional[Path]:
+    """Return directory for persistent caches or None if not available.
+
+    Directory is defined by `BUMPVERSION_CACHE_DIR` environment variable.
+    If not set, `bumpversion` directory in git directory is used.
+    """
+    if os.environ.get(CACHE_DIR_ENV):
+        return Path(os.environ[CACHE_DIR_ENV])
+    git_dir = get_git_dir()
+    if git_dir is None:
+        return None
+    return git_dir / "bumpversion"
+
+
+def write_cache(path: Path, content: str) -> None:
+    """Write content of a file in a persistent cache.
+
+    The file is replaced atomically, so readers never see a partially written content.
+    Caches are only an optimization, so the content is dropped if it can't be written.
+    """
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fh = NamedTemporaryFile("w", dir=path.parent, delete=False)
+    except OSError:
+        return
+    try:
+        with fh:
+            fh.write(content)
+        os.replace(fh.name, path)
+    except OSError:
+        with suppress(OSError):
+            os.unlink(fh.name)
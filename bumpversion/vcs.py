@@ -1,12 +1,76 @@
 """Version control system management."""
+import os
+import shutil
 import subprocess  # nosec
 from abc import ABC, abstractmethod
+from contextlib import closing
 from pathlib import Path
-from typing import Iterable, List, Optional
+from tempfile import TemporaryDirectory
+from types import TracebackType
+from typing import (
+    IO,
+    Any,
+    Generator,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    Type,
+    TypeVar,
+    cast,
+)
+
+from .gitrepo import Repository, UnsupportedRepositoryError
+from .utils import import_path
+
+_VcsT = TypeVar("_VcsT", bound="AbstractVcs")
+
+# Maximal length of pathspecs passed in arguments of a single command, fits even on Windows.
+_MAX_PATHSPECS_LENGTH = 30000
+
+
+def _chunk_pathspecs(pathspecs: Iterable[str]) -> Iterator[List[str]]:
+    """Split pathspecs into chunks short enough to be passed as command arguments."""
+    chunk: List[str] = []
+    length = 0
+    for pathspec in pathspecs:
+        if chunk and length + len(pathspec) + 1 > _MAX_PATHSPECS_LENGTH:
+            yield chunk
+            chunk = []
+            length = 0
+        chunk.append(pathspec)
+        length += len(pathspec) + 1
+    if chunk:
+        yield chunk
 
 
 class AbstractVcs(ABC):
-    """Base version control system manager."""
+    """Base version control system manager.
+
+    Manager can be used as a context manager, which opens a session for the run of bumpversion.
+    Managers may keep long-lived resources in the session, e.g. a pipe to a command server,
+    to avoid their start-up costs in each method call. Resources are released once the context
+    is exited.
+    """
+
+    def __enter__(self: _VcsT) -> _VcsT:
+        self.open()
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc_value: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        self.close()
+
+    def open(self) -> None:
+        """Open a session."""
+
+    def close(self) -> None:
+        """Close the session and release its resources."""
 
     @classmethod
     @abstractmethod
@@ -14,13 +78,84 @@ class AbstractVcs(ABC):
         """Return whether version control system is available."""
 
     @abstractmethod
-    def get_dirty_files(self) -> Iterable[str]:
-        """Generate list of modified files."""
+    def get_dirty_files(self, paths: Optional[Iterable[Path]] = None) -> Iterable[str]:
+        """Generate list of modified files.
+
+        Arguments:
+            paths: Check only these paths. Whole repository is checked if not defined.
+        """
+
+    def get_changed_files(self, revision: str) -> Optional[List[str]]:
+        """Return files changed between the revision and HEAD or None if revision doesn't exist.
+
+        Paths are relative to the working directory, only files in it are returned.
+
+        Raises:
+            NotImplementedError: If the version control system doesn't support it.
+        """
+        raise NotImplementedError(f"{type(self).__name__} can't detect changed files.")
+
+    def get_tags(self) -> List[str]:
+        """Return names of all tags.
+
+        Raises:
+            NotImplementedError: If the version control system doesn't support it.
+        """
+        raise NotImplementedError(f"{type(self).__name__} can't list tags.")
+
+    def get_tags_state(self) -> Optional[Any]:
+        """Return JSON serializable state which changes whenever tags change.
+
+        None is returned if the state can't be determined.
+        """
+        return None
+
+    def get_tagged_commits(self) -> List[Tuple[str, str]]:
+        """Return pairs of tag name and the commit it points to.
+
+        Raises:
+            NotImplementedError: If the version control system doesn't support it.
+        """
+        raise NotImplementedError(f"{type(self).__name__} can't list tagged commits.")
+
+    def iter_first_parents(
+        self, revisions: Iterable[str]
+    ) -> Generator[Tuple[str, Optional[str]], None, None]:
+        """Generate pairs of commit and its first parent reachable from the revisions.
+
+        Only first parents are followed, i.e. commits on merged branches aren't generated.
+        Generator may be closed before it's exhausted.
+
+        Raises:
+            NotImplementedError: If the version control system doesn't support it.
+        """
+        raise NotImplementedError(f"{type(self).__name__} can't walk the history.")
+
+    def iter_commit_messages(
+        self, revision: Optional[str] = None, paths: Optional[Iterable[str]] = None
+    ) -> Optional[Iterator[str]]:
+        """Return iterator of messages of commits since the revision.
+
+        None is returned if the revision doesn't exist.
+
+        Arguments:
+            revision: Revision of the last release. All commits are returned if not defined.
+            paths: Return only commits which change the paths.
+
+        Raises:
+            NotImplementedError: If the version control system doesn't support it.
+        """
+        raise NotImplementedError(f"{type(self).__name__} can't list commits.")
 
     @abstractmethod
     def add_file(self, path: Path) -> None:
         """Add file to a version control."""
 
+    def add_files(self, paths: Iterable[Path]) -> None:
+        """Add files to a version control."""
+        for path in paths:
+            self.add_file(path)
+
     @abstractmethod
     def commit(self, message: str, *, extra_args: List[str]) -> None:
         """Make a commit."""
@@ -29,9 +164,39 @@ class AbstractVcs(ABC):
     def tag(self, tag: str, *, message: str, sign_tags: bool) -> None:
         """Make a tag."""
 
+    def tags(self, tags: Iterable[Tuple[str, str]], *, sign_tags: bool) -> None:
+        """Make several tags.
+
+        Arguments:
+            tags: Pairs of tag name and tag message.
+            sign_tags: Whether to sign the tags.
+        """
+        for tag, message in tags:
+            self.tag(tag, message=message, sign_tags=sign_tags)
+
 
 class Git(AbstractVcs):
-    """Git manager."""
+    """Git manager.
+
+    Within a session, revisions are resolved using a single `git cat-file --batch-check` process.
+    Other commands still run a git process for each call.
+    """
+
+    def __init__(self) -> None:
+        self._in_session = False
+        self._batch: Optional[subprocess.Popen] = None
+
+    def open(self) -> None:
+        """Open a session."""
+        self._in_session = True
+
+    def close(self) -> None:
+        """Close the session and release its resources."""
+        self._in_session = False
+        if self._batch is not None:
+            cast(IO[str], self._batch.stdin).close()
+            self._batch.wait()
+            self._batch = None
 
     @classmethod
     def is_available(cls) -> bool:
@@ -44,24 +209,139 @@ class Git(AbstractVcs):
             return False
         return True
 
-    def get_dirty_files(self) -> Iterable[str]:
-        """Generate list of modified files."""
-        result = subprocess.run(
-            ["git", "status", "--porcelain"],
-            check=True,
-            capture_output=True,
-            text=True,
-        )  # nosec
-        for line in result.stdout.splitlines():
-            status = line[:2]
-            filename = line[3:].strip()
-            if status != b"??":
-                yield filename
+    def get_dirty_files(self, paths: Optional[Iterable[Path]] = None) -> Iterable[str]:
+        """Generate list of modified files.
+
+        Untracked files are ignored.
+        """
+        cmd = ["git", "--literal-pathspecs", "status", "--porcelain", "-z", "--untracked-files=no"]
+        if paths is None:
+            commands = [cmd]
+        else:
+            # git status can't read pathspecs from a file, split them to avoid too long commands.
+            pathspecs = _chunk_pathspecs(os.fspath(p) for p in paths)
+            commands = [cmd + ["--", *chunk] for chunk in pathspecs]
+        reported = set()
+        for command in commands:
+            result = subprocess.run(command, check=True, capture_output=True, text=True)  # nosec
+            entries = iter(result.stdout.split("\0"))
+            for entry in entries:
+                if not entry:
+                    continue
+                status, path = entry[:2], entry[3:]
+                if path not in reported:
+                    reported.add(path)
+                    yield path
+                if "R" in status or "C" in status:
+                    # Renames and copies are followed by the original path.
+                    next(entries)
+
+    def get_changed_files(self, revision: str) -> Optional[List[str]]:
+        """Return files changed between the revision and HEAD or None if revision doesn't exist.
+
+        Renames are reported as both the deleted and the added file.
+        """
+        if self.resolve(revision) is None:
+            return None
+        output = self._run(
+            "diff", "--name-only", "-z", "--no-renames", "--relative", revision, "HEAD", "--"
+        )
+        return [path for path in output.split("\0") if path]
+
+    def get_tags(self) -> List[str]:
+        """Return names of all tags using a single git process."""
+        return self._run("for-each-ref", "--format=%(refname:strip=2)", "refs/tags").splitlines()
+
+    def get_tagged_commits(self) -> List[Tuple[str, str]]:
+        """Return pairs of tag name and the commit it points to using a single git process."""
+        output = self._run(
+            "for-each-ref", "--format=%(refname:strip=2) %(objectname) %(*objectname)", "refs/tags"
+        )
+        tagged = []
+        for line in output.splitlines():
+            # Annotated tags are followed by the object they point to.
+            tag, objectname, peeled = line.rsplit(" ", 2)
+            tagged.append((tag, peeled or objectname))
+        return tagged
+
+    def iter_first_parents(
+        self, revisions: Iterable[str]
+    ) -> Generator[Tuple[str, Optional[str]], None, None]:
+        """Generate pairs of commit and its first parent reachable from the revisions.
+
+        The history is streamed from a single `git rev-list` process, which is terminated
+        if the generator is closed before it's exhausted.
+        """
+        with closing(
+            self._stream("rev-list", "--first-parent", "--parents", *revisions, "--")
+        ) as lines:
+            for line in lines:
+                commit, *parents = line.split()
+                yield commit, parents[0] if parents else None
+
+    def iter_commit_messages(
+        self, revision: Optional[str] = None, paths: Optional[Iterable[str]] = None
+    ) -> Optional[Generator[str, None, None]]:
+        """Return generator of messages of commits since the revision.
+
+        The log is streamed from a single `git log` process, so messages aren't kept in memory.
+        """
+        if revision is None:
+            revision_range = "HEAD"
+        elif self.resolve(revision) is None:
+            return None
+        else:
+            revision_range = f"{revision}..HEAD"
+        return self._iter_messages(revision_range, list(paths or ()))
+
+    def _iter_messages(self, revision_range: str, paths: List[str]) -> Generator[str, None, None]:
+        message: List[str] = []
+        with closing(
+            self._stream("log", "-z", "--format=%B", revision_range, "--", *paths)
+        ) as lines:
+            for line in lines:
+                # Messages are terminated by NUL, which can't be a part of a message.
+                *ends, rest = line.split("\0")
+                for end in ends:
+                    message.append(end)
+                    yield "".join(message)
+                    message = []
+                message.append(rest)
+
+    def get_tags_state(self) -> Optional[Any]:
+        """Return sizes and modification times of the files with tags in the repository.
+
+        None is returned if the repository isn't supported or tags were modified too recently.
+        """
+        repository = Repository.discover()
+        if repository is None:
+            return None
+        try:
+            return repository.get_refs_state("refs/tags")
+        except UnsupportedRepositoryError:
+            return None
 
     def add_file(self, path: Path) -> None:
         """Add file to a version control."""
         subprocess.run(["git", "add", path], check=True)  # nosec
 
+    def add_files(self, paths: Iterable[Path]) -> None:
+        """Add files to a version control using a single git process."""
+        pathspecs = "\0".join(os.fspath(p) for p in paths)
+        if pathspecs:
+            subprocess.run(
+                [
+                    "git",
+                    "--literal-pathspecs",
+                    "add",
+                    "--pathspec-from-file=-",
+                    "--pathspec-file-nul",
+                ],
+                input=pathspecs,
+                check=True,
+                text=True,
+            )  # nosec
+
     def commit(self, message: str, *, extra_args: List[str]) -> None:
         """Make a commit."""
         subprocess.run(["git", "commit", "--message", message] + extra_args, check=True)  # nosec
@@ -73,10 +353,202 @@ class Git(AbstractVcs):
             cmd += ["--sign"]
         subprocess.run(cmd, check=True)  # nosec
 
+    def _stream(self, *args: str) -> Generator[str, None, None]:
+        """Generate lines of git command output as they are produced.
+
+        The process is killed if the generator is closed before it's exhausted.
+        """
+        process = subprocess.Popen(["git", *args], stdout=subprocess.PIPE, text=True)  # nosec
+        finished = False
+        try:
+            yield from cast(IO[str], process.stdout)
+            finished = True
+        finally:
+            if not finished:
+                process.kill()
+            cast(IO[str], process.stdout).close()
+            returncode = process.wait()
+        if returncode:
+            raise subprocess.CalledProcessError(returncode, process.args)
+
+    def _run(self, *args: str, input: Optional[str] = None) -> str:
+        """Run git command and return its output."""
+        result = subprocess.run(
+            ["git", *args], input=input, check=True, capture_output=True, text=True
+        )  # nosec
+        return result.stdout
+
+    def resolve(self, revision: str) -> Optional[str]:
+        """Return object name of the revision or None if it doesn't exist."""
+        if not self._in_session:
+            try:
+                return self._run("rev-parse", "--verify", "--quiet", revision).strip()
+            except subprocess.CalledProcessError:
+                return None
+
+        if self._batch is None:
+            self._batch = subprocess.Popen(
+                ["git", "cat-file", "--batch-check"],
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE,
+                text=True,
+            )  # nosec
+        stdin, stdout = cast(IO[str], self._batch.stdin), cast(IO[str], self._batch.stdout)
+        stdin.write(revision + "\n")
+        stdin.flush()
+        # Response is either `<object> <type> <size>` or `<revision> missing`.
+        response = stdout.readline().rstrip("\n")
+        if response.endswith((" missing", " ambiguous")):
+            return None
+        return response.split(" ")[0]
+
+    def tags(self, tags: Iterable[Tuple[str, str]], *, sign_tags: bool) -> None:
+        """Make several tags.
+
+        Unsigned tags are created using a constant number of git processes.
+        Tag objects are written at once and all the tag references are created
+        in a single transaction, so either all or none of the tags are created.
+        """
+        tags = list(tags)
+        if sign_tags or len(tags) < 2:
+            super().tags(tags, sign_tags=sign_tags)
+            return
+
+        head = self.resolve("HEAD^{commit}")
+        if head is None:
+            raise RuntimeError("There is no commit to tag.")
+        tagger = self._run("var", "GIT_COMMITTER_IDENT").strip()
+        with TemporaryDirectory() as tmp_dir:
+            paths = []
+            for index, (tag, message) in enumerate(tags):
+                path = os.path.join(tmp_dir, str(index))
+                with open(path, "w", encoding="utf-8") as fh:
+                    fh.write(
+                        f"object {head}\ntype commit\ntag {tag}\ntagger {tagger}\n\n"
+                        + message.rstrip("\n")
+                        + "\n"
+                    )
+                paths.append(path)
+            objects = self._run(
+                "hash-object", "-t", "tag", "-w", "--stdin-paths", input="\n".join(paths) + "\n"
+            ).split()
+        self._run(
+            "update-ref",
+            "--stdin",
+            input="".join(f"create refs/tags/{t} {o}\n" for (t, _), o in zip(tags, objects)),
+        )
+
+
+class NativeGit(Git):
+    """Git manager which reads and writes the repository files directly where possible.
+
+    Dirty files are detected from the git index. Files are added to the index, commits and tags
+    are written as loose objects and references are updated without running git, unless any
+    hooks or signing are configured.
+
+    The git command is used as a fallback if the repository uses a feature which isn't supported,
+    e.g. a split index, a sparse checkout or git attributes, or if the result can't be decided
+    from the index.
+
+    .. code-block:: toml
+
+       [bumpversion.vcs]
+       cls = "bumpversion.NativeGit"
+    """
+
+    @classmethod
+    def is_available(cls) -> bool:
+        """Return whether version control system is available."""
+        return Repository.discover() is not None and shutil.which("git") is not None
+
+    def __init__(self) -> None:
+        super().__init__()
+        self._repository: Optional[Repository] = None
+
+    def close(self) -> None:
+        """Close the session and release its resources."""
+        super().close()
+        self._repository = None
+
+    def _get_repository(self) -> Repository:
+        """Return the repository, which is kept for the whole session."""
+        repository = self._repository or Repository.discover()
+        if repository is None:
+            raise UnsupportedRepositoryError("Repository not found")
+        if self._in_session:
+            self._repository = repository
+        return repository
+
+    def get_dirty_files(self, paths: Optional[Iterable[Path]] = None) -> Iterable[str]:
+        """Generate list of modified files.
+
+        Untracked files are ignored.
+        """
+        if paths is not None:
+            paths = list(paths)
+            try:
+                return list(self._get_repository().get_dirty_files(paths))
+            except UnsupportedRepositoryError:
+                pass
+        return super().get_dirty_files(paths)
+
+    def add_files(self, paths: Iterable[Path]) -> None:
+        """Add files to a version control."""
+        paths = list(paths)
+        if not paths:
+            return
+        try:
+            self._get_repository().add_files(paths)
+        except UnsupportedRepositoryError:
+            super().add_files(paths)
+
+    def commit(self, message: str, *, extra_args: List[str]) -> None:
+        """Make a commit."""
+        if not extra_args:
+            try:
+                self._get_repository().commit(message)
+                return
+            except UnsupportedRepositoryError:
+                pass
+        super().commit(message, extra_args=extra_args)
+
+    def tag(self, tag: str, *, message: str, sign_tags: bool) -> None:
+        """Make a tag."""
+        if not sign_tags:
+            try:
+                self._get_repository().tags([(tag, message)])
+                return
+            except UnsupportedRepositoryError:
+                pass
+        super().tag(tag, message=message, sign_tags=sign_tags)
+
+    def tags(self, tags: Iterable[Tuple[str, str]], *, sign_tags: bool) -> None:
+        """Make several tags.
+
+        Unsigned tags are created in a single transaction, so either all or none of the tags
+        are created.
+        """
+        tags = list(tags)
+        if not sign_tags:
+            try:
+                self._get_repository().tags(tags)
+                return
+            except UnsupportedRepositoryError:
+                pass
+        super().tags(tags, sign_tags=sign_tags)
+
+
+def get_vcs(cls: Optional[str] = None, **kwargs: Any) -> Optional[AbstractVcs]:
+    """Return version control system manager to be used or None if none found.
 
-def get_vcs() -> Optional[AbstractVcs]:
-    """Return version control system manager to be used or None if none found."""
-    for cls in (Git,):
-        if cls.is_available():
-            return cls()
+    Arguments:
+        cls: Dotted path to version control system manager. Detected if not defined.
+        kwargs: Arguments for the version control system manager.
+    """
+    if cls is not None:
+        vcs_cls = import_path(cls)
+        return vcs_cls(**kwargs) if vcs_cls.is_available() else None
+    for vcs_cls in (Git,):
+        if vcs_cls.is_available():
+            return vcs_cls()
     return None